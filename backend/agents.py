@@ -1,38 +1,316 @@
 import sqlite3
+import asyncio
 import json
 import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 DB_NAME = "orchestrate.db"
 
-def get_db_connection():
-    """Helper to get DB connection"""
+# Connections kept open per pool (one per concurrently running query)
+POOL_SIZE = int(os.getenv("AGENTS_POOL_SIZE", "4"))
+
+# Serve agent reads from an in-memory copy of the database (refresh() to resync)
+USE_MEMORY_REPLICA = os.getenv("AGENTS_MEMORY_REPLICA", "False").lower() == "true"
+
+# Read-tuned pragmas applied to every connection
+PRAGMAS = {
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,  # map up to 256 MiB of the file
+    "cache_size": -64 * 1024,  # 64 MiB page cache (negative = KiB)
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms to wait on a locked database
+}
+
+# Prepared statements kept per connection (keyed by SQL text)
+STATEMENT_CACHE_SIZE = 128
+
+
+def _configure(conn):
+    """Apply row factory and pragmas to a new connection"""
+    conn.row_factory = sqlite3.Row # Allow accessing columns by name
+    for pragma, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma}={value}")
+    return conn
+
+def get_db_connection(db_path=DB_NAME):
+    """Helper to get a standalone DB connection (WAL mode, tuned pragmas)"""
     try:
-        conn = sqlite3.connect(DB_NAME)
-        conn.row_factory = sqlite3.Row # Allow accessing columns by name
-        return conn
+        conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return _configure(conn)
     except Exception as e:
         print(f"Database connection error: {e}")
         return None
 
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent SQLite connections
+
+    Connections are opened lazily (up to `size`), switched to WAL so readers
+    never block each other or a writer, and keep their prepared statements
+    cached between queries. With memory_replica=True the database is copied
+    into a shared in-memory database once and all connections read from that
+    copy; call refresh() to pick up later writes (a new copy is built and
+    swapped in, so readers never see a half-written one).
+    """
+
+    def __init__(self, db_path=DB_NAME, size=POOL_SIZE, memory_replica=False):
+        self.db_path = db_path
+        self.size = size
+        self.memory_replica = memory_replica
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._replica_uri = None
+        self._replica_keeper = None
+        self._generation = 0
+        self._generations = {}
+        self._tables = None
+        if memory_replica:
+            self.refresh()
+
+    def refresh(self):
+        """Copy the database file into a fresh in-memory replica and move readers onto it"""
+        if not self.memory_replica:
+            return
+        # The in-memory database lives as long as one connection to it is open
+        uri = f"file:replica-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(self.db_path)
+        try:
+            source.execute("PRAGMA journal_mode=WAL")
+            source.backup(keeper)
+        except Exception:
+            keeper.close()
+            raise
+        finally:
+            source.close()
+        with self._lock:
+            previous = self._replica_keeper
+            self._replica_uri, self._replica_keeper = uri, keeper
+            self._generation += 1
+            self._tables = None
+        # Idle readers switch now; borrowed ones when they are returned
+        idle = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for conn in idle:
+            self._release(conn)
+        if previous is not None:
+            previous.close()
+
+    def has_table(self, name):
+        """Whether the database has a table (names are re-read when the schema changes)"""
+        with self.connection() as conn:
+            version = conn.execute("PRAGMA schema_version").fetchone()[0]
+            tables = self._tables
+            if tables is None or tables[0] != version:
+                rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                tables = self._tables = (version, {row[0] for row in rows})
+        return name in tables[1]
+
+    def _connect(self):
+        if self.memory_replica:
+            with self._lock:
+                uri, generation = self._replica_uri, self._generation
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+            conn.execute("PRAGMA query_only=ON")
+            self._generations[conn] = generation
+            return _configure(conn)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return _configure(conn)
+
+    def _current(self, conn):
+        """The connection itself, or a new one if it still reads a replaced replica"""
+        if self._generations.get(conn, self._generation) == self._generation:
+            return conn
+        self._generations.pop(conn, None)
+        conn.close()
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def _release(self, conn):
+        """Put a connection back in the idle queue (onto the current replica)"""
+        try:
+            conn = self._current(conn)
+        except Exception:
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; it is rolled back if the block fails and always returned"""
+        try:
+            conn = self._current(self._idle.get_nowait())
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._current(self._idle.get())
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._release(conn)
+
+    def close(self):
+        """Close idle connections (and drop the replica)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._generations.pop(conn, None)
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+        if self._replica_keeper is not None:
+            self._replica_keeper.close()
+            self._replica_keeper = None
+
+_pools = {}
+_pools_lock = threading.Lock()
+_executor = None
+_current = threading.local()
+
+def get_pool(db_path=DB_NAME, memory_replica=False):
+    """Shared connection pool for a database (one per path and replica setting)"""
+    key = (os.path.abspath(db_path), memory_replica)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(db_path, memory_replica=memory_replica)
+        return _pools[key]
+
+def get_executor():
+    """Bounded worker pool for async agent calls (one worker per pooled connection)"""
+    global _executor
+    with _pools_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="agent-query")
+        return _executor
+
+def shutdown_executor():
+    """Stop the async worker pool (waits for running queries)"""
+    global _executor
+    with _pools_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+class QueryCancelled(Exception):
+    pass
+
+class AgentCall:
+    """
+    One agent method call running on the executor
+
+    Records (sql, seconds, rows) for every query the call runs and the total
+    wall time. cancel() stops the call: queries not yet started raise
+    QueryCancelled and the running one is interrupted inside SQLite.
+    """
+
+    def __init__(self, agent, method):
+        self.agent = agent
+        self.method = method
+        self.queries = []
+        self.seconds = None
+        self.cancelled = False
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def attach(self, conn):
+        with self._lock:
+            if self.cancelled:
+                raise QueryCancelled(f"{self.agent}.{self.method} cancelled")
+            self._conn = conn
+
+    def detach(self):
+        with self._lock:
+            self._conn = None
+
+    def record(self, query, seconds, rows):
+        self.queries.append((" ".join(query.split()), seconds, None if rows is None else len(rows)))
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            if self._conn is not None:
+                self._conn.interrupt()
+
 class BaseAgent:
+    # Read-heavy agents can opt into the in-memory replica
+    memory_replica = USE_MEMORY_REPLICA
+    db_path = DB_NAME
+
     def __init__(self):
         self.name = "Base Agent"
 
+    @property
+    def pool(self):
+        return get_pool(self.db_path, self.memory_replica)
+
+    def has_table(self, name):
+        """Whether the agent database has a table built by setup_database.py"""
+        try:
+            return self.pool.has_table(name)
+        except Exception:
+            return False
+
+    def name_filter(self, alias="employees"):
+        """
+        WHERE clause matching employee names containing a search term (one
+        '%term%' parameter): probes the trigram index employees_fts built by
+        setup_database.py, or scans employees on databases without it
+        """
+        if self.has_table("employees_fts"):
+            return f"{alias}.rowid IN (SELECT rowid FROM employees_fts WHERE name LIKE ?)"
+        return f"{alias}.name LIKE ?"
+
     def execute_query(self, query, params=()):
         """Execute a read-only query and return list of dicts"""
-        conn = get_db_connection()
-        if not conn:
-            return []
-        
+        call = getattr(_current, "call", None)
         try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
+            with self.pool.connection() as conn:
+                start = time.perf_counter()
+                if call is not None:
+                    call.attach(conn)
+                rows = None
+                try:
+                    rows = conn.execute(query, params).fetchall()
+                finally:
+                    if call is not None:
+                        call.detach()
+                        call.record(query, time.perf_counter() - start, rows)
             # Convert sqlite3.Row objects to dicts
             return [dict(row) for row in rows]
         except Exception as e:
-            print(f"Query Error in {self.name}: {e}")
+            if call is None or not call.cancelled:
+                print(f"Query Error in {self.name}: {e}")
             return []
 
 class HRAgent(BaseAgent):
@@ -44,7 +322,7 @@ class HRAgent(BaseAgent):
         query = "SELECT * FROM employees"
         params = ()
         if name:
-            query += " WHERE name LIKE ?"
+            query += f" WHERE {self.name_filter()} ORDER BY rowid"
             params = (f"%{name}%",)
         return self.execute_query(query, params)
 
@@ -57,18 +335,26 @@ class SalesAgent(BaseAgent):
         self.description = "Handles sales revenue, deals closed, and regional sales data."
 
     def get_sales_by_region(self):
+        # Trigger-maintained totals; scan sales on databases without them
+        if self.has_table("sales_region_summary"):
+            return self.execute_query("""
+                SELECT region,
+                       CASE WHEN revenue_count > 0 THEN revenue_sum END as total_revenue,
+                       CASE WHEN deals_closed_count > 0 THEN CAST(deals_closed_sum AS INTEGER) END as total_deals
+                FROM sales_region_summary ORDER BY region
+            """)
         return self.execute_query("""
             SELECT region, SUM(revenue) as total_revenue, SUM(deals_closed) as total_deals 
             FROM sales GROUP BY region
         """)
 
     def get_sales_by_employee(self, employee_name):
-        # Join with employees table to get name
-        return self.execute_query("""
+        # Find matching employees by name, then probe sales by employee_id
+        return self.execute_query(f"""
             SELECT e.name, SUM(s.revenue) as total_revenue, SUM(s.deals_closed) as total_deals
-            FROM sales s
-            JOIN employees e ON s.employee_id = e.id
-            WHERE e.name LIKE ?
+            FROM employees e
+            JOIN sales s ON s.employee_id = e.id
+            WHERE {self.name_filter("e")}
             GROUP BY e.name
         """, (f"%{employee_name}%",))
 
@@ -78,6 +364,13 @@ class CustomerServiceAgent(BaseAgent):
         self.description = "Handles support tickets, issue categories, and resolution times."
 
     def get_ticket_stats(self):
+        if self.has_table("ticket_status_summary"):
+            return self.execute_query("""
+                SELECT status, row_count as count,
+                       CASE WHEN resolution_time_hours_count > 0
+                            THEN resolution_time_hours_sum / resolution_time_hours_count END as avg_resolution_time
+                FROM ticket_status_summary ORDER BY status
+            """)
         return self.execute_query("""
             SELECT status, COUNT(*) as count, AVG(resolution_time_hours) as avg_resolution_time
             FROM tickets GROUP BY status
@@ -92,11 +385,69 @@ class FinanceAgent(BaseAgent):
         self.description = "Handles department expenses, budgets, and financial reporting."
 
     def get_department_expenses(self):
+        if self.has_table("finance_department_summary"):
+            return self.execute_query("""
+                SELECT department,
+                       CASE WHEN expense_amount_count > 0 THEN expense_amount_sum END as total_expense,
+                       CASE WHEN budget_limit_count > 0 THEN budget_limit_sum END as total_budget
+                FROM finance_department_summary ORDER BY department
+            """)
         return self.execute_query("""
             SELECT department, SUM(expense_amount) as total_expense, SUM(budget_limit) as total_budget
             FROM finance GROUP BY department
         """)
 
+class AsyncAgent:
+    """
+    Async facade over an agent: every public method becomes a coroutine that
+    runs on the bounded executor, so several agents' queries run concurrently
+    without blocking the event loop
+
+        hr = AsyncAgent(AGENTS["hr"], timeout=2.0)
+        employees = await hr.get_employee_details("Alice")
+
+    A call that times out or whose task is cancelled is interrupted in SQLite.
+    Finished calls (with per-query timings) are kept in `calls`.
+    """
+
+    def __init__(self, agent, timeout=None, history=100):
+        self.agent = agent
+        self.timeout = timeout
+        self.calls = deque(maxlen=history)
+
+    @property
+    def name(self):
+        return self.agent.name
+
+    def __getattr__(self, method):
+        target = getattr(self.agent, method)
+        if method.startswith("_") or not callable(target):
+            return target
+
+        async def run(*args, **kwargs):
+            call = AgentCall(self.agent.name, method)
+            future = asyncio.get_running_loop().run_in_executor(get_executor(), self._run, call, target, args, kwargs)
+            try:
+                return await asyncio.wait_for(future, self.timeout)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                call.cancel()
+                raise
+            finally:
+                self.calls.append(call)
+
+        run.__name__ = method
+        return run
+
+    @staticmethod
+    def _run(call, target, args, kwargs):
+        _current.call = call
+        start = time.perf_counter()
+        try:
+            return target(*args, **kwargs)
+        finally:
+            call.seconds = time.perf_counter() - start
+            _current.call = None
+
 # --- Registry of available agents ---
 AGENTS = {
     "hr": HRAgent(),
@@ -105,6 +456,9 @@ AGENTS = {
     "finance": FinanceAgent()
 }
 
+# Async facades for serving the agents from an event loop
+ASYNC_AGENTS = {key: AsyncAgent(agent) for key, agent in AGENTS.items()}
+
 def run_agent_test():
     """Simple test to verify agents work"""
     print("Testing Agents...")
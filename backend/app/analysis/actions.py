@@ -60,7 +60,7 @@ class ActionTrigger:
         approved_items = data.get("approved_invoices", []) or data.get("approved_items", [])
         for item in approved_items[:10]:  # Limit to 10
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="approve_invoice",
                     target=f"invoice: {item.get('id', 'unknown')}",
                     parameters={"invoice_id": item.get("id"), "amount": item.get("amount")},
@@ -78,7 +78,7 @@ class ActionTrigger:
         for item in high_risk_items[:5]:  # Limit to 5
             if isinstance(item, str):
                 actions.append(
-                    Action(
+                    Action.trusted(
                         action_type="send_alert",
                         target=f"department: {item}",
                         parameters={"department": item, "severity": "high"},
@@ -96,7 +96,7 @@ class ActionTrigger:
         for item in urgent_items[:5]:  # Limit to 5
             item_id = item.get("id") if isinstance(item, dict) else str(item)
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="assign_task",
                     target=f"item: {item_id}",
                     parameters={"item_id": item_id, "priority": "high"},
@@ -57,7 +57,7 @@ class InsightGenerator:
     ) -> Insight:
         """Generate cross-sector correlation insight"""
         # This can be enhanced with watsonx.ai
-        return Insight(
+        return Insight.trusted(
             title="Cross-Sector Correlation",
             description=f"Identified relationships between {', '.join([s.value for s in sectors])}",
             sector=Sector.CROSS_SECTOR,
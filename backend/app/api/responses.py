@@ -0,0 +1,160 @@
+"""
+Response serialization and compression
+Fast JSON encoding with negotiated gzip/brotli content encoding
+"""
+
+import gzip
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from app.data.dataset import Dataset
+from app.models.schemas import TrustedModel
+
+# Try to import orjson, fallback to the json module if not available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Try to import brotli, fallback to gzip only if not available
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the JSON encoders do not handle natively"""
+    if isinstance(obj, TrustedModel):
+        # Shallow: the encoder walks nested payloads itself, no intermediate copy
+        return obj.trusted_dump()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Dataset):
+        return obj.rows()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # numpy scalars and arrays (pandas-derived records)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the fast encoder (datetime/enum aware)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content encoding from an Accept-Encoding header
+
+    Prefers brotli when installed, then gzip. Codings with q=0 are refused.
+
+    Returns:
+        "br", "gzip" or None
+    """
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if HAS_BROTLI else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content encoding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def json_response(
+    request: Request,
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Build a JSON response, compressed when the client accepts it
+
+    Args:
+        request: Incoming request (for Accept-Encoding)
+        content: JSON-serializable content (models, datetimes and enums allowed)
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response with the encoded body
+    """
+    body = dumps(content)
+    headers = dict(headers or {})
+    headers["Vary"] = "Accept-Encoding"
+
+    if len(body) >= COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding:
+            raw_size = len(body)
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            logger.debug(f"Compressed response with {encoding}: {raw_size} -> {len(body)} bytes")
+
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
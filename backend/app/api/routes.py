@@ -2,23 +2,41 @@
 API routes for OrchestrateIQ
 """
 
+import hashlib
 import logging
 import time
-from fastapi import APIRouter, HTTPException, Depends, Request
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from pydantic import ValidationError
+from typing import List, Optional
 
 from app.models.schemas import (
     QueryRequest,
     QueryResponse,
     DashboardData,
+    DashboardBatch,
+    DashboardField,
     Sector,
-    HealthResponse
+    HealthResponse,
+    WorkflowContext,
+    get_type_adapter
 )
+from app.api.responses import FastJSONResponse, json_response
+from app.api.shaping import shape_response
+from app.data.snapshots import DASHBOARD_SECTORS
+from app.data.watcher import DEFAULT_POLL_INTERVAL
 from app.orchestrate.agent import OrchestrateAgent
+from app.utils.logger import lazy
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["orchestrateiq"])
+router = APIRouter(tags=["orchestrateiq"], default_response_class=FastJSONResponse)
+
+# Dashboards may be reused until the next snapshot refresh, then revalidated
+DASHBOARD_CACHE_CONTROL = f"private, max-age={int(DEFAULT_POLL_INTERVAL)}, must-revalidate"
+SECTORS_CACHE_CONTROL = "public, max-age=3600"
+
+SECTORS = [sector.value for sector in Sector]
+SECTORS_ETAG = '"sectors-' + hashlib.md5(",".join(SECTORS).encode()).hexdigest()[:16] + '"'
 
 
 def get_agent(request: Request) -> OrchestrateAgent:
@@ -29,9 +47,60 @@ def get_agent(request: Request) -> OrchestrateAgent:
     return agent
 
 
+def _parse_csv_enum(value: Optional[str], enum_cls: type, param: str) -> Optional[list]:
+    """Parse a comma-separated query parameter into enum members"""
+    if not value:
+        return None
+    items = [item.strip().lower() for item in value.split(",") if item.strip()]
+    try:
+        return get_type_adapter(List[enum_cls]).validate_python(items)
+    except ValidationError:
+        allowed = ", ".join(member.value for member in enum_cls)
+        raise HTTPException(status_code=400, detail=f"Invalid {param} '{value}'. Allowed: {allowed}")
+
+
+def _parse_context(context: Optional[dict]) -> dict:
+    """Validate the workflow options in a query context (unset options are dropped)"""
+    try:
+        return WorkflowContext.model_validate(context or {}).model_dump(exclude_none=True)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        )
+        raise HTTPException(status_code=400, detail=f"Invalid context: {problems}")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def _conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str
+) -> Optional[Response]:
+    """
+    Attach caching validators, short-circuiting when the client copy is current
+    
+    Returns:
+        A 304 Not Modified response, or None if the full body should be sent
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 @router.post("/query", response_model=QueryResponse)
 async def process_query(
     request: QueryRequest,
+    http_request: Request,
     agent: OrchestrateAgent = Depends(get_agent)
 ):
     """
@@ -42,25 +111,34 @@ async def process_query(
         agent: Orchestrate agent instance
     
     Returns:
-        QueryResponse with insights, actions, and data
+        QueryResponse with insights, actions, and data, shaped by the request's
+        detail/fields/page options (gzip/brotli encoded when large and accepted)
     """
     start_time = time.time()
     logger.info(f"📥 Received query: {request.query}")
-    logger.debug(f"Query details: sector={request.sector}, context={request.context}")
+    logger.debug("Query details: sector=%s, context=%s", request.sector, request.context)
+    context = _parse_context(request.context)
     
     try:
         # Process query through orchestrate agent
         response = await agent.process_query(
             query=request.query,
             sector=request.sector,
-            context=request.context or {}
+            context=context
         )
         
         execution_time = time.time() - start_time
         logger.info(f"✅ Query processed successfully in {execution_time:.2f}s")
-        logger.debug(f"Response: {response.dict()}")
+        logger.debug("Response: %s", lazy(response.dict))
         
-        return response
+        payload = shape_response(
+            response,
+            detail=request.detail,
+            fields=request.fields,
+            page=request.page,
+            page_size=request.page_size
+        )
+        return json_response(http_request, payload)
         
     except Exception as e:
         execution_time = time.time() - start_time
@@ -68,9 +146,53 @@ async def process_query(
         raise HTTPException(status_code=500, detail=f"Query processing failed: {str(e)}")
 
 
+@router.get("/dashboard", response_model=DashboardBatch, response_model_exclude_none=True)
+async def get_dashboard_batch(
+    request: Request,
+    response: Response,
+    sectors: Optional[str] = Query(None, description="Comma-separated sectors (default: all dashboard sectors)"),
+    fields: Optional[str] = Query(None, description="Comma-separated parts to include: metrics, trends, alerts"),
+    agent: OrchestrateAgent = Depends(get_agent)
+):
+    """
+    Get dashboard data for several sectors in one response
+    
+    Args:
+        sectors: Sectors to include, e.g. "hr,sales" (default: hr, sales, service, finance)
+        fields: Dashboard parts to include (default: all)
+        agent: Orchestrate agent instance
+    
+    Returns:
+        DashboardBatch with one entry per sector (304 if unchanged)
+    """
+    sector_list = _parse_csv_enum(sectors, Sector, "sectors") or DASHBOARD_SECTORS
+    field_list = _parse_csv_enum(fields, DashboardField, "fields")
+    logger.info(f"📊 Fetching dashboard batch for {len(sector_list)} sectors")
+    
+    try:
+        batch = await agent.get_dashboard_batch(sector_list, field_list)
+        
+        tags = [agent.get_dashboard_etag(d.sector, d.last_updated) for d in batch.dashboards]
+        tags.append(",".join(f.value for f in field_list or []))
+        etag = '"batch-' + hashlib.md5("|".join(tags).encode()).hexdigest()[:16] + '"'
+        not_modified = _conditional_response(request, response, etag, DASHBOARD_CACHE_CONTROL)
+        if not_modified:
+            logger.debug(f"Dashboard batch not modified ({etag})")
+            return not_modified
+        
+        logger.info(f"✅ Dashboard batch retrieved for {len(batch.dashboards)} sectors")
+        return batch
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to get dashboard batch: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to get dashboard data: {str(e)}")
+
+
 @router.get("/dashboard/{sector}", response_model=DashboardData)
 async def get_dashboard_data(
     sector: Sector,
+    request: Request,
+    response: Response,
     agent: OrchestrateAgent = Depends(get_agent)
 ):
     """
@@ -81,12 +203,19 @@ async def get_dashboard_data(
         agent: Orchestrate agent instance
     
     Returns:
-        DashboardData with metrics, trends, and alerts
+        DashboardData with metrics, trends, and alerts (304 if unchanged)
     """
     logger.info(f"📊 Fetching dashboard data for sector: {sector.value}")
     
     try:
         data = await agent.get_dashboard_data(sector)
+        
+        etag = agent.get_dashboard_etag(sector, data.last_updated)
+        not_modified = _conditional_response(request, response, etag, DASHBOARD_CACHE_CONTROL)
+        if not_modified:
+            logger.debug(f"Dashboard for {sector.value} not modified ({etag})")
+            return not_modified
+        
         logger.info(f"✅ Dashboard data retrieved for {sector.value}")
         return data
         
@@ -96,15 +225,18 @@ async def get_dashboard_data(
 
 
 @router.get("/sectors", response_model=List[str])
-async def get_sectors():
+async def get_sectors(request: Request, response: Response):
     """
     Get list of available sectors
     
     Returns:
-        List of sector names
+        List of sector names (304 if unchanged)
     """
     logger.debug("Fetching available sectors")
-    return [sector.value for sector in Sector]
+    not_modified = _conditional_response(request, response, SECTORS_ETAG, SECTORS_CACHE_CONTROL)
+    if not_modified:
+        return not_modified
+    return SECTORS
 
 
 @router.get("/health", response_model=HealthResponse)
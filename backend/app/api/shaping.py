@@ -0,0 +1,107 @@
+"""
+Response shaping
+Deduplicates shared payloads, selects fields and pages record lists
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.data.dataset import Dataset
+from app.models.schemas import QueryResponse, ResponseDetail
+
+logger = logging.getLogger(__name__)
+
+# Written in place of an insight's data when it is the response's top-level data
+DATA_REF = {"$ref": "#/data"}
+
+
+def _is_record_list(value: Any) -> bool:
+    """A non-empty list of row dicts (e.g. urgent_deals, blocking_tickets) or a Dataset"""
+    if isinstance(value, Dataset):
+        return bool(value)
+    return isinstance(value, list) and bool(value) and isinstance(value[0], dict)
+
+
+def _shape_data(
+    data: Dict[str, Any],
+    detail: ResponseDetail,
+    page: int,
+    page_size: int
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, int]]]:
+    """
+    Trim the record lists of an analysis payload
+
+    Returns:
+        (shaped data, pagination info per record list)
+    """
+    shaped = {}
+    pagination = {}
+    for key, value in data.items():
+        if not _is_record_list(value):
+            shaped[key] = value
+            continue
+        total = len(value)
+        if detail == ResponseDetail.SUMMARY:
+            pagination[key] = {"total": total}
+            continue
+        start = (page - 1) * page_size
+        # Slicing a Dataset materializes row dicts for this page only
+        shaped[key] = value[start:start + page_size]
+        pagination[key] = {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total + page_size - 1) // page_size
+        }
+    return shaped, pagination
+
+
+def shape_response(
+    response: QueryResponse,
+    detail: ResponseDetail = ResponseDetail.FULL,
+    fields: Optional[List[str]] = None,
+    page: int = 1,
+    page_size: int = 50
+) -> Dict[str, Any]:
+    """
+    Build the JSON payload for a query response
+
+    Insight data that is the same object as the top-level data is sent once
+    and referenced as {"$ref": "#/data"}. Record lists are paged (full) or
+    reduced to their totals (summary).
+
+    Args:
+        response: Query response from the agent
+        detail: summary or full
+        fields: Top-level fields to include (default: all)
+        page: Page of each record list
+        page_size: Records per page
+
+    Returns:
+        Payload ready for the JSON encoder
+    """
+    selected = set(fields) if fields else set(QueryResponse.model_fields)
+    payload = {name: value for name, value in response.trusted_dump().items() if name in selected}
+
+    shaped_data, pagination = _shape_data(response.data, detail, page, page_size)
+    if "data" in payload:
+        payload["data"] = shaped_data
+    if "pagination" in selected:
+        payload["pagination"] = pagination or None
+
+    if "insights" in payload:
+        insights = []
+        for insight in response.insights:
+            item = insight.trusted_dump()
+            if insight.data is response.data and "data" in payload:
+                item["data"] = DATA_REF
+            else:
+                item["data"], _ = _shape_data(insight.data, detail, page, page_size)
+            insights.append(item)
+        payload["insights"] = insights
+
+    logger.debug(
+        f"Shaped response: detail={detail.value}, fields={len(payload)}, "
+        f"record lists={list(pagination)}"
+    )
+    return payload
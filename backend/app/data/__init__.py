@@ -2,12 +2,70 @@
 Data handlers for different business sectors
 """
 
+import asyncio
+import logging
+from typing import Dict
+
 from app.models.schemas import Sector
 from app.data.hr_data import HRDataHandler
 from app.data.sales_data import SalesDataHandler
 from app.data.service_data import ServiceDataHandler
 from app.data.finance_data import FinanceDataHandler
 
+logger = logging.getLogger(__name__)
+
+HANDLER_CLASSES = {
+    Sector.HR: HRDataHandler,
+    Sector.SALES: SalesDataHandler,
+    Sector.SERVICE: ServiceDataHandler,
+    Sector.FINANCE: FinanceDataHandler
+}
+
+
+class HandlerRegistry:
+    """
+    Holds a single, long-lived data handler per sector
+
+    Handlers are created once and keep their warm state (cached datasets,
+    indexes, aggregates) between requests. That state follows the data
+    files through the data watcher (app.data.watcher).
+    """
+
+    def __init__(self):
+        """Initialize handler registry"""
+        self._handlers: Dict[Sector, object] = {}
+
+    def get(self, sector: Sector):
+        """
+        Get the handler for a sector, creating it on first use
+
+        Sectors without a dedicated handler (cross_sector) use the HR handler.
+        """
+        handler_sector = sector if sector in HANDLER_CLASSES else Sector.HR
+        handler = self._handlers.get(handler_sector)
+        if handler is None:
+            handler = self._handlers[handler_sector] = HANDLER_CLASSES[handler_sector]()
+            logger.debug(f"Created {type(handler).__name__}")
+        return handler
+
+    async def warm(self):
+        """Create every handler and load its state"""
+        logger.info("🔥 Warming data handlers...")
+        await asyncio.gather(*(self.get(sector).refresh() for sector in HANDLER_CLASSES))
+        logger.info(f"✅ {len(self._handlers)} data handlers ready")
+
+    async def refresh(self):
+        """Bring every created handler's state up to date"""
+        await asyncio.gather(*(handler.refresh() for handler in list(self._handlers.values())))
+
+
+_registry = HandlerRegistry()
+
+
+def get_handler_registry() -> HandlerRegistry:
+    """Get the process-wide handler registry"""
+    return _registry
+
 
 def get_data_handler(sector: Sector):
     """
@@ -17,14 +75,6 @@ def get_data_handler(sector: Sector):
         sector: Business sector
     
     Returns:
-        Data handler instance
+        Shared data handler instance
     """
-    handlers = {
-        Sector.HR: HRDataHandler(),
-        Sector.SALES: SalesDataHandler(),
-        Sector.SERVICE: ServiceDataHandler(),
-        Sector.FINANCE: FinanceDataHandler()
-    }
-    
-    return handlers.get(sector, HRDataHandler())
-
+    return _registry.get(sector)
@@ -0,0 +1,325 @@
+"""
+Incremental Aggregation Engine
+Maintains running counts, sums and group-bys over the sector CSV datasets
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from app.data.watcher import DataWatcher, FileChange, get_data_watcher
+
+logger = logging.getLogger(__name__)
+
+Extractor = Union[str, Callable[[Dict[str, Any]], Any]]
+
+
+def _extract(extractor: Extractor, record: Dict[str, Any]) -> Any:
+    """Read a column (by name) or a derived value (by callable) from a record"""
+    if callable(extractor):
+        return extractor(record)
+    return record.get(extractor)
+
+
+def lowered(column: str) -> Callable[[Dict[str, Any]], str]:
+    """Group key: a column's value, stripped and lower-cased"""
+    return lambda record: str(record.get(column) or "").strip().lower()
+
+
+def quarter_of(column: str) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Group key: the calendar quarter ("2025-Q3") of an ISO date column"""
+    def key(record: Dict[str, Any]) -> Optional[str]:
+        value = str(record.get(column) or "")
+        try:
+            return f"{value[:4]}-Q{(int(value[5:7]) - 1) // 3 + 1}"
+        except ValueError:
+            return None
+    return key
+
+
+class Aggregation:
+    """
+    Running count and sum of a value, optionally filtered and grouped
+
+    Args:
+        value: Column name or callable giving the summed value (None = count only)
+        group_by: Column name or callable giving the group key (None = single group)
+        where: Predicate selecting which records are aggregated
+    """
+
+    def __init__(
+        self,
+        value: Optional[Extractor] = None,
+        group_by: Optional[Extractor] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ):
+        self.value = value
+        self.group_by = group_by
+        self.where = where
+        # Published groups are never mutated: updates fold into a copy and
+        # swap it in, so readers on the loop see the old or the new totals
+        self._groups: Dict[Any, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _fold(self, groups: Dict[Any, List[float]], record: Dict[str, Any]):
+        if self.where is not None and not self.where(record):
+            return
+        amount = 0.0
+        if self.value is not None:
+            try:
+                amount = float(_extract(self.value, record))
+            except (TypeError, ValueError):
+                return
+        key = _extract(self.group_by, record) if self.group_by is not None else None
+        state = groups.get(key)
+        if state is None:
+            groups[key] = [1, amount]
+        else:
+            state[0] += 1
+            state[1] += amount
+
+    def add(self, record: Dict[str, Any]):
+        """Fold one record into the running totals"""
+        self.add_many([record])
+
+    def add_many(self, records: Iterable[Dict[str, Any]], reset: bool = False):
+        """Fold records into the running totals (starting from zero if reset) in one swap"""
+        with self._lock:
+            groups = {} if reset else {key: list(state) for key, state in self._groups.items()}
+            for record in records:
+                self._fold(groups, record)
+            self._groups = groups
+
+    def reset(self):
+        """Drop all running totals"""
+        with self._lock:
+            self._groups = {}
+
+    def count(self, key: Any = None) -> int:
+        """Number of aggregated records (in one group, or overall)"""
+        groups = self._groups
+        if self.group_by is not None and key is None:
+            return sum(state[0] for state in groups.values())
+        return groups.get(key, (0, 0.0))[0]
+
+    def total(self, key: Any = None) -> float:
+        """Sum of the value (in one group, or overall)"""
+        groups = self._groups
+        if self.group_by is not None and key is None:
+            return sum(state[1] for state in groups.values())
+        return groups.get(key, (0, 0.0))[1]
+
+    def mean(self, key: Any = None) -> float:
+        """Average of the value (in one group, or overall)"""
+        groups = self._groups
+        if self.group_by is not None and key is None:
+            count = sum(state[0] for state in groups.values())
+            total = sum(state[1] for state in groups.values())
+        else:
+            count, total = groups.get(key, (0, 0.0))
+        return total / count if count else 0.0
+
+    def groups(self) -> Dict[Any, Tuple[int, float]]:
+        """Group key -> (count, sum), in first-seen order"""
+        return {key: (state[0], state[1]) for key, state in self._groups.items()}
+
+
+class SortedIndex:
+    """
+    Records ordered by a numeric key, with prefix sums of the key
+
+    Counts and totals of records with key <= x are a binary search, so many
+    thresholds can be evaluated without rescanning. Appended records are
+    buffered and merged into the order on the next query.
+
+    Args:
+        key: Column name or callable giving the numeric sort key
+        where: Predicate selecting which records are indexed
+    """
+
+    def __init__(
+        self,
+        key: Extractor,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ):
+        self.key = key
+        self.where = where
+        # Refreshes fold rows in a worker thread while queries merge on the loop
+        self._lock = threading.Lock()
+        self.reset()
+
+    def _entry(self, record: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+        if self.where is not None and not self.where(record):
+            return None
+        try:
+            return float(_extract(self.key, record)), record
+        except (TypeError, ValueError):
+            return None
+
+    def add(self, record: Dict[str, Any]):
+        """Index one record (merged into the sort order lazily)"""
+        self.add_many([record])
+
+    def add_many(self, records: Iterable[Dict[str, Any]], reset: bool = False):
+        """Index records (replacing all indexed records if reset) in one step"""
+        entries = [entry for entry in map(self._entry, records) if entry is not None]
+        with self._lock:
+            if reset:
+                self._clear()
+            self._pending.extend(entries)
+
+    def reset(self):
+        """Drop all indexed records"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._entries: List[Tuple[float, Dict[str, Any]]] = []
+        self._pending: List[Tuple[float, Dict[str, Any]]] = []
+        self._keys: List[float] = []
+        self._prefix: List[float] = [0.0]
+
+    def _snapshot(self) -> Tuple[List[Tuple[float, Dict[str, Any]]], List[float], List[float]]:
+        """Consistent (entries, keys, prefix sums), merging appended records first"""
+        with self._lock:
+            if self._pending:
+                # Timsort merges the already-sorted run and the appended run in ~O(n)
+                entries = self._entries + self._pending
+                self._pending = []
+                entries.sort(key=itemgetter(0))
+                keys = [entry[0] for entry in entries]
+                self._entries, self._keys, self._prefix = entries, keys, [0.0, *accumulate(keys)]
+            return self._entries, self._keys, self._prefix
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) + len(self._pending)
+
+    def count_upto(self, limit: float) -> int:
+        """Number of records with key <= limit"""
+        _, keys, _ = self._snapshot()
+        return bisect.bisect_right(keys, limit)
+
+    def total_upto(self, limit: float) -> float:
+        """Sum of the keys of records with key <= limit"""
+        _, keys, prefix = self._snapshot()
+        return prefix[bisect.bisect_right(keys, limit)]
+
+    def records_upto(self, limit: float, max_records: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records with key <= limit, smallest key first"""
+        entries, keys, _ = self._snapshot()
+        end = bisect.bisect_right(keys, limit)
+        if max_records is not None:
+            end = min(end, max_records)
+        return [record for _, record in entries[:end]]
+
+    def sweep(self, limits: Sequence[float]) -> List[Tuple[float, int, float]]:
+        """(limit, count, total) of records with key <= limit, for each limit"""
+        _, keys, prefix = self._snapshot()
+        results = []
+        for limit in limits:
+            end = bisect.bisect_right(keys, limit)
+            results.append((limit, end, prefix[end]))
+        return results
+
+
+class AggregationEngine:
+    """
+    Keeps aggregations over sector datasets up to date incrementally
+
+    Datasets are named by their path relative to the data directory
+    (e.g. "hr/employee_data.csv"). The engine subscribes to the data watcher:
+    appended rows are folded into the running totals and a rewritten file
+    resets and rescans that dataset.
+    """
+
+    def __init__(self, watcher: Optional[DataWatcher] = None):
+        """Initialize aggregation engine"""
+        self.watcher = watcher or get_data_watcher()
+        self._aggregations: Dict[str, Dict[str, Union[Aggregation, SortedIndex]]] = {}
+        self._backfill: Set[str] = set()
+        self._lock = threading.Lock()
+        self.watcher.subscribe(self._on_change)
+        logger.info("🔧 AggregationEngine created")
+
+    def register(self, dataset: str, name: str, kind: type = Aggregation, **spec):
+        """
+        Register an aggregation on a dataset (idempotent)
+
+        Args:
+            dataset: Dataset path relative to the data directory
+            name: Aggregation name, unique per dataset
+            kind: Aggregation class (Aggregation or SortedIndex)
+            **spec: Arguments for the class (value, group_by, where / key, where)
+
+        Returns:
+            The registered aggregation
+        """
+        with self._lock:
+            aggregations = self._aggregations.setdefault(dataset, {})
+            if name not in aggregations:
+                aggregations[name] = kind(**spec)
+                # Rows already consumed are replayed into it on next refresh
+                if self.watcher.consumed(dataset):
+                    self._backfill.add(dataset)
+                logger.debug(f"Registered aggregation {dataset}:{name}")
+            return aggregations[name]
+
+    def get(self, dataset: str, name: str) -> Union[Aggregation, SortedIndex]:
+        """Get a registered aggregation"""
+        return self._aggregations[dataset][name]
+
+    def add_records(self, dataset: str, records: Iterable[Dict[str, Any]], reset: bool = False):
+        """
+        Fold new records into every aggregation of a dataset
+
+        Each aggregation swaps in its new state in one step, so concurrent
+        readers never see a half-applied batch (or an emptied rescan).
+        """
+        aggregations = list(self._aggregations.get(dataset, {}).values())
+        records = list(records)
+        for aggregation in aggregations:
+            aggregation.add_many(records, reset=reset)
+        if records:
+            logger.debug(f"Aggregated {len(records)} new rows into {dataset}")
+
+    def _on_change(self, change: FileChange):
+        """Watcher listener: fold appended rows, or rescan a rewritten file"""
+        with self._lock:
+            if change.dataset not in self._aggregations:
+                return
+            if change.rewritten:
+                logger.info(f"🔄 Rescanning aggregations of {change.dataset}")
+            self.add_records(change.dataset, change.records, reset=change.rewritten)
+
+    async def refresh(self, datasets: Optional[Iterable[str]] = None):
+        """
+        Bring aggregations up to date with the files on disk
+
+        Args:
+            datasets: Datasets to refresh (default: all registered)
+        """
+        names = list(datasets) if datasets is not None else list(self._aggregations)
+        await asyncio.to_thread(self._refresh_sync, names)
+
+    def _refresh_sync(self, datasets: List[str]):
+        self.watcher.poll(datasets)
+        for dataset in datasets:
+            if dataset in self._backfill:
+                self._backfill.discard(dataset)
+                self.watcher.replay(dataset, self._on_change)
+
+
+_engine: Optional[AggregationEngine] = None
+
+
+def get_aggregation_engine() -> AggregationEngine:
+    """Get the process-wide aggregation engine"""
+    global _engine
+    if _engine is None:
+        _engine = AggregationEngine()
+    return _engine
@@ -0,0 +1,618 @@
+"""
+Columnar Dataset
+Compact, typed in-memory tables handed from the digital skills to the handlers
+"""
+
+import logging
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Try to import numpy/pandas, fallback to plain Python lists if not available
+try:
+    import numpy as np
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+logger = logging.getLogger(__name__)
+
+# Text columns with at least this share of distinct values are packed into
+# one UTF-8 buffer; repetitive ones keep shared str objects
+PACK_MIN_UNIQUE_RATIO = 0.5
+
+
+class PackedStrings:
+    """
+    Immutable string column stored as one UTF-8 buffer plus offsets
+
+    A high-cardinality column (ids, subjects) costs its encoded length plus
+    4 bytes per value instead of a pointer and a full str object per value.
+    Missing values (None/NaN) are kept as None.
+    """
+
+    def __init__(self, values: Iterable[Any]):
+        encoded = []
+        missing = []
+        for value in values:
+            if value is None or value != value:  # None or NaN
+                encoded.append(b"")
+                missing.append(len(encoded) - 1)
+            else:
+                encoded.append(str(value).encode("utf-8"))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        self.offsets = offsets.astype(np.int32) if offsets[-1] < 2 ** 31 else offsets
+        self.buffer = b"".join(encoded)
+        self.missing = frozenset(missing)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _get(self, position: int) -> Optional[str]:
+        if position in self.missing:
+            return None
+        return self.buffer[self.offsets[position]:self.offsets[position + 1]].decode("utf-8")
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        if position < 0:
+            position += len(self)
+        return self._get(position)
+
+    def take_list(self, positions: Iterable[int]) -> List[Optional[str]]:
+        """Decoded values at the given positions"""
+        return [self._get(int(position)) for position in positions]
+
+    def tolist(self) -> List[Optional[str]]:
+        """All values, decoded"""
+        buffer, offsets = self.buffer, self.offsets.tolist()
+        values = [buffer[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+        for position in self.missing:
+            values[position] = None
+        return values
+
+    def concat(self, values: Iterable[Any]) -> "PackedStrings":
+        """New column with values appended (the existing buffer is copied once, not re-encoded)"""
+        tail = values if isinstance(values, PackedStrings) else PackedStrings(values)
+        combined = PackedStrings(())
+        combined.buffer = self.buffer + tail.buffer
+        offsets = np.concatenate([self.offsets.astype(np.int64), tail.offsets[1:].astype(np.int64) + int(self.offsets[-1])])
+        combined.offsets = offsets.astype(np.int32) if offsets[-1] < 2 ** 31 else offsets
+        combined.missing = self.missing | {position + len(self) for position in tail.missing}
+        return combined
+
+    def to_numpy(self) -> "np.ndarray":
+        """Object array of the decoded values (for pandas/numpy operations)"""
+        return np.array(self.tolist(), dtype=object)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes
+
+
+class DatasetSchema:
+    """
+    Storage types for a dataset's columns, applied when the file is loaded
+
+    Args:
+        categories: Low-cardinality text columns, stored as categorical codes
+            (interned strings without pandas)
+        packed: Repetitive id/name columns packed like unique text (PackedStrings)
+            instead of keeping a str object per row
+        int32: Integer columns narrowed to int32 when every value fits
+        float32: Float columns narrowed to float32 when no value changes
+        dates: ISO date columns parsed once into datetime64
+        hash_keys: Join/filter key columns given a HashIndex (``Dataset.lookup``)
+        sorted_keys: Numeric/date columns given an OrderedIndex (``Dataset.range``)
+    """
+
+    def __init__(
+        self,
+        categories: Sequence[str] = (),
+        packed: Sequence[str] = (),
+        int32: Sequence[str] = (),
+        float32: Sequence[str] = (),
+        dates: Sequence[str] = (),
+        hash_keys: Sequence[str] = (),
+        sorted_keys: Sequence[str] = ()
+    ):
+        self.categories = list(categories)
+        self.packed = list(packed)
+        self.int32 = list(int32)
+        self.float32 = list(float32)
+        self.dates = list(dates)
+        self.hash_keys = list(hash_keys)
+        self.sorted_keys = list(sorted_keys)
+
+    def apply(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        """Convert a freshly loaded DataFrame's columns in place (missing columns are skipped)"""
+        for column in self.categories:
+            if column in df.columns:
+                # Ordered (lexically) so min/max keep working as on plain strings
+                df[column] = pd.Categorical(df[column], ordered=True)
+        for column in self.int32:
+            if column in df.columns and df[column].dtype.kind in "iu":
+                values = df[column]
+                if values.empty or (values.min() >= -2 ** 31 and values.max() < 2 ** 31):
+                    df[column] = values.astype(np.int32)
+        for column in self.float32:
+            if column in df.columns and df[column].dtype.kind == "f":
+                narrowed = df[column].astype(np.float32)
+                # Safe only if every value (e.g. 8.5) survives the round trip
+                if narrowed.astype(np.float64).equals(df[column]):
+                    df[column] = narrowed
+        for column in self.dates:
+            if column in df.columns:
+                df[column] = pd.to_datetime(df[column], errors="coerce")
+        return df
+
+    def index(self, dataset: "Dataset") -> "Dataset":
+        """Build the declared key indexes on a freshly loaded dataset"""
+        for column in self.hash_keys:
+            dataset.create_index(column, HashIndex.kind)
+        for column in self.sorted_keys:
+            dataset.create_index(column, OrderedIndex.kind)
+        return dataset
+
+    def intern(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Share one str object per distinct category value (csv-module records)"""
+        for column in self.categories:
+            for record in records:
+                value = record.get(column)
+                if isinstance(value, str):
+                    record[column] = sys.intern(value)
+        return records
+
+
+def _compact(values: Any, pack: bool = False) -> Any:
+    """Typed storage for a loaded column: categoricals and numbers as is, dates as days, unique text packed"""
+    if isinstance(values, pd.Categorical):
+        return values
+    if values.dtype.kind == "M":
+        days = values.astype("datetime64[D]")
+        # Whole dates materialize as datetime.date ("2025-10-26" in JSON)
+        return days if (days == values)[~np.isnat(values)].all() else values.astype("datetime64[s]")
+    if values.dtype != object or not len(values):
+        return values
+    if not pack and len(pd.unique(values)) < PACK_MIN_UNIQUE_RATIO * len(values):
+        return values
+    if not all(isinstance(value, str) or value != value or value is None for value in values):
+        return values
+    return PackedStrings(values)
+
+
+def _concat_columns(head: Any, tail: Any) -> Any:
+    """Append one column's values to another, keeping the compact type where possible"""
+    if isinstance(head, PackedStrings):
+        return head.concat(tail.tolist() if hasattr(tail, "tolist") else tail)
+    if not HAS_PANDAS:
+        return list(head) + list(tail)
+    if isinstance(head, pd.Categorical) and isinstance(tail, pd.Categorical):
+        if set(tail.categories) <= set(head.categories):
+            # Usual append: no new categories, only the tail is re-coded
+            categories = head.categories
+            codes = [head.codes, tail.set_categories(categories).codes]
+        else:
+            categories = sorted(set(head.categories) | set(tail.categories), key=str)
+            codes = [part.set_categories(categories).codes for part in (head, tail)]
+        return pd.Categorical.from_codes(np.concatenate(codes), categories=categories, ordered=head.ordered)
+    if isinstance(head, pd.Categorical) or isinstance(tail, pd.Categorical):
+        head, tail = np.asarray(head, dtype=object), np.asarray(tail, dtype=object)
+    return np.concatenate([np.asarray(head), np.asarray(tail)])
+
+
+def _objects_nbytes(values: Iterable[Any]) -> int:
+    """Size of the distinct Python objects in a sequence (shared objects counted once)"""
+    distinct = {id(value): value for value in values}
+    return sum(sys.getsizeof(value) for value in distinct.values())
+
+
+def _column_nbytes(values: Any) -> int:
+    if isinstance(values, PackedStrings):
+        return values.nbytes
+    if HAS_PANDAS and isinstance(values, pd.Categorical):
+        return values.codes.nbytes + _column_nbytes(np.asarray(values.categories))
+    if HAS_PANDAS and isinstance(values, np.ndarray):
+        return values.nbytes + (_objects_nbytes(values) if values.dtype == object else 0)
+    return sys.getsizeof(values) + _objects_nbytes(values)
+
+
+def _factorize(values: Any) -> Tuple["np.ndarray", "pd.Index"]:
+    """Integer code per row (-1 = missing) and the distinct values"""
+    if isinstance(values, pd.Categorical):
+        return values.codes.astype(np.int32), values.categories
+    codes, uniques = pd.factorize(np.asarray(values))
+    return codes.astype(np.int32), pd.Index(uniques)
+
+
+class HashIndex:
+    """
+    Row positions per distinct value of a key column (point/group lookups in O(1))
+
+    Rows are grouped by key: ``order`` lists the row positions group after
+    group (ascending within a group) and ``starts`` where each group begins,
+    so a lookup is one hash probe plus a slice. Missing values are not
+    indexed. Appending rows re-codes only the new values.
+    """
+
+    kind = "hash"
+
+    def __init__(self, values: Sequence):
+        if HAS_PANDAS:
+            codes, self.keys = _factorize(values)
+            self._group(codes)
+        else:
+            self._groups: Dict[Any, List[int]] = {}
+            self._add(values, 0)
+
+    def _group(self, codes: "np.ndarray"):
+        self.codes = codes
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.keys))
+        self.starts = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.starts[1:])
+        # Missing values (-1) sort first and are left out
+        order = np.argsort(codes, kind="stable")
+        self.order = order[len(codes) - int(self.starts[-1]):].astype(np.int32 if len(codes) < 2 ** 31 else np.int64)
+
+    def _add(self, values: Iterable[Any], offset: int):
+        for position, value in enumerate(values, offset):
+            if value is not None and value == value:
+                self._groups.setdefault(value, []).append(position)
+
+    def _code(self, value: Any) -> Optional[int]:
+        try:
+            code = self.keys.get_loc(value)
+        except (KeyError, TypeError):
+            return None
+        return code if isinstance(code, (int, np.integer)) else None
+
+    def lookup(self, *values: Any) -> Sequence[int]:
+        """Ascending positions of the rows whose key is any of the values"""
+        if not HAS_PANDAS:
+            return sorted(position for value in dict.fromkeys(values) for position in self._groups.get(value, ()))
+        slices = []
+        for value in dict.fromkeys(values):
+            code = self._code(value)
+            if code is not None:
+                slices.append(self.order[self.starts[code]:self.starts[code + 1]])
+        if len(slices) == 1:
+            return slices[0]
+        return np.sort(np.concatenate(slices)) if slices else np.empty(0, dtype=np.intp)
+
+    def counts(self) -> Dict[Any, int]:
+        """Number of rows per distinct key value"""
+        if not HAS_PANDAS:
+            return {value: len(positions) for value, positions in self._groups.items()}
+        sizes = np.diff(self.starts)
+        return {key: int(size) for key, size in zip(self.keys.tolist(), sizes.tolist()) if size}
+
+    def distinct(self) -> List[Any]:
+        """Distinct key values present in the column"""
+        return list(self.counts())
+
+    def extend(self, values: Sequence, offset: int) -> "HashIndex":
+        """New index with rows appended at positions offset, offset + 1, ..."""
+        extended = HashIndex.__new__(HashIndex)
+        if not HAS_PANDAS:
+            extended._groups = {value: list(positions) for value, positions in self._groups.items()}
+            extended._add(values, offset)
+            return extended
+        codes, uniques = _factorize(values)
+        mapping = self.keys.get_indexer(uniques)
+        new = mapping < 0
+        extended.keys = self.keys.append(uniques[new]) if new.any() else self.keys
+        mapping[new] = np.arange(len(self.keys), len(extended.keys))
+        tail = np.where(codes >= 0, mapping[codes], -1).astype(np.int32)
+        extended._group(np.concatenate([self.codes, tail]))
+        return extended
+
+
+class OrderedIndex:
+    """
+    Row positions sorted by a numeric or date key column (range queries in O(log n))
+
+    Missing values are not indexed. Appended rows are merged into place.
+    """
+
+    kind = "sorted"
+
+    def __init__(self, values: Sequence):
+        if HAS_PANDAS:
+            keys = np.asarray(values)
+            valid = np.flatnonzero(~pd.isna(keys))
+            self.order = valid[np.argsort(keys[valid], kind="stable")]
+            self.keys = keys[self.order]
+        else:
+            pairs = sorted(
+                (value, position) for position, value in enumerate(values)
+                if value is not None and value == value
+            )
+            self.keys = [value for value, _ in pairs]
+            self.order = [position for _, position in pairs]
+
+    def _bound(self, value: Any) -> Any:
+        # Dates may be given as strings, date or Timestamp objects
+        return np.datetime64(pd.Timestamp(value), "ns") if HAS_PANDAS and self.keys.dtype.kind == "M" else value
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True
+    ) -> Sequence[int]:
+        """Positions of the rows with low <= key <= high (bounds optional), in key order"""
+        if HAS_PANDAS:
+            start = 0 if low is None else np.searchsorted(self.keys, self._bound(low), "left" if include_low else "right")
+            stop = len(self.keys) if high is None else np.searchsorted(self.keys, self._bound(high), "right" if include_high else "left")
+        else:
+            start = 0 if low is None else (bisect_left if include_low else bisect_right)(self.keys, low)
+            stop = len(self.keys) if high is None else (bisect_right if include_high else bisect_left)(self.keys, high)
+        return self.order[start:max(start, stop)]
+
+    def extend(self, values: Sequence, offset: int) -> "OrderedIndex":
+        """New index with rows appended at positions offset, offset + 1, ..."""
+        tail = OrderedIndex(values)
+        extended = OrderedIndex.__new__(OrderedIndex)
+        if HAS_PANDAS:
+            at = np.searchsorted(self.keys, tail.keys, side="right")
+            extended.keys = np.insert(self.keys, at, tail.keys)
+            extended.order = np.insert(self.order, at, tail.order + offset)
+        else:
+            pairs = sorted(zip(self.keys + tail.keys, self.order + [position + offset for position in tail.order]))
+            extended.keys = [value for value, _ in pairs]
+            extended.order = [position for _, position in pairs]
+        return extended
+
+
+INDEX_KINDS = {HashIndex.kind: HashIndex, OrderedIndex.kind: OrderedIndex}
+
+
+class Dataset:
+    """
+    Column-oriented table: one typed array per column instead of a dict per row
+
+    Numeric and date columns are numpy arrays, schema-declared categories are
+    pandas Categoricals (small integer codes), mostly-unique text columns are
+    packed (PackedStrings) and other text keeps object arrays.
+    Handlers work on the columns directly (``column``, ``to_frame``). Row
+    dicts are only built for the rows that are actually returned (``rows``,
+    indexing, slicing), so a Dataset can also be passed wherever a list of
+    records was expected: iteration, ``len``, ``ds[i]`` and ``ds[a:b]``
+    produce plain Python row dicts.
+    Key columns can be indexed (``create_index``): ``lookup`` and ``range``
+    then return row positions without scanning the column.
+
+    Args:
+        columns: Column name -> values (numpy arrays, or lists without numpy)
+        name: Dataset name for logging (e.g. "service/tickets_data.csv")
+    """
+
+    def __init__(self, columns: Dict[str, Sequence], name: str = ""):
+        self.name = name
+        self.columns: Dict[str, Sequence] = dict(columns)
+        self.indexes: Dict[str, Union[HashIndex, OrderedIndex]] = {}
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of {name or 'dataset'} have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_frame(cls, df: "pd.DataFrame", name: str = "", packed: Sequence[str] = ()) -> "Dataset":
+        """Wrap a DataFrame's columns (no per-row conversion; unique text and the packed columns are packed)"""
+        columns = {}
+        for column in df.columns:
+            series = df[column]
+            values = series.array if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+            columns[str(column)] = _compact(values, pack=column in packed)
+        return cls(columns, name=name)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        name: str = ""
+    ) -> "Dataset":
+        """Build a dataset from row dicts (missing values become None; text is not packed)"""
+        records = list(records)
+        if columns is None:
+            columns = list(dict.fromkeys(key for record in records for key in record))
+        data = {column: [record.get(column) for record in records] for column in columns}
+        if HAS_PANDAS:
+            data = {column: pd.Series(values).to_numpy() for column, values in data.items()}
+        return cls(data, name=name)
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def column(self, name: str) -> Sequence:
+        """Values of one column as an array (KeyError if missing)"""
+        values = self.columns[name]
+        return values.to_numpy() if isinstance(values, PackedStrings) else values
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Values of one column, or default if the dataset has no such column"""
+        return self.column(name) if name in self.columns else default
+
+    def tolist(self, name: str, default: Any = None) -> List[Any]:
+        """Python-typed values of one column ([default] * len if the column is missing)"""
+        values = self.columns.get(name)
+        if values is None:
+            return [default] * self._length
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    def create_index(self, column: str, kind: str = HashIndex.kind) -> Optional[Union[HashIndex, OrderedIndex]]:
+        """
+        Build an index on a column (kept up to date by ``concat``)
+
+        Args:
+            column: Key column; nothing is built if the dataset lacks it
+            kind: "hash" for point/group lookups, "sorted" for range queries
+        """
+        if column not in self.columns:
+            return None
+        index = self.indexes[column] = INDEX_KINDS[kind](self.column(column))
+        return index
+
+    def index(self, column: str, kind: str = HashIndex.kind) -> Optional[Union[HashIndex, OrderedIndex]]:
+        """The column's index of that kind, built now if it was not declared (None without the column)"""
+        index = self.indexes.get(column)
+        if index is not None and index.kind == kind:
+            return index
+        return self.create_index(column, kind)
+
+    def lookup(self, column: str, *values: Any) -> Sequence[int]:
+        """Ascending positions of the rows whose column equals any of the values"""
+        index = self.indexes.get(column)
+        if isinstance(index, HashIndex):
+            return index.lookup(*values)
+        if column not in self.columns:
+            return []
+        # Unindexed column: full scan
+        if HAS_PANDAS:
+            return np.flatnonzero(pd.Series(self.column(column)).isin(values).to_numpy())
+        wanted = set(values)
+        return [position for position, value in enumerate(self.columns[column]) if value in wanted]
+
+    def range(
+        self,
+        column: str,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True
+    ) -> Sequence[int]:
+        """Positions of the rows with low <= column <= high (bounds optional), in column order"""
+        index = self.indexes.get(column)
+        if not isinstance(index, OrderedIndex):
+            if column not in self.columns:
+                return []
+            index = OrderedIndex(self.column(column))
+        return index.range(low, high, include_low, include_high)
+
+    def distinct(self, column: str) -> List[Any]:
+        """Distinct non-missing values of a column (from its hash index if there is one)"""
+        index = self.indexes.get(column)
+        if isinstance(index, HashIndex):
+            return index.distinct()
+        return [value for value in dict.fromkeys(self.tolist(column)) if value is not None and value == value]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes held per column, including the str objects object columns point to"""
+        return {name: _column_nbytes(values) for name, values in self.columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the columns"""
+        return sum(self.memory_usage().values())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __contains__(self, name: str) -> bool:
+        """Whether the dataset has a column (``"status" in ds``)"""
+        return name in self.columns
+
+    def _values(self, positions: Optional[Sequence[int]] = None) -> List[List[Any]]:
+        """Python-typed values per column, for all rows or the given positions"""
+        result = []
+        for values in self.columns.values():
+            if positions is not None:
+                if isinstance(values, PackedStrings):
+                    values = values.take_list(positions)
+                elif hasattr(values, "take"):
+                    values = values.take(np.asarray(positions, dtype=np.intp))
+                else:
+                    values = [values[i] for i in positions]
+            result.append(values.tolist() if hasattr(values, "tolist") else list(values))
+        return result
+
+    def rows(self, positions: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """Materialize row dicts (all rows, or the given positions in that order)"""
+        if positions is not None:
+            positions = list(positions)
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*self._values(positions))] if names else []
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Materialize a single row dict"""
+        return self.rows([position])[0]
+
+    def take(self, positions: Sequence[int]) -> "Dataset":
+        """Sub-dataset with the rows at the given positions"""
+        positions = list(positions)
+        columns = {}
+        for column, values in self.columns.items():
+            if isinstance(values, PackedStrings):
+                columns[column] = PackedStrings(values.take_list(positions))
+            elif hasattr(values, "take"):
+                columns[column] = values.take(np.asarray(positions, dtype=np.intp))
+            else:
+                columns[column] = [values[i] for i in positions]
+        return Dataset(columns, name=self.name)
+
+    def concat(self, other: "Dataset") -> "Dataset":
+        """
+        New dataset with other's rows appended
+
+        Columns keep their storage: categories are merged, packed text is
+        extended and numeric/date types are promoted only when needed.
+        Columns missing on either side are filled with None.
+        """
+        names = list(self.columns) + [name for name in other.columns if name not in self.columns]
+        columns = {}
+        for name in names:
+            head = self.columns.get(name)
+            tail = other.columns.get(name)
+            if head is None:
+                head = [None] * len(self) if not HAS_PANDAS else np.full(len(self), None, dtype=object)
+            if tail is None:
+                tail = [None] * len(other) if not HAS_PANDAS else np.full(len(other), None, dtype=object)
+            columns[name] = _concat_columns(head, tail)
+        combined = Dataset(columns, name=self.name)
+        for column, index in self.indexes.items():
+            if column in other.columns:
+                combined.indexes[column] = index.extend(other.column(column), len(self))
+            else:
+                combined.create_index(column, index.kind)
+        return combined
+
+    def to_frame(self, columns: Optional[Iterable[str]] = None) -> "pd.DataFrame":
+        """DataFrame over the columns, or the listed ones that exist (for pandas-based analysis)"""
+        names = list(self.columns) if columns is None else [name for name in columns if name in self.columns]
+        return pd.DataFrame({name: self.column(name) for name in names}, index=pd.RangeIndex(self._length), copy=False)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = list(self.columns)
+        for values in zip(*self._values()):
+            yield dict(zip(names, values))
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(item, slice):
+            return self.rows(range(*item.indices(self._length)))
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            raise IndexError("Dataset index out of range")
+        return self.row(item)
+
+    def __repr__(self) -> str:
+        return f"Dataset({self.name or 'unnamed'}, rows={self._length}, columns={self.column_names})"
+
+
+def as_dataset(data: Union[Dataset, Iterable[Dict[str, Any]], None], name: str = "") -> Dataset:
+    """
+    Dataset view of handler input
+
+    Accepts a Dataset (returned as is) or a list of record dicts, so handlers
+    work with both skill payloads and records built by callers.
+    """
+    if isinstance(data, Dataset):
+        return data
+    return Dataset.from_records(data or [], name=name)
@@ -3,8 +3,9 @@ Finance Data Handler
 Processes finance data and generates insights
 """
 
+import heapq
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 # Try to import pandas, fallback to manual processing if not available
 try:
@@ -13,29 +14,82 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+from app.data.aggregates import SortedIndex, get_aggregation_engine, lowered
+from app.data.dataset import Dataset, as_dataset
+
 logger = logging.getLogger(__name__)
 
+INVOICES = "finance/invoices_data.csv"
+CASHFLOW = "finance/cashflow_data.csv"
+BUDGET = "finance/budget_data.csv"
+
+DEFAULT_APPROVAL_THRESHOLD = 5000
+MAX_APPROVED_INVOICES = 20
+PENDING_INVOICE_STATUSES = ("pending",)
+
+
+def _is_pending(invoice: Dict[str, Any]) -> bool:
+    return str(invoice.get("status") or "").strip().lower() in PENDING_INVOICE_STATUSES
+
+
+def _amount_key(amount: Any) -> float:
+    """Numeric sort key of an amount (unparseable amounts sort last, as the index skips them)"""
+    try:
+        return float(amount)
+    except (TypeError, ValueError):
+        return float("inf")
+
 
 class FinanceDataHandler:
     """Handles finance data processing and analysis"""
     
+    DATASETS = [INVOICES, CASHFLOW, BUDGET]
+    
+    def __init__(self):
+        """Register the aggregations behind the finance dashboard"""
+        self.aggregates = get_aggregation_engine()
+        self._invoices_by_status = self.aggregates.register(
+            INVOICES, "by_status", value="amount", group_by=lowered("status")
+        )
+        self._pending_by_amount = self.aggregates.register(
+            INVOICES, "pending_by_amount", kind=SortedIndex, key="amount", where=_is_pending
+        )
+        self._revenue_by_month = self.aggregates.register(
+            CASHFLOW, "revenue_by_month", value="revenue", group_by="month"
+        )
+        self._expenses_by_month = self.aggregates.register(
+            CASHFLOW, "expenses_by_month", value="expenses", group_by="month"
+        )
+        self._cash_flow = self.aggregates.register(CASHFLOW, "cash_flow", value="cash_flow")
+        self._allocated = self.aggregates.register(BUDGET, "allocated", value="allocated")
+        self._spent = self.aggregates.register(BUDGET, "spent", value="spent")
+    
+    async def refresh(self):
+        """Bring the handler's aggregates up to date with the finance data files"""
+        await self.aggregates.refresh(self.DATASETS)
+    
     async def get_metrics(self) -> Dict[str, Any]:
         """Get finance metrics"""
         logger.debug("Getting finance metrics")
+        await self.aggregates.refresh([INVOICES, CASHFLOW, BUDGET])
+        
+        allocated = self._allocated.total()
+        
         return {
-            "total_revenue": 4500000,
-            "pending_invoices": 67,
-            "cash_flow": 1250000,
-            "budget_utilization": 78.5
+            "total_revenue": self._revenue_by_month.total(),
+            "pending_invoices": self._invoices_by_status.count("pending"),
+            "cash_flow": self._cash_flow.total(),
+            "budget_utilization": round(self._spent.total() / allocated * 100, 1) if allocated else 0.0
         }
     
     async def get_trends(self) -> List[Dict[str, Any]]:
         """Get finance trends"""
         logger.debug("Getting finance trends")
+        await self.aggregates.refresh([CASHFLOW])
+        
         return [
-            {"period": "Q1", "revenue": 4000000, "expenses": 3200000},
-            {"period": "Q2", "revenue": 4250000, "expenses": 3400000},
-            {"period": "Q3", "revenue": 4500000, "expenses": 3500000}
+            {"period": month, "revenue": revenue, "expenses": self._expenses_by_month.total(month)}
+            for month, (_, revenue) in self._revenue_by_month.groups().items()
         ]
     
     async def get_alerts(self) -> List[Dict[str, Any]]:
@@ -46,41 +100,81 @@ class FinanceDataHandler:
             {"type": "budget_alert", "department": "IT", "utilization": 95, "severity": "medium"}
         ]
     
+    async def _pending_invoice_index(
+        self,
+        data: Optional[Dict[str, Any]]
+    ) -> Tuple[SortedIndex, Optional[Dataset], Sequence[int]]:
+        """
+        Amount index over pending invoices, with the given invoices and their pending rows
+        
+        The engine's index (kept current by the watcher) answers for the live
+        invoices file and for any invoices dataset holding all of its pending
+        invoices, such as the workflow's pushed-down pending query. Other
+        records get an index of their own.
+        """
+        await self.aggregates.refresh([INVOICES])
+        if data is None or "data" not in data:
+            return self._pending_by_amount, None, []
+        invoices = as_dataset(data["data"])
+        pending = invoices.lookup(
+            "status", *[status for status in invoices.distinct("status") if _is_pending({"status": status})]
+        )
+        if invoices.name == INVOICES and len(pending) == len(self._pending_by_amount):
+            return self._pending_by_amount, invoices, pending
+        index = SortedIndex(key="amount", where=_is_pending)
+        index.add_many(invoices.rows(pending))
+        return index, None, []
+    
     async def auto_approve_invoices(
         self,
-        data: Dict[str, Any],
-        threshold: float = 5000
+        data: Optional[Dict[str, Any]] = None,
+        threshold: float = DEFAULT_APPROVAL_THRESHOLD,
+        thresholds: Optional[Sequence[float]] = None
     ) -> Dict[str, Any]:
-        """Auto-approve invoices under threshold"""
+        """
+        Auto-approve pending invoices under threshold
+        
+        Pending invoices are kept sorted by amount with prefix sums, so the
+        approved count and total for any threshold are a binary search.
+        Returned invoices keep their source values; only the sort key is
+        converted to a number.
+        
+        Args:
+            data: Invoice records to evaluate (default: the live invoices dataset)
+            threshold: Maximum amount approved automatically
+            thresholds: Optional policy sweep; adds the approved count and
+                total for each of these thresholds
+        """
         logger.info(f"Auto-approving invoices under ${threshold:,.0f}")
         
-        records = data.get("data", [])
-        if not records:
-            return {"approved_count": 0, "approved_invoices": []}
-        
-        # Filter invoices eligible for auto-approval (works with or without pandas)
-        approved = []
-        for invoice in records:
-            amount = invoice.get("amount", 0)
-            if isinstance(amount, str):
-                try:
-                    amount = float(amount)
-                except (ValueError, TypeError):
-                    amount = 0
-            
-            status = str(invoice.get("status", "")).lower()
-            
-            if amount <= threshold and status == "pending":
-                approved.append(invoice)
-        
-        logger.info(f"Auto-approved {len(approved)} invoices")
+        index, invoices, pending = await self._pending_invoice_index(data)
+        (_, approved_count, total_amount), *sweep = index.sweep([threshold, *(thresholds or [])])
         
-        return {
-            "approved_count": len(approved),
-            "approved_invoices": approved[:20],  # Limit to 20
+        if invoices is not None:
+            # The engine's index holds the file's text; return the given (typed) rows
+            amounts = invoices.tolist("amount")
+            smallest = heapq.nsmallest(
+                min(approved_count, MAX_APPROVED_INVOICES), pending, key=lambda position: _amount_key(amounts[position])
+            )
+            approved_invoices = invoices.rows(smallest)
+        else:
+            approved_invoices = index.records_upto(threshold, MAX_APPROVED_INVOICES)
+        
+        logger.info(f"Auto-approved {approved_count} invoices")
+        
+        result = {
+            "approved_count": approved_count,
+            "approved_invoices": approved_invoices,
             "threshold": threshold,
-            "total_amount": sum(float(i.get("amount", 0)) for i in approved)
+            "total_amount": total_amount,
+            "pending_count": len(index)
         }
+        if thresholds is not None:
+            result["sweep"] = [
+                {"threshold": limit, "approved_count": count, "total_amount": total}
+                for limit, count, total in sweep
+            ]
+        return result
     
     async def analyze_hiring_budget(
         self,
@@ -90,21 +184,24 @@ class FinanceDataHandler:
         """Analyze how cash flow affects hiring budget"""
         logger.info("Analyzing hiring budget impact")
         
-        finance_records = finance_data.get("data", [])
-        hr_records = hr_data.get("data", [])
+        finance_records = as_dataset(finance_data.get("data"))
+        hr_records = as_dataset(hr_data.get("data"))
         
         # Calculate available cash flow
         available_cash = 0
         if finance_records:
-            cash_flows = [r.get("cash_flow", 0) or r.get("amount", 0) for r in finance_records]
-            available_cash = sum(cash_flows) if cash_flows else 1250000
+            cash_flows = [
+                cash_flow or amount
+                for cash_flow, amount in zip(finance_records.tolist("cash_flow", 0), finance_records.tolist("amount", 0))
+            ]
+            available_cash = sum(cash_flows)
         else:
             available_cash = 1250000  # Default
         
         # Calculate hiring needs
         open_positions = 0
         if hr_records:
-            open_positions = len([r for r in hr_records if r.get("status") == "open"])
+            open_positions = len(hr_records.lookup("status", "open"))
         else:
             open_positions = 45  # Default
         
@@ -4,39 +4,107 @@ Processes HR data and generates insights
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Try to import pandas, fallback to manual processing if not available
 try:
+    import numpy as np
     import pandas as pd
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
 
+from app.data.aggregates import get_aggregation_engine, lowered
+from app.data.dataset import Dataset, as_dataset
+
 logger = logging.getLogger(__name__)
 
+EMPLOYEES = "hr/employee_data.csv"
+ATTRITION = "hr/attrition_data.csv"
+SATISFACTION = "hr/satisfaction_scores.csv"
+
+# Departments above this attrition rate (%) are flagged as high risk
+HIGH_RISK_ATTRITION_RATE = 10
+
 
 class HRDataHandler:
     """Handles HR data processing and analysis"""
     
+    DATASETS = [EMPLOYEES, ATTRITION, SATISFACTION]
+    
+    def __init__(self):
+        """Register the aggregations behind the HR dashboard"""
+        self.aggregates = get_aggregation_engine()
+        self._by_status = self.aggregates.register(
+            EMPLOYEES, "by_status", group_by=lowered("status")
+        )
+        self._left_by_quarter = self.aggregates.register(
+            ATTRITION, "left_by_quarter", value="employees_left", group_by="quarter"
+        )
+        self._headcount_by_quarter = self.aggregates.register(
+            ATTRITION, "headcount_by_quarter", value="total_employees", group_by="quarter"
+        )
+        self._weighted_score_by_quarter = self.aggregates.register(
+            SATISFACTION, "weighted_score_by_quarter", group_by="quarter",
+            value=lambda r: float(r.get("satisfaction_score")) * float(r.get("response_count"))
+        )
+        self._responses_by_quarter = self.aggregates.register(
+            SATISFACTION, "responses_by_quarter", value="response_count", group_by="quarter"
+        )
+    
+    @staticmethod
+    def _latest_quarter(aggregation) -> Optional[str]:
+        """Latest quarter an aggregation has data for (quarter labels sort chronologically)"""
+        quarters = [quarter for quarter in aggregation.groups() if quarter]
+        return max(quarters) if quarters else None
+    
+    def _satisfaction(self, quarter=None) -> float:
+        """Response-weighted satisfaction score (one quarter, or overall)"""
+        responses = self._responses_by_quarter.total(quarter)
+        return self._weighted_score_by_quarter.total(quarter) / responses if responses else 0.0
+    
+    async def refresh(self):
+        """Bring the handler's aggregates up to date with the HR data files"""
+        await self.aggregates.refresh(self.DATASETS)
+    
     async def get_metrics(self) -> Dict[str, Any]:
-        """Get HR metrics"""
+        """
+        Get HR metrics
+        
+        attrition_rate and satisfaction_score are for the latest quarter of
+        their data files (the same basis as get_trends()), whatever the row
+        order. Open positions are not reported: the HR
+        data has no requisitions, only Active/Left employees.
+        """
         logger.debug("Getting HR metrics")
+        await self.aggregates.refresh(self.DATASETS)
+        
+        total = self._by_status.count()
+        left = self._by_status.count("left")
+        period = self._latest_quarter(self._headcount_by_quarter)
+        headcount = self._headcount_by_quarter.total(period) if period else 0
+        
         return {
-            "total_employees": 1250,
-            "attrition_rate": 8.5,
-            "satisfaction_score": 7.8,
-            "open_positions": 45
+            "total_employees": total - left,
+            "attrition_rate": round(self._left_by_quarter.total(period) / headcount * 100, 1) if headcount else 0.0,
+            "attrition_period": period,
+            "satisfaction_score": round(self._satisfaction(self._latest_quarter(self._responses_by_quarter)), 1)
         }
     
     async def get_trends(self) -> List[Dict[str, Any]]:
         """Get HR trends"""
         logger.debug("Getting HR trends")
-        return [
-            {"period": "Q1", "attrition": 6.2, "satisfaction": 7.5},
-            {"period": "Q2", "attrition": 7.1, "satisfaction": 7.7},
-            {"period": "Q3", "attrition": 8.5, "satisfaction": 7.8}
-        ]
+        await self.aggregates.refresh([ATTRITION, SATISFACTION])
+        
+        trends = []
+        for quarter, (_, headcount) in self._headcount_by_quarter.groups().items():
+            left = self._left_by_quarter.total(quarter)
+            trends.append({
+                "period": quarter,
+                "attrition": round(left / headcount * 100, 1) if headcount else 0.0,
+                "satisfaction": round(self._satisfaction(quarter), 1)
+            })
+        return trends
     
     async def get_alerts(self) -> List[Dict[str, Any]]:
         """Get HR alerts"""
@@ -47,65 +115,117 @@ class HRDataHandler:
         ]
     
     async def analyze_attrition(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze attrition data"""
+        """
+        Analyze attrition data
+        
+        Accepts employee-level records (a status column, "Left" = attrited) or
+        department-level records (employees_left / total_employees columns; only
+        the latest quarter is used when a quarter column is present).
+        
+        Returns:
+            Overall attrition rate, per-department counts and rates for every
+            department (highest rate first) and the high-risk departments
+        """
         logger.info("Analyzing attrition data")
         
-        records = data.get("data", [])
-        if not records:
-            return {"attrition_rate": 0, "high_risk_departments": []}
+        dataset = as_dataset(data.get("data"))
+        if not dataset:
+            return {"attrition_rate": 0, "high_risk_departments": [], "departments": []}
         
         if HAS_PANDAS:
-            df = pd.DataFrame(records)
-            
-            # Calculate attrition rate
-            total = len(df)
-            if "status" in df.columns:
-                left = len(df[df["status"] == "Left"])
-                attrition_rate = (left / total * 100) if total > 0 else 0
-            else:
-                attrition_rate = 8.5  # Default
-            
-            # Identify high-risk departments
-            high_risk = []
-            if "department" in df.columns:
-                dept_attrition = df.groupby("department").apply(
-                    lambda x: len(x[x.get("status", pd.Series()) == "Left"]) / len(x) * 100
-                    if "status" in x.columns else 0
-                )
-                high_risk = dept_attrition[dept_attrition > 10].index.tolist()
-            
-            departments_analyzed = df["department"].nunique() if "department" in df.columns else 0
+            departments, left, headcount, period = self._attrition_by_department_vectorized(dataset)
         else:
-            # Manual processing without pandas
-            total = len(records)
-            left = len([r for r in records if r.get("status") == "Left"])
-            attrition_rate = (left / total * 100) if total > 0 else 0
-            
-            # Group by department and calculate attrition
-            dept_counts = {}
-            for record in records:
-                dept = record.get("department", "Unknown")
-                if dept not in dept_counts:
-                    dept_counts[dept] = {"total": 0, "left": 0}
-                dept_counts[dept]["total"] += 1
-                if record.get("status") == "Left":
-                    dept_counts[dept]["left"] += 1
-            
-            # Find high-risk departments (>10% attrition)
-            high_risk = [
-                dept for dept, counts in dept_counts.items()
-                if counts["total"] > 0 and (counts["left"] / counts["total"] * 100) > 10
-            ]
-            departments_analyzed = len(dept_counts)
+            departments, left, headcount, period = self._attrition_by_department_manual(dataset)
+        
+        total = sum(headcount)
+        total_left = sum(left)
+        attrition_rate = (total_left / total * 100) if total > 0 else 0
+        
+        breakdown = [
+            {
+                "department": department,
+                "employees": int(dept_total),
+                "left": int(dept_left),
+                "attrition_rate": round(dept_left / dept_total * 100, 2) if dept_total > 0 else 0.0
+            }
+            for department, dept_left, dept_total in zip(departments, left, headcount)
+        ]
+        breakdown.sort(key=lambda d: d["attrition_rate"], reverse=True)
+        high_risk = [d["department"] for d in breakdown if d["attrition_rate"] > HIGH_RISK_ATTRITION_RATE]
         
         logger.info(f"Attrition analysis: {attrition_rate:.1f}% rate, {len(high_risk)} high-risk departments")
         
-        return {
+        result = {
             "attrition_rate": attrition_rate,
-            "high_risk_departments": high_risk[:5],  # Top 5
-            "total_employees": total,
-            "departments_analyzed": departments_analyzed
+            "high_risk_departments": high_risk,
+            "departments": breakdown,
+            "total_employees": int(total),
+            "departments_analyzed": len(breakdown)
         }
+        if period is not None:
+            result["period"] = period
+        return result
+    
+    @staticmethod
+    def _attrition_by_department_vectorized(dataset: Dataset):
+        """Per-department (names, left, headcount, period) via bincount over department codes"""
+        df = dataset.to_frame(["status", "department", "employees_left", "total_employees", "quarter"])
+        period = None
+        
+        if "status" in df.columns:
+            left = (df["status"] == "Left").to_numpy(dtype=np.float64)
+            headcount = np.ones(len(df))
+        elif "employees_left" in df.columns and "total_employees" in df.columns:
+            if "quarter" in df.columns:
+                period = df["quarter"].max()
+                df = df[df["quarter"] == period]
+            left = pd.to_numeric(df["employees_left"], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+            headcount = pd.to_numeric(df["total_employees"], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+        else:
+            left = np.zeros(len(df))
+            headcount = np.ones(len(df))
+        
+        if "department" in df.columns:
+            codes, departments = pd.factorize(df["department"].astype(object).fillna("Unknown"), sort=True)
+        else:
+            codes, departments = np.zeros(len(df), dtype=np.intp), pd.Index(["Unknown"])
+        
+        left_by_dept = np.bincount(codes, weights=left, minlength=len(departments))
+        headcount_by_dept = np.bincount(codes, weights=headcount, minlength=len(departments))
+        return departments.tolist(), left_by_dept.tolist(), headcount_by_dept.tolist(), period
+    
+    @staticmethod
+    def _attrition_by_department_manual(dataset: Dataset):
+        """Per-department (names, left, headcount, period) without pandas"""
+        employee_level = "status" in dataset
+        records = list(dataset)
+        period = None
+        if not employee_level and "quarter" in dataset:
+            period = max(str(r.get("quarter", "")) for r in records)
+            records = [r for r in records if str(r.get("quarter", "")) == period]
+        
+        counts = {}
+        for record in records:
+            dept = record.get("department") or "Unknown"
+            if employee_level:
+                dept_left, dept_total = (1 if record.get("status") == "Left" else 0), 1
+            else:
+                try:
+                    dept_left = float(record.get("employees_left") or 0)
+                    dept_total = float(record.get("total_employees") or 0)
+                except (ValueError, TypeError):
+                    continue
+            state = counts.setdefault(dept, [0, 0])
+            state[0] += dept_left
+            state[1] += dept_total
+        
+        departments = sorted(counts)
+        return (
+            departments,
+            [counts[d][0] for d in departments],
+            [counts[d][1] for d in departments],
+            period
+        )
     
     async def correlate_with_sales(
         self,
@@ -115,19 +235,19 @@ class HRDataHandler:
         """Correlate HR satisfaction with sales performance"""
         logger.info("Correlating HR satisfaction with sales performance")
         
-        hr_records = hr_data.get("data", [])
-        sales_records = sales_data.get("data", [])
+        hr = as_dataset(hr_data.get("data"))
+        sales = as_dataset(sales_data.get("data"))
         
         # Simple correlation calculation
         avg_satisfaction = 7.8  # Default
-        if hr_records and "satisfaction_score" in hr_records[0]:
-            scores = [r.get("satisfaction_score", 0) for r in hr_records]
-            avg_satisfaction = sum(scores) / len(scores) if scores else 7.8
+        if hr and "satisfaction_score" in hr:
+            scores = hr.tolist("satisfaction_score")
+            avg_satisfaction = sum(scores) / len(scores)
         
         avg_sales_performance = 85  # Default
-        if sales_records and "performance" in sales_records[0]:
-            perfs = [r.get("performance", 0) for r in sales_records]
-            avg_sales_performance = sum(perfs) / len(perfs) if perfs else 85
+        if sales and "performance" in sales:
+            perfs = sales.tolist("performance")
+            avg_sales_performance = sum(perfs) / len(perfs)
         
         correlation = "positive" if avg_satisfaction > 7.5 and avg_sales_performance > 80 else "neutral"
         
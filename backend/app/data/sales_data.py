@@ -3,39 +3,107 @@ Sales Data Handler
 Processes sales data and generates insights
 """
 
+import heapq
 import logging
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional, Sequence
 
 # Try to import pandas, fallback to manual processing if not available
 try:
+    import numpy as np
     import pandas as pd
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
 
+from app.data.aggregates import get_aggregation_engine, lowered, quarter_of
+from app.data.dataset import as_dataset
+
 logger = logging.getLogger(__name__)
 
+PIPELINE = "sales/pipeline_data.csv"
+DEALS = "sales/deals_data.csv"
+
+OPEN_PIPELINE_STATUSES = ("active", "stale")
+CLOSED_DEAL_STATUSES = ("won", "lost", "closed won", "closed lost")
+RESOLVED_TICKET_STATUSES = ("resolved", "closed")
+
+# Ticket priority -> severity rank used to order blockers within a deal
+TICKET_SEVERITY = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+
+_NUMBER = re.compile(r"\d+")
+
+
+def normalize_customer_name(name: Any) -> str:
+    """Case/space-insensitive customer name with numbers unpadded ("Customer 07" -> "customer 7")"""
+    text = " ".join(str(name or "").lower().split())
+    return _NUMBER.sub(lambda m: str(int(m.group())), text)
+
+
+def _matching(values: List[Any], statuses: Sequence[str]) -> List[Any]:
+    """The distinct column values that normalize to one of the statuses"""
+    return [value for value in values if str(value).strip().lower() in statuses]
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
 
 class SalesDataHandler:
     """Handles sales data processing and analysis"""
     
+    DATASETS = [PIPELINE, DEALS]
+    
+    def __init__(self):
+        """Register the aggregations behind the sales dashboard"""
+        self.aggregates = get_aggregation_engine()
+        self._open_pipeline = self.aggregates.register(
+            PIPELINE, "open_pipeline", value="value",
+            where=lambda r: lowered("status")(r) in OPEN_PIPELINE_STATUSES
+        )
+        self._deals_by_status = self.aggregates.register(
+            DEALS, "by_status", value="amount", group_by=lowered("status")
+        )
+        self._won_by_quarter = self.aggregates.register(
+            DEALS, "won_by_quarter", value="amount", group_by=quarter_of("close_date"),
+            where=lambda r: lowered("status")(r) == "won"
+        )
+    
+    async def refresh(self):
+        """Bring the handler's aggregates up to date with the sales data files"""
+        await self.aggregates.refresh(self.DATASETS)
+    
     async def get_metrics(self) -> Dict[str, Any]:
         """Get sales metrics"""
         logger.debug("Getting sales metrics")
+        await self.aggregates.refresh([PIPELINE, DEALS])
+        
+        won = self._deals_by_status.count("won")
+        decided = won + self._deals_by_status.count("lost")
+        
         return {
-            "total_pipeline_value": 2500000,
-            "deals_closed": 45,
-            "conversion_rate": 23.5,
-            "avg_deal_size": 55000
+            "total_pipeline_value": self._open_pipeline.total(),
+            "deals_closed": won,
+            "conversion_rate": round(won / decided * 100, 1) if decided else 0.0,
+            "avg_deal_size": round(self._deals_by_status.mean("won"))
         }
     
     async def get_trends(self) -> List[Dict[str, Any]]:
         """Get sales trends"""
         logger.debug("Getting sales trends")
+        await self.aggregates.refresh([DEALS])
+        
+        quarters = sorted(q for q in self._won_by_quarter.groups() if q)
         return [
-            {"period": "Q1", "revenue": 1200000, "deals": 38},
-            {"period": "Q2", "revenue": 1350000, "deals": 42},
-            {"period": "Q3", "revenue": 1500000, "deals": 45}
+            {
+                "period": quarter,
+                "revenue": self._won_by_quarter.total(quarter),
+                "deals": self._won_by_quarter.count(quarter)
+            }
+            for quarter in quarters
         ]
     
     async def get_alerts(self) -> List[Dict[str, Any]]:
@@ -50,25 +118,25 @@ class SalesDataHandler:
         """Analyze sales pipeline"""
         logger.info("Analyzing sales pipeline")
         
-        records = data.get("data", [])
+        records = as_dataset(data.get("data"))
         if not records:
             return {"health_score": 75, "urgent_deals": []}
         
         if HAS_PANDAS:
-            df = pd.DataFrame(records)
+            df = records.to_frame(["value", "status"])
             
             # Calculate pipeline health
             total_value = df.get("value", pd.Series()).sum() if "value" in df.columns else 2500000
             avg_deal_size = total_value / len(df) if len(df) > 0 else 55000
             
-            # Identify urgent deals (stale or high value)
+            # Identify urgent deals (stale or high value) from the value and status indexes
             urgent_deals = []
             if "value" in df.columns and "status" in df.columns:
-                urgent = df[
-                    (df["value"] > 50000) | 
-                    (df["status"] == "stale")
-                ]
-                urgent_deals = urgent.to_dict(orient="records")[:5]
+                urgent = np.union1d(
+                    records.range("value", 50000, include_low=False),
+                    records.lookup("status", "stale")
+                )
+                urgent_deals = records.rows(urgent[:5])
             
             total_deals = len(df)
         else:
@@ -100,34 +168,109 @@ class SalesDataHandler:
     async def identify_blocking_tickets(
         self,
         sales_data: Dict[str, Any],
-        service_data: Dict[str, Any]
+        service_data: Dict[str, Any],
+        limit: int = 10,
+        per_deal: Optional[int] = 2
     ) -> Dict[str, Any]:
-        """Identify customer service tickets blocking sales deals"""
+        """
+        Identify customer service tickets blocking sales deals
+        
+        Hash join of every open deal with every unresolved ticket on
+        customer_id, falling back to the normalized customer name when either
+        side carries no customer ids. Blockers are ranked by deal value, then ticket
+        severity, then ticket age.
+        
+        Counts cover every blocker; limit and per_deal only shape the returned
+        sample, whose tickets carry their deal's full blocker count.
+        
+        Args:
+            sales_data: Deals (customer_id/customer_name, amount or value, status)
+            service_data: Tickets (customer_id/customer_name, priority, status)
+            limit: Number of ranked blockers to return
+            per_deal: Max blockers returned per deal (None = no cap)
+        """
         logger.info("Identifying blocking tickets")
         
-        sales_records = sales_data.get("data", [])
-        service_records = service_data.get("data", [])
-        
-        # Simple matching logic
-        blocking_tickets = []
-        if sales_records and service_records:
-            # Match by customer ID or name
-            for deal in sales_records[:10]:  # Check top 10 deals
-                customer_id = deal.get("customer_id") or deal.get("customer_name", "")
-                matching_tickets = [
-                    t for t in service_records
-                    if (t.get("customer_id") == customer_id or 
-                        t.get("customer_name", "").lower() == str(customer_id).lower())
-                    and t.get("status") != "resolved"
-                ]
-                if matching_tickets:
-                    blocking_tickets.extend(matching_tickets[:2])  # Max 2 per deal
-        
-        logger.info(f"Found {len(blocking_tickets)} blocking tickets")
+        deals = as_dataset(sales_data.get("data"))
+        tickets = as_dataset(service_data.get("data"))
+        
+        # Only the join and ranking columns are read; rows are built for the result
+        ticket_severity = [
+            TICKET_SEVERITY.get(str(priority or "").strip().lower(), 0)
+            for priority in tickets.tolist("priority")
+        ]
+        ticket_age = [_to_float(age) for age in tickets.tolist("age_days")]
+        
+        # Build side: the tickets' customer_id index (declared for the skill
+        # dataset, built here for plain records) restricted to unresolved
+        # tickets; the name index is only built if a deal has to fall back
+        # to matching by name
+        is_open = [True] * len(tickets)
+        for position in tickets.lookup("status", *_matching(tickets.distinct("status"), RESOLVED_TICKET_STATUSES)):
+            is_open[position] = False
+        open_tickets = [position for position, flag in enumerate(is_open) if flag]
+        by_customer_id = tickets.index("customer_id")
+        has_ticket_ids = by_customer_id is not None and any(
+            is_open[position]
+            for customer_id in by_customer_id.distinct() if customer_id
+            for position in by_customer_id.lookup(customer_id)
+        )
+        by_customer_name: Optional[Dict[str, List[int]]] = None
+        
+        # Probe side: every open deal
+        deal_customer_ids = deals.tolist("customer_id")
+        deal_customer_names = deals.tolist("customer_name")
+        deal_values = deals.tolist("amount") if "amount" in deals else deals.tolist("value")
+        closed_deals = set(deals.lookup("status", *_matching(deals.distinct("status"), CLOSED_DEAL_STATUSES)))
+        matches = []
+        deals_affected = 0
+        total_blocking = 0
+        blockers_per_deal: Dict[int, int] = {}
+        for position in range(len(deals)):
+            if position in closed_deals:
+                continue
+            customer_id = deal_customer_ids[position]
+            customer_name = deal_customer_names[position]
+            matched = None
+            if customer_id and by_customer_id is not None:
+                matched = [ticket for ticket in by_customer_id.lookup(customer_id) if is_open[ticket]]
+            if not matched and customer_name and not (customer_id and has_ticket_ids):
+                if by_customer_name is None:
+                    by_customer_name = {}
+                    ticket_names = tickets.tolist("customer_name")
+                    for ticket in open_tickets:
+                        name = normalize_customer_name(ticket_names[ticket])
+                        if name:
+                            by_customer_name.setdefault(name, []).append(ticket)
+                matched = by_customer_name.get(normalize_customer_name(customer_name))
+            if not matched:
+                continue
+            
+            deals_affected += 1
+            total_blocking += len(matched)
+            blockers_per_deal[position] = len(matched)
+            deal_value = _to_float(deal_values[position])
+            ranked = sorted(matched, key=lambda t: (ticket_severity[t], ticket_age[t]), reverse=True)
+            for ticket in ranked[:per_deal] if per_deal else ranked:
+                matches.append((deal_value, position, ticket))
+        
+        top = heapq.nlargest(limit, matches, key=lambda m: (m[0], ticket_severity[m[2]]))
+        deal_ids = deals.tolist("deal_id") if "deal_id" in deals else deals.tolist("id")
+        blocking_tickets = [
+            {
+                **ticket,
+                "deal_id": deal_ids[deal],
+                "deal_value": deal_value,
+                "deal_blocking": blockers_per_deal[deal],
+                "severity": ticket_severity[position]
+            }
+            for (deal_value, deal, position), ticket in zip(top, tickets.rows([m[2] for m in top]))
+        ]
+        
+        logger.info(f"Found {total_blocking} blocking tickets across {deals_affected} open deals")
         
         return {
-            "blocking_tickets": blocking_tickets[:10],  # Top 10
-            "total_blocking": len(blocking_tickets),
-            "deals_affected": len(set(t.get("customer_id") for t in blocking_tickets))
+            "blocking_tickets": blocking_tickets,
+            "total_blocking": total_blocking,
+            "deals_affected": deals_affected
         }
-
@@ -0,0 +1,147 @@
+"""
+Dashboard Snapshots
+Precomputed per-sector dashboard data, rebuilt when the sector's data changes
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from app.models.schemas import DashboardData, Sector
+from app.data import get_data_handler
+from app.data.watcher import DataWatcher, FileChange, get_data_watcher
+
+logger = logging.getLogger(__name__)
+
+# Sectors that get a snapshot at startup (cross_sector is built on demand)
+DASHBOARD_SECTORS = [Sector.HR, Sector.SALES, Sector.SERVICE, Sector.FINANCE]
+
+
+class DashboardSnapshotStore:
+    """
+    Holds a precomputed DashboardData per sector
+
+    Reads are served from memory. The store subscribes to the data watcher
+    and rebuilds a snapshot only when one of its sector's files changes.
+    """
+
+    def __init__(self, watcher: Optional[DataWatcher] = None):
+        """Initialize snapshot store"""
+        self.watcher = watcher or get_data_watcher()
+        self._snapshots: Dict[Sector, DashboardData] = {}
+        self._dirty: Set[Sector] = set()
+        self._versions: Dict[Sector, int] = {}
+        self._locks: Dict[Sector, asyncio.Lock] = {}
+        self._pending: Dict[Sector, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        logger.info("🔧 DashboardSnapshotStore created")
+
+    async def start(self):
+        """Build the initial snapshots and rebuild them on data changes"""
+        logger.info("🚀 Building dashboard snapshots...")
+        self._loop = asyncio.get_running_loop()
+        self.watcher.subscribe(self._on_change)
+        await asyncio.gather(*(self.refresh(sector, force=True) for sector in DASHBOARD_SECTORS))
+        logger.info(f"✅ {len(self._snapshots)} dashboard snapshots ready")
+
+    async def stop(self):
+        """Stop rebuilding snapshots on data changes"""
+        self.watcher.unsubscribe(self._on_change)
+        pending = [task for task in self._pending.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._pending.clear()
+        logger.info("🛑 Dashboard snapshot refresh stopped")
+
+    async def get(self, sector: Sector) -> DashboardData:
+        """
+        Get the current snapshot for a sector
+
+        Args:
+            sector: Business sector
+
+        Returns:
+            DashboardData as of the last refresh
+        """
+        snapshot = self._snapshots.get(sector)
+        if snapshot is None:
+            await self.refresh(sector)
+            snapshot = self._snapshots[sector]
+        return snapshot
+
+    def version(self, sector: Sector) -> int:
+        """Number of times the sector snapshot has been rebuilt"""
+        return self._versions.get(sector, 0)
+
+    async def refresh(self, sector: Sector, force: bool = False) -> bool:
+        """
+        Rebuild a sector snapshot if its data files changed
+
+        Args:
+            sector: Business sector
+            force: Rebuild even if no change was reported
+
+        Returns:
+            True if the snapshot was rebuilt
+        """
+        lock = self._locks.setdefault(sector, asyncio.Lock())
+        async with lock:
+            if not force and sector in self._snapshots and sector not in self._dirty:
+                return False
+
+            # Changes reported while building mark the sector dirty again
+            self._dirty.discard(sector)
+            self._snapshots[sector] = await self.build(sector)
+            self._versions[sector] = self._versions.get(sector, 0) + 1
+            logger.debug(f"📸 Snapshot rebuilt for {sector.value} (v{self._versions[sector]})")
+            return True
+
+    async def build(self, sector: Sector) -> DashboardData:
+        """
+        Compute dashboard data for a sector
+
+        Metrics, trends and alerts are fetched concurrently.
+        """
+        data_handler = get_data_handler(sector)
+        metrics, trends, alerts = await asyncio.gather(
+            data_handler.get_metrics(),
+            data_handler.get_trends(),
+            data_handler.get_alerts()
+        )
+        return DashboardData.trusted(
+            sector=sector,
+            metrics=metrics,
+            trends=trends,
+            alerts=alerts,
+            last_updated=datetime.now()
+        )
+
+    def _on_change(self, change: FileChange):
+        """Watcher listener (worker thread): mark affected snapshots dirty and rebuild them"""
+        try:
+            changed = Sector(change.sector)
+        except ValueError:
+            return
+        # Cross-sector dashboards draw on every sector
+        for sector in (changed, Sector.CROSS_SECTOR):
+            if sector in self._snapshots:
+                self._dirty.add(sector)
+                if self._loop is not None:
+                    self._loop.call_soon_threadsafe(self._schedule_refresh, sector)
+
+    def _schedule_refresh(self, sector: Sector):
+        """Start a rebuild unless one is already queued for the sector"""
+        task = self._pending.get(sector)
+        if task is not None and not task.done():
+            return
+        self._pending[sector] = asyncio.create_task(self._refresh_logged(sector))
+
+    async def _refresh_logged(self, sector: Sector):
+        try:
+            # Keep going while changes arrive during a rebuild
+            while await self.refresh(sector) and sector in self._dirty:
+                pass
+        except Exception as e:
+            logger.error(f"❌ Snapshot refresh failed for {sector.value}: {str(e)}", exc_info=True)
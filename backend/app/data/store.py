@@ -0,0 +1,475 @@
+"""
+SQLite Dataset Store
+Sector datasets imported into indexed SQLite tables, queried with pushed-down SQL
+"""
+
+import csv
+import hashlib
+import io
+import itertools
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Try to import pandas, fallback to plain Python rows if not available
+try:
+    import numpy as np
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+from app.data.dataset import Dataset, DatasetSchema
+from app.data.watcher import DataWatcher, FileChange, get_data_watcher
+
+logger = logging.getLogger(__name__)
+
+# Parameterized statements kept prepared per connection
+STATEMENT_CACHE_SIZE = 256
+
+# Rows per executemany batch while importing a file
+IMPORT_BATCH_SIZE = 10_000
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _missing(value: Any) -> bool:
+    return value is None or value != value  # None or NaN
+
+
+def _as_list(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+class DatasetQuery:
+    """
+    Projection, filters, aggregation and limit pushed down to the storage engine
+
+    Built from skill parameters, e.g.::
+
+        {"columns": ["status", "amount"],
+         "where": {"status": ["pending", "overdue"]},
+         "range": {"amount": [1000, 5000]},
+         "group_by": ["status"],
+         "aggregates": {"total": ["sum", "amount"], "invoices": ["count", "*"]},
+         "order_by": "-total",
+         "limit": 10}
+
+    ``where`` matches any of the listed values, ``range`` bounds are
+    inclusive (null = unbounded). Rows keep file order unless ``order_by``
+    is given; aggregated rows are ordered by the group columns. Columns in
+    ``columns`` that the dataset lacks are skipped; unknown columns anywhere
+    else raise ValueError.
+
+    The memory engine evaluates a query with the dataset's key indexes
+    (``apply``), the SQLite engine as one parameterized statement (``to_sql``).
+    """
+
+    KEYS = ("columns", "where", "range", "group_by", "aggregates", "order_by", "limit")
+    AGGREGATES = {"count": "COUNT", "sum": "SUM", "avg": "AVG", "min": "MIN", "max": "MAX"}
+
+    def __init__(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        range: Optional[Dict[str, Sequence[Any]]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        aggregates: Optional[Dict[str, Sequence[str]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ):
+        self.columns = list(columns) if columns is not None else None
+        self.where = {column: _as_list(values) for column, values in (where or {}).items()}
+        self.range = {column: (bounds[0], bounds[1]) for column, bounds in (range or {}).items()}
+        self.group_by = list(group_by or [])
+        self.aggregates = {output: (spec[0].lower(), spec[1]) for output, spec in (aggregates or {}).items()}
+        self.order_by = order_by
+        self.limit = int(limit) if limit is not None else None
+        for output, (function, _) in self.aggregates.items():
+            if function not in self.AGGREGATES:
+                raise ValueError(f"Unknown aggregate for {output}: {function}")
+
+    @classmethod
+    def from_parameters(cls, parameters: Optional[Dict[str, Any]]) -> Optional["DatasetQuery"]:
+        """Query from skill parameters, or None if they ask for the whole dataset"""
+        spec = {key: parameters[key] for key in cls.KEYS if parameters and parameters.get(key) is not None}
+        return cls(**spec) if spec else None
+
+    @property
+    def aggregated(self) -> bool:
+        return bool(self.group_by or self.aggregates)
+
+    def output_columns(self, available: Sequence[str]) -> List[str]:
+        """Result columns, after checking every referenced column exists"""
+        known = set(available)
+        referenced = list(self.where) + list(self.range) + self.group_by + [
+            column for _, column in self.aggregates.values() if column != "*"
+        ]
+        missing = [column for column in referenced if column not in known]
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}")
+        if self.aggregated:
+            outputs = self.group_by + list(self.aggregates)
+        elif self.columns is not None:
+            outputs = [column for column in self.columns if column in known]
+        else:
+            outputs = list(available)
+        if self.order_by and self.order_by.lstrip("-") not in outputs:
+            raise ValueError(f"Cannot order by {self.order_by.lstrip('-')}")
+        return outputs
+
+    def apply(self, dataset: Dataset) -> Dataset:
+        """Evaluate the query on an in-memory dataset (lookups use its key indexes)"""
+        outputs = self.output_columns(dataset.column_names)
+
+        matches = [dataset.lookup(column, *values) for column, values in self.where.items()]
+        sort = np.sort if HAS_PANDAS else sorted
+        matches += [sort(dataset.range(column, low, high)) for column, (low, high) in self.range.items()]
+        positions = None
+        if matches:
+            if HAS_PANDAS:
+                positions = matches[0]
+                for matched in matches[1:]:
+                    positions = np.intersect1d(positions, matched, assume_unique=True)
+            else:
+                positions = sorted(set(matches[0]).intersection(*matches[1:]))
+        if self.limit is not None and not self.aggregated and not self.order_by:
+            # Rows stay in file order, so only the first `limit` matches are needed
+            positions = positions[:self.limit] if positions is not None else range(min(self.limit, len(dataset)))
+        if positions is not None:
+            dataset = dataset.take(positions)
+
+        if self.aggregated:
+            result = self._aggregate(dataset)
+        else:
+            result = Dataset({column: dataset.columns[column] for column in outputs}, name=dataset.name)
+
+        if self.order_by:
+            column = self.order_by.lstrip("-")
+            values = result.tolist(column)
+            order = sorted(
+                (position for position in range(len(result)) if not _missing(values[position])),
+                key=values.__getitem__, reverse=self.order_by.startswith("-")
+            )
+            # NULLs sort first ascending, last descending (as in SQLite)
+            nulls = [position for position in range(len(result)) if _missing(values[position])]
+            result = result.take(order + nulls if self.order_by.startswith("-") else nulls + order)
+        if self.limit is not None and len(result) > self.limit:
+            result = result.take(range(self.limit))
+        return result
+
+    def _aggregate(self, dataset: Dataset) -> Dataset:
+        if HAS_PANDAS and self.group_by:
+            return self._aggregate_frame(dataset)
+        columns = [[None if _missing(value) else value for value in dataset.tolist(column)] for column in self.group_by]
+        keys = list(zip(*columns)) if self.group_by else [()] * len(dataset)
+        inputs = {
+            output: (function, dataset.tolist(column) if column != "*" else None)
+            for output, (function, column) in self.aggregates.items()
+        }
+        groups: Dict[Tuple, List[int]] = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(key, []).append(position)
+        if not self.group_by and not groups:
+            groups[()] = []  # SQL aggregates without GROUP BY always return one row
+
+        rows = []
+        for key in sorted(groups, key=lambda k: tuple((value is not None, value) for value in k)):
+            row = dict(zip(self.group_by, key))
+            for output, (function, values) in inputs.items():
+                present = [values[p] for p in groups[key] if not _missing(values[p])] if values is not None else groups[key]
+                if function == "count":
+                    row[output] = len(present)
+                elif not present:
+                    row[output] = None
+                elif function == "sum":
+                    row[output] = sum(present)
+                elif function == "avg":
+                    row[output] = sum(present) / len(present)
+                else:
+                    row[output] = (min if function == "min" else max)(present)
+            rows.append(row)
+        return Dataset.from_records(rows, columns=self.group_by + list(self.aggregates), name=dataset.name)
+
+    def _aggregate_frame(self, dataset: Dataset) -> Dataset:
+        """GROUP BY with pandas; same rows, order and NULL handling as the SQL version"""
+        inputs = [column for _, column in self.aggregates.values() if column != "*"]
+        df = dataset.to_frame(list(dict.fromkeys(self.group_by + inputs)))
+        grouped = df.groupby(self.group_by, dropna=False, observed=True, sort=True)
+        result = grouped.size().to_frame("_rows")
+        for output, (function, column) in self.aggregates.items():
+            if column == "*":
+                result[output] = result["_rows"]
+            elif function == "count":
+                result[output] = grouped[column].count()
+            elif function == "sum":
+                result[output] = grouped[column].sum(min_count=1)  # all-NULL group -> NULL
+            else:
+                result[output] = getattr(grouped[column], "mean" if function == "avg" else function)()
+        result = result.drop(columns="_rows").reset_index()
+        # SQLite orders NULL group keys first
+        null_keys = result[self.group_by].isna().any(axis=1)
+        if null_keys.any():
+            result = pd.concat([result[null_keys], result[~null_keys]], ignore_index=True)
+        for column in self.group_by:
+            if isinstance(result[column].dtype, pd.CategoricalDtype):
+                result[column] = result[column].astype(object)
+        return Dataset.from_frame(result, name=dataset.name)
+
+    def to_sql(self, table: str, available: Sequence[str]) -> Tuple[str, List[Any]]:
+        """Parameterized SELECT over a table (identifiers are checked against its columns)"""
+        outputs = self.output_columns(available)
+        params: List[Any] = []
+        if self.aggregated:
+            select = [_quote(column) for column in self.group_by] + [
+                f"{self.AGGREGATES[function]}({'*' if column == '*' else _quote(column)}) AS {_quote(output)}"
+                for output, (function, column) in self.aggregates.items()
+            ]
+        else:
+            select = [_quote(column) for column in outputs]
+        sql = f"SELECT {', '.join(select) or '*'} FROM {_quote(table)}"
+
+        conditions = []
+        for column, values in self.where.items():
+            conditions.append(f"{_quote(column)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        for column, (low, high) in self.range.items():
+            if low is not None:
+                conditions.append(f"{_quote(column)} >= ?")
+                params.append(low)
+            if high is not None:
+                conditions.append(f"{_quote(column)} <= ?")
+                params.append(high)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if self.group_by:
+            sql += " GROUP BY " + ", ".join(_quote(column) for column in self.group_by)
+
+        # Ties keep group order / file order, as the stable sort in apply() does
+        order = [_quote(column) for column in self.group_by] if self.aggregated else ["rowid"]
+        if self.order_by:
+            column = self.order_by.lstrip("-")
+            order.insert(0, f"{_quote(column)} {'DESC' if self.order_by.startswith('-') else 'ASC'}")
+        if order and (self.group_by or not self.aggregated):
+            sql += " ORDER BY " + ", ".join(order)
+        if self.limit is not None:
+            sql += " LIMIT ?"
+            params.append(self.limit)
+        return sql, params
+
+
+def table_name(dataset: str) -> str:
+    """SQLite table for a dataset ("service/tickets_data.csv" -> "service__tickets_data")"""
+    return dataset.rsplit(".", 1)[0].replace("/", "__")
+
+
+def _column_types(rows: Iterable[List[str]], width: int) -> List[str]:
+    """Per column: INTEGER / REAL if every non-empty value parses as one, TEXT otherwise"""
+    kinds = ["INTEGER"] * width
+    for row in rows:
+        for i, value in enumerate(row[:width]):
+            kind = kinds[i]
+            if value == "" or kind == "TEXT":
+                continue
+            if kind == "INTEGER":
+                try:
+                    int(value)
+                    continue
+                except ValueError:
+                    kind = kinds[i] = "REAL"
+            try:
+                float(value)
+            except ValueError:
+                kinds[i] = "TEXT"
+    return kinds
+
+
+def _csv_rows(content: bytes) -> Tuple[List[str], Iterator[List[str]]]:
+    """Header and a lazy iterator over the non-empty rows of CSV bytes (decoded as they are read)"""
+    reader = csv.reader(io.TextIOWrapper(io.BytesIO(content), encoding="utf-8-sig", newline=""))
+    header = next(reader, [])
+    return header, (row for row in reader if any(row))
+
+
+class SqliteDatasetStore:
+    """
+    Sector datasets held in SQLite instead of per-worker memory
+
+    A dataset is imported into its own table on first use, with an index on
+    every key column its DatasetSchema declares (hash_keys, sorted_keys).
+    The store subscribes to the data watcher: appended rows are inserted,
+    a rewritten file is re-imported. Imports are recorded with a content
+    digest, so an unchanged file is not imported again after a restart
+    (a file that was appended to while running is re-imported once).
+
+    Queries run as one parameterized statement (DatasetQuery.to_sql) on a
+    connection that keeps prepared statements cached; only the selected
+    rows are turned into a Dataset. Calls are blocking and serialized; run
+    them in a worker thread from async code.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        schemas: Optional[Dict[str, DatasetSchema]] = None,
+        watcher: Optional[DataWatcher] = None
+    ):
+        """Initialize SQLite dataset store"""
+        self.db_path = Path(db_path)
+        self.schemas = schemas or {}
+        self.watcher = watcher or get_data_watcher()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._columns: Dict[str, List[str]] = {}
+        # Lock order: watcher lock, then this one (listeners run under the watcher lock)
+        self._lock = threading.RLock()
+        logger.info(f"🔧 SqliteDatasetStore created ({self.db_path})")
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _imports (dataset TEXT PRIMARY KEY, digest TEXT, row_count INTEGER NOT NULL)"
+            )
+            self.watcher.subscribe(self._on_change)
+        return self._conn
+
+    def close(self):
+        """Close the database connection and stop following file changes"""
+        with self._lock:
+            if self._conn is not None:
+                self.watcher.unsubscribe(self._on_change)
+                self._conn.close()
+                self._conn = None
+                self._columns.clear()
+
+    def select(self, dataset: str, query: Optional["DatasetQuery"] = None) -> Dataset:
+        """
+        Run a query against a dataset's table (blocking)
+
+        Args:
+            dataset: Dataset name ("service/tickets_data.csv")
+            query: Pushed-down query (default: every row and column)
+
+        Returns:
+            The selected rows as a Dataset, typed and indexed per its schema
+            (indexes only for whole-table selections)
+        """
+        if dataset in self._columns:
+            self.watcher.poll([dataset])
+        else:
+            self.watcher.load(dataset, lambda content: self._import(dataset, content))
+
+        query = query or DatasetQuery()
+        with self._lock:
+            columns = self._columns[dataset]
+            sql, params = query.to_sql(table_name(dataset), columns)
+            cursor = self._connection().execute(sql, params)
+            names = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        return self._to_dataset(dataset, names, rows, indexed=not (query.where or query.range or query.aggregated))
+
+    def _to_dataset(self, dataset: str, names: List[str], rows: List[tuple], indexed: bool) -> Dataset:
+        schema = self.schemas.get(dataset)
+        if HAS_PANDAS:
+            df = pd.DataFrame.from_records(rows, columns=names)
+            if schema is not None:
+                df = schema.apply(df)
+            result = Dataset.from_frame(df, name=dataset, packed=schema.packed if schema is not None else ())
+        else:
+            result = Dataset.from_records((dict(zip(names, row)) for row in rows), columns=names, name=dataset)
+        if schema is not None and indexed:
+            schema.index(result)
+        return result
+
+    def _import(self, dataset: str, content: bytes):
+        """(Re)create a dataset's table from the file contents unless it is already up to date"""
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        with self._lock:
+            conn = self._connection()
+            table = _quote(table_name(dataset))
+            existing = conn.execute("SELECT digest FROM _imports WHERE dataset = ?", (dataset,)).fetchone()
+            if existing is not None and existing[0] == digest:
+                self._columns[dataset] = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                logger.debug(f"{dataset} is already imported")
+                return
+
+            # Two streaming passes: infer the column types, then insert in batches
+            header, rows = _csv_rows(content)
+            if not header:
+                # The file was removed or emptied
+                with conn:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute("DELETE FROM _imports WHERE dataset = ?", (dataset,))
+                self._columns.pop(dataset, None)
+                return
+            types = _column_types(rows, len(header))
+            with conn:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"CREATE TABLE {table} ({', '.join(f'{_quote(c)} {t}' for c, t in zip(header, types))})")
+                self._columns[dataset] = header
+                row_count = self._insert(dataset, _csv_rows(content)[1])
+                self._create_indexes(dataset)
+                conn.execute(
+                    "INSERT OR REPLACE INTO _imports (dataset, digest, row_count) VALUES (?, ?, ?)",
+                    (dataset, digest, row_count)
+                )
+            logger.info(f"🗄️ Imported {row_count:,} rows of {dataset} into SQLite")
+
+    def _insert(self, dataset: str, rows: Iterable[List[str]]) -> int:
+        """Insert CSV rows in executemany batches; returns the number inserted"""
+        columns = self._columns[dataset]
+        sql = (
+            f"INSERT INTO {_quote(table_name(dataset))} ({', '.join(map(_quote, columns))}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        width = len(columns)
+        rows = iter(rows)
+        count = 0
+        while True:
+            batch = list(itertools.islice(rows, IMPORT_BATCH_SIZE))
+            if not batch:
+                return count
+            # Empty CSV fields are NULL; INTEGER/REAL column affinity converts numeric text
+            self._conn.executemany(sql, (
+                [value if value != "" else None for value in (row + [""] * width)[:width]]
+                for row in batch
+            ))
+            count += len(batch)
+
+    def _create_indexes(self, dataset: str):
+        schema = self.schemas.get(dataset)
+        if schema is None:
+            return
+        table = table_name(dataset)
+        for column in dict.fromkeys(schema.hash_keys + schema.sorted_keys):
+            if column in self._columns[dataset]:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table}_{column}')} ON {_quote(table)} ({_quote(column)})"
+                )
+
+    def _on_change(self, change: FileChange):
+        """Watcher listener: insert appended rows, re-import a rewritten file"""
+        with self._lock:
+            if change.dataset not in self._columns or self._conn is None:
+                return
+            if change.rewritten:
+                self._import(change.dataset, change.chunk)
+                return
+            with self._conn:
+                row_count = self._insert(change.dataset, _csv_rows(change.chunk)[1])
+                # Hashing the whole file on every append would defeat the point;
+                # the next process start re-imports it once instead
+                self._conn.execute(
+                    "UPDATE _imports SET digest = NULL, row_count = row_count + ? WHERE dataset = ?",
+                    (row_count, change.dataset)
+                )
+            logger.debug(f"Inserted {row_count} appended rows into {change.dataset}")
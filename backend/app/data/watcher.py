@@ -0,0 +1,293 @@
+"""
+Data File Watcher
+Polls the data directory and pushes appended rows or rewrites to subscribers
+"""
+
+import asyncio
+import csv
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+# Seconds between polls of the data directory
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Bytes before the consumed offset re-checked on every read to catch in-place rewrites
+_GUARD_BYTES = 64
+
+T = TypeVar("T")
+
+
+class FileChange:
+    """
+    Rows added to a data file since it was last read
+
+    Args:
+        dataset: Dataset name, relative to the data directory ("sales/deals_data.csv")
+        rewritten: True when the file was replaced; the chunk then holds its full contents
+        chunk: The CSV text of the new rows, header line included
+    """
+
+    __slots__ = ("dataset", "rewritten", "chunk", "_records")
+
+    def __init__(self, dataset: str, rewritten: bool, chunk: bytes):
+        self.dataset = dataset
+        self.rewritten = rewritten
+        self.chunk = chunk
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """The new rows as dicts (parsed on first access, shared by listeners)"""
+        if self._records is None:
+            reader = csv.DictReader(io.StringIO(self.chunk.decode("utf-8-sig")))
+            self._records = [row for row in reader if any(row.values())]
+        return self._records
+
+    @property
+    def sector(self) -> str:
+        """Sector directory of the dataset ("sales")"""
+        return self.dataset.split("/", 1)[0]
+
+    def __repr__(self) -> str:
+        kind = "rewrite" if self.rewritten else "append"
+        return f"FileChange({self.dataset}, {kind}, bytes={len(self.chunk)})"
+
+
+class _CsvTail:
+    """
+    Tracks how far a CSV file has been consumed
+
+    Appended rows are parsed on the next read. A shrunk, replaced, re-headered
+    or modified-in-place file is reported as a rewrite and read from the start.
+    The first read and rewrites take the whole file; appends only take
+    complete lines.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.header: Optional[bytes] = None
+        self.offset = 0
+        self.guard = b""
+        self.inode: Optional[int] = None
+        self.mtime_ns: Optional[int] = None
+
+    def read(self) -> Tuple[bool, bytes]:
+        """
+        Read the file (first read or rewrite) or the complete lines added since the last read
+
+        Returns:
+            (rewritten, chunk) - rewritten is True when the file has to be
+            consumed from scratch and previous state must be discarded; chunk
+            is empty when no new rows were found
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            rewritten = self.offset > 0
+            self.__init__(self.path)
+            return rewritten, b""
+
+        if stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.offset:
+            return False, b""
+
+        with open(self.path, "rb") as f:
+            header = f.readline()
+            rewritten = False
+            if self.header is not None:
+                rewritten = (
+                    header != self.header
+                    or stat.st_ino != self.inode
+                    or stat.st_size <= self.offset
+                )
+                if not rewritten and self.guard:
+                    f.seek(self.offset - len(self.guard))
+                    rewritten = f.read(len(self.guard)) != self.guard
+            whole_file = rewritten or self.header is None
+            if whole_file:
+                self.header = header
+                self.offset = len(header)
+                self.guard = b""
+            f.seek(self.offset)
+            chunk = f.read()
+
+        if whole_file:
+            # The file is read to EOF, including a last row without a trailing newline
+            end = len(chunk)
+        else:
+            # Appends only consume complete lines; a partially written row is picked up next time
+            end = chunk.rfind(b"\n") + 1
+        chunk = chunk[:end]
+        self.offset += end
+        self.guard = (self.guard + chunk)[-_GUARD_BYTES:]
+        self.inode = stat.st_ino
+        self.mtime_ns = stat.st_mtime_ns
+        return rewritten, (self.header + chunk if end or rewritten else b"")
+
+    def read_consumed(self) -> bytes:
+        """The file's bytes up to the consumed offset (header included)"""
+        if self.header is None:
+            return b""
+        with open(self.path, "rb") as f:
+            return f.read(self.offset)
+
+
+Listener = Callable[[FileChange], None]
+
+
+class DataWatcher:
+    """
+    Watches the CSV files of the data directory by polling
+
+    Each file's new tail is read and parsed once per poll and the resulting
+    FileChange is pushed to every subscriber (datasets, aggregates,
+    snapshots). Appends only carry the appended rows; a rewrite carries the
+    whole file. Polls run in a worker thread; listeners are called there,
+    one change at a time, and must be thread-safe.
+    """
+
+    def __init__(self, data_path: Path = DATA_PATH, interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize data watcher"""
+        self.data_path = data_path
+        self.interval = interval
+        self._tails: Dict[str, _CsvTail] = {}
+        self._listeners: List[Listener] = []
+        # Re-entrant: listeners may call load()/replay() while a poll holds it
+        self._lock = threading.RLock()
+        self._task: Optional[asyncio.Task] = None
+        logger.info("🔧 DataWatcher created")
+
+    def subscribe(self, listener: Listener):
+        """Call listener(change) for every detected file change"""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener):
+        """Stop delivering changes to a listener"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def datasets(self) -> List[str]:
+        """Names of the CSV files currently in the data directory"""
+        if not self.data_path.is_dir():
+            return []
+        return sorted(path.relative_to(self.data_path).as_posix() for path in self.data_path.glob("*/*.csv"))
+
+    def _tail(self, dataset: str) -> _CsvTail:
+        tail = self._tails.get(dataset)
+        if tail is None:
+            tail = self._tails[dataset] = _CsvTail(self.data_path / dataset)
+        return tail
+
+    def consumed(self, dataset: str) -> bool:
+        """Whether the dataset has been read (later reads only return changes)"""
+        tail = self._tails.get(dataset)
+        return tail is not None and tail.header is not None
+
+    def _notify(self, change: FileChange, listeners: Iterable[Listener]):
+        for listener in listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error(f"❌ File change listener failed for {change.dataset}: {str(e)}", exc_info=True)
+
+    def poll(self, datasets: Optional[Iterable[str]] = None) -> List[FileChange]:
+        """
+        Read new data from files and notify subscribers (blocking)
+
+        Args:
+            datasets: Datasets to check (default: every CSV in the data directory)
+
+        Returns:
+            The changes that were detected
+        """
+        changes = []
+        with self._lock:
+            # Tracked files are checked too, so a deleted file is reported
+            names = list(datasets) if datasets is not None else sorted(set(self.datasets()) | set(self._tails))
+            for dataset in names:
+                rewritten, chunk = self._tail(dataset).read()
+                if not rewritten and not chunk:
+                    continue
+                change = FileChange(dataset, rewritten, chunk)
+                if rewritten:
+                    logger.info(f"🔄 {dataset} was rewritten")
+                else:
+                    logger.debug("%s: %d bytes appended", dataset, len(chunk))
+                self._notify(change, list(self._listeners))
+                changes.append(change)
+        return changes
+
+    async def refresh(self, datasets: Optional[Iterable[str]] = None) -> List[FileChange]:
+        """Poll (in a worker thread) and notify subscribers"""
+        return await asyncio.to_thread(self.poll, datasets)
+
+    def replay(self, dataset: str, listener: Listener):
+        """
+        Deliver a dataset's consumed contents to one listener as a rewrite
+
+        Used to backfill state created after the file was first read.
+        Subsequent appends continue exactly where the replayed rows end.
+        """
+        with self._lock:
+            tail = self._tail(dataset)
+            if tail.header is None:
+                return
+            self._notify(FileChange(dataset, True, tail.read_consumed()), [listener])
+
+    def load(self, dataset: str, loader: Callable[[bytes], T]) -> T:
+        """
+        Build state from a dataset's current contents, aligned with future changes
+
+        The file is polled first, then loader(content) runs on the consumed
+        bytes while changes are held back, so a subscriber that registers
+        the result gets every later append exactly once.
+        """
+        with self._lock:
+            self.poll([dataset])
+            return loader(self._tail(dataset).read_consumed())
+
+    async def start(self):
+        """Start polling the data directory in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch_loop())
+            logger.info(f"👀 Watching {self.data_path} every {self.interval:g}s")
+
+    async def stop(self):
+        """Stop background polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("🛑 Data watcher stopped")
+
+    async def _watch_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Data watch poll failed: {str(e)}", exc_info=True)
+
+
+_watcher: Optional[DataWatcher] = None
+
+
+def get_data_watcher() -> DataWatcher:
+    """Get the process-wide data watcher"""
+    global _watcher
+    if _watcher is None:
+        _watcher = DataWatcher()
+    return _watcher
@@ -2,10 +2,64 @@
 Pydantic models for API request/response schemas
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, FiniteFloat, TypeAdapter, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+
+_setattr = object.__setattr__
+
+
+class TrustedModel(BaseModel):
+    """
+    Base for response models that are mostly built from internal, already-typed values
+    
+    Use the regular constructor at trust boundaries (request bodies, external
+    data) and `trusted()` everywhere else to skip re-validating nested payloads.
+    """
+    
+    @classmethod
+    def trusted(cls, **data: Any):
+        """Build an instance without validation (defaults are still applied)"""
+        values = {}
+        for name, required, factory, default in _field_plan(cls):
+            if name in data:
+                values[name] = data[name]
+            elif not required:
+                values[name] = factory() if factory is not None else default
+        # Same state model_construct sets up, without its per-field introspection
+        instance = cls.__new__(cls)
+        _setattr(instance, "__dict__", values)
+        _setattr(instance, "__pydantic_fields_set__", set(data))
+        _setattr(instance, "__pydantic_extra__", None)
+        _setattr(instance, "__pydantic_private__", None)
+        return instance
+    
+    def trusted_dump(self) -> Dict[str, Any]:
+        """
+        Field values as a shallow dict
+        
+        Nested models and payload dicts are not copied; meant for JSON
+        encoders that walk them directly (see app.api.responses.dumps).
+        """
+        return dict(self.__dict__)
+
+
+@lru_cache(maxsize=None)
+def _field_plan(cls: type) -> tuple:
+    """(name, required, default_factory, default) for every field of a model, in order"""
+    return tuple(
+        (name, field.is_required(), field.default_factory, field.default)
+        for name, field in cls.model_fields.items()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """Cached TypeAdapter for validating or serializing non-model types"""
+    return TypeAdapter(tp)
 
 
 class Sector(str, Enum):
@@ -17,23 +71,65 @@ class Sector(str, Enum):
     CROSS_SECTOR = "cross_sector"
 
 
+class ResponseDetail(str, Enum):
+    """How much of the analysis data a query response carries"""
+    SUMMARY = "summary"
+    FULL = "full"
+
+
+class WorkflowContext(BaseModel):
+    """
+    Workflow tuning options read from a query's context
+    
+    Only the keys the workflows read are checked; any other context passes
+    through unchanged. Unset options fall back to the workflow defaults.
+    """
+    top_k: Optional[int] = Field(None, ge=1, description="Tickets returned by escalation prediction")
+    risk_threshold: Optional[FiniteFloat] = Field(None, description="Escalation risk cutoff")
+    approval_threshold: Optional[FiniteFloat] = Field(None, description="Invoice auto-approval limit")
+    approval_thresholds: Optional[List[FiniteFloat]] = Field(
+        None, description="Several auto-approval limits to compare (a list of numbers)"
+    )
+    
+    class Config:
+        extra = "allow"
+
+
 class QueryRequest(BaseModel):
     """Request model for agent queries"""
     query: str = Field(..., description="Natural language query")
     sector: Optional[Sector] = Field(None, description="Target sector (optional)")
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
+    detail: ResponseDetail = Field(
+        ResponseDetail.FULL,
+        description="summary omits record lists (only their totals are returned), full pages through them"
+    )
+    fields: Optional[List[str]] = Field(None, description="Top-level response fields to return (default: all)")
+    page: int = Field(1, ge=1, description="Page of each record list (full detail)")
+    page_size: int = Field(50, ge=1, le=1000, description="Records per page (full detail)")
+    
+    @field_validator("fields")
+    @classmethod
+    def _known_fields(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        if value is not None:
+            unknown = [name for name in value if name not in QueryResponse.model_fields]
+            if unknown:
+                raise ValueError(f"Unknown response fields: {', '.join(unknown)}")
+        return value
     
     class Config:
         json_schema_extra = {
             "example": {
                 "query": "Show me attrition trends this quarter and which departments are at risk",
                 "sector": "hr",
-                "context": {}
+                "context": {},
+                "detail": "summary",
+                "fields": ["intent", "insights", "actions", "data", "response_text"]
             }
         }
 
 
-class Insight(BaseModel):
+class Insight(TrustedModel):
     """Insight model"""
     title: str
     description: str
@@ -43,7 +139,7 @@ class Insight(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
-class Action(BaseModel):
+class Action(TrustedModel):
     """Action model"""
     action_type: str = Field(..., description="Type of action (approve, alert, assign, etc.)")
     target: str = Field(..., description="Target of the action")
@@ -52,7 +148,7 @@ class Action(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
-class QueryResponse(BaseModel):
+class QueryResponse(TrustedModel):
     """Response model for agent queries"""
     query: str
     intent: str = Field(..., description="Detected intent")
@@ -63,6 +159,9 @@ class QueryResponse(BaseModel):
     response_text: str = Field(..., description="Natural language response")
     execution_time: float = Field(..., description="Execution time in seconds")
     timestamp: datetime = Field(default_factory=datetime.now)
+    pagination: Optional[Dict[str, Dict[str, int]]] = Field(
+        None, description="Per record list in data: total, and page/page_size/pages when paged"
+    )
     
     class Config:
         json_schema_extra = {
@@ -79,7 +178,7 @@ class QueryResponse(BaseModel):
         }
 
 
-class DashboardData(BaseModel):
+class DashboardData(TrustedModel):
     """Dashboard data model"""
     sector: Sector
     metrics: Dict[str, Any]
@@ -88,6 +187,40 @@ class DashboardData(BaseModel):
     last_updated: datetime = Field(default_factory=datetime.now)
 
 
+class DashboardField(str, Enum):
+    """Selectable parts of a sector dashboard"""
+    METRICS = "metrics"
+    TRENDS = "trends"
+    ALERTS = "alerts"
+
+
+class DashboardSlice(TrustedModel):
+    """Dashboard data for one sector, limited to the requested fields"""
+    sector: Sector
+    metrics: Optional[Dict[str, Any]] = None
+    trends: Optional[List[Dict[str, Any]]] = None
+    alerts: Optional[List[Dict[str, Any]]] = None
+    last_updated: datetime
+
+
+class DashboardBatch(TrustedModel):
+    """Dashboard data for several sectors in one response"""
+    dashboards: List[DashboardSlice]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dashboards": [
+                    {
+                        "sector": "hr",
+                        "metrics": {"total_employees": 71, "attrition_rate": 4.6, "attrition_period": "Q3"},
+                        "last_updated": "2024-01-01T12:00:00"
+                    }
+                ]
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
@@ -3,6 +3,7 @@ watsonx Orchestrate Agent Integration
 Handles agent initialization, query processing, and orchestration
 """
 
+import asyncio
 import logging
 import os
 from typing import Optional, Dict, Any, List
@@ -10,10 +11,21 @@ from datetime import datetime
 import time
 
 from pydantic_settings import BaseSettings
-from app.models.schemas import QueryResponse, DashboardData, Sector, Insight, Action
+from app.models.schemas import (
+    QueryResponse,
+    DashboardData,
+    DashboardBatch,
+    DashboardField,
+    DashboardSlice,
+    Sector,
+    Insight,
+    Action
+)
 from app.orchestrate.workflows import WorkflowOrchestrator
 from app.orchestrate.watsonx_ai import WatsonXClient, WatsonXSettings
-from app.data import get_data_handler
+from app.data import get_handler_registry
+from app.data.snapshots import DashboardSnapshotStore
+from app.data.watcher import get_data_watcher
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +55,7 @@ class OrchestrateAgent:
         self.is_initialized = False
         self.workflow_orchestrator = None
         self.watsonx_client = None
+        self.dashboard_snapshots = None
         logger.info("🔧 OrchestrateAgent instance created")
     
     async def initialize(self):
@@ -79,6 +92,18 @@ class OrchestrateAgent:
             self.workflow_orchestrator = WorkflowOrchestrator(watsonx_client=self.watsonx_client)
             await self.workflow_orchestrator.initialize()
             
+            # Create the shared data handlers once and keep their state warm
+            logger.info("🗂️ Initializing data handler registry...")
+            await get_handler_registry().warm()
+            
+            # Precompute dashboard snapshots; they are rebuilt on data changes
+            logger.info("📸 Initializing dashboard snapshots...")
+            self.dashboard_snapshots = DashboardSnapshotStore()
+            await self.dashboard_snapshots.start()
+            
+            # Push appended/rewritten data files into datasets, aggregates and snapshots
+            await get_data_watcher().start()
+            
             self.is_initialized = True
             logger.info("✅ watsonx Orchestrate agent initialized successfully")
             
@@ -109,7 +134,7 @@ class OrchestrateAgent:
         context = context or {}
         
         logger.info(f"📝 Processing query: {query}")
-        logger.debug(f"Query parameters: sector={sector}, context={context}")
+        logger.debug("Query parameters: sector=%s, context=%s", sector, context)
         
         try:
             # Step 1: Intent recognition (using workflow orchestrator)
@@ -150,7 +175,7 @@ class OrchestrateAgent:
             execution_time = time.time() - start_time
             
             # Create response
-            response = QueryResponse(
+            response = QueryResponse.trusted(
                 query=query,
                 intent=intent,
                 sectors=detected_sectors,
@@ -174,6 +199,9 @@ class OrchestrateAgent:
         """
         Get dashboard data for a specific sector
         
+        Served from the precomputed snapshot, so last_updated is the time
+        the snapshot was built.
+        
         Args:
             sector: Business sector
         
@@ -183,28 +211,69 @@ class OrchestrateAgent:
         logger.info(f"📊 Fetching dashboard data for sector: {sector.value}")
         
         try:
-            # Get data handler for sector
-            data_handler = get_data_handler(sector)
-            
-            # Get metrics and trends
-            metrics = await data_handler.get_metrics()
-            trends = await data_handler.get_trends()
-            alerts = await data_handler.get_alerts()
-            
-            logger.info(f"✅ Dashboard data retrieved: {len(metrics)} metrics, {len(trends)} trends, {len(alerts)} alerts")
-            
-            return DashboardData(
-                sector=sector,
-                metrics=metrics,
-                trends=trends,
-                alerts=alerts,
-                last_updated=datetime.now()
-            )
+            if self.dashboard_snapshots is None:
+                # Not initialized yet: compute directly (metrics, trends and alerts run concurrently)
+                dashboard = await DashboardSnapshotStore().build(sector)
+            else:
+                dashboard = await self.dashboard_snapshots.get(sector)
+            
+            logger.info(f"✅ Dashboard data retrieved: {len(dashboard.metrics)} metrics, {len(dashboard.trends)} trends, {len(dashboard.alerts)} alerts")
+            return dashboard
             
         except Exception as e:
             logger.error(f"❌ Failed to get dashboard data: {str(e)}", exc_info=True)
             raise
     
+    def get_dashboard_etag(self, sector: Sector, last_updated: datetime) -> str:
+        """
+        Entity tag for a sector dashboard
+        
+        Derived from the snapshot version and build time, so it only changes
+        when the snapshot is rebuilt.
+        """
+        version = self.dashboard_snapshots.version(sector) if self.dashboard_snapshots else 0
+        return f'"{sector.value}-{version}-{int(last_updated.timestamp() * 1_000_000)}"'
+    
+    async def get_dashboard_batch(
+        self,
+        sectors: List[Sector],
+        fields: Optional[List[DashboardField]] = None
+    ) -> DashboardBatch:
+        """
+        Get dashboard data for several sectors at once
+        
+        Sectors are fetched concurrently from the shared snapshot store.
+        
+        Args:
+            sectors: Business sectors, in the order they should be returned
+            fields: Parts of each dashboard to include (default: all)
+        
+        Returns:
+            DashboardBatch with one entry per sector
+        """
+        fields = fields or list(DashboardField)
+        logger.info(f"📊 Fetching dashboard batch: sectors={[s.value for s in sectors]}, fields={[f.value for f in fields]}")
+        
+        dashboards = await asyncio.gather(*(self.get_dashboard_data(sector) for sector in sectors))
+        
+        return DashboardBatch.trusted(
+            dashboards=[
+                DashboardSlice.trusted(
+                    sector=dashboard.sector,
+                    last_updated=dashboard.last_updated,
+                    **{field.value: getattr(dashboard, field.value) for field in fields}
+                )
+                for dashboard in dashboards
+            ]
+        )
+    
+    async def shutdown(self):
+        """Stop background tasks started by initialize()"""
+        await get_data_watcher().stop()
+        if self.dashboard_snapshots is not None:
+            await self.dashboard_snapshots.stop()
+        logger.info("👋 OrchestrateAgent shut down")
+    
     async def _generate_response_text(
         self,
         query: str,
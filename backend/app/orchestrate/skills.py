@@ -3,11 +3,15 @@ Digital Skills Manager
 Mocks enterprise integrations (Workday, Salesforce, ServiceNow, SAP)
 """
 
+import asyncio
+import io
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Literal, Optional
 from pathlib import Path
 import csv
 
+from pydantic_settings import BaseSettings
+
 # Try to import pandas, fallback to csv module if not available
 try:
     import pandas as pd
@@ -15,23 +19,133 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+from app.data.dataset import Dataset, DatasetSchema
+from app.data.store import DatasetQuery, SqliteDatasetStore
+from app.data.watcher import FileChange, get_data_watcher
+from app.utils.logger import lazy
+
 logger = logging.getLogger(__name__)
 
+# Column storage and key indexes per data file (see DatasetSchema); unlisted files load untyped.
+# Only low-cardinality columns are categorical: ids and names are packed strings.
+DATASET_SCHEMAS = {
+    "hr/attrition_data.csv": DatasetSchema(
+        categories=["department", "quarter"],
+        int32=["employees_left", "total_employees"],
+        float32=["attrition_rate"],
+        hash_keys=["department"]
+    ),
+    "hr/employee_data.csv": DatasetSchema(
+        categories=["department", "position", "status"],
+        int32=["salary"],
+        dates=["hire_date"],
+        hash_keys=["department", "status"]
+    ),
+    "hr/satisfaction_scores.csv": DatasetSchema(
+        categories=["department", "quarter"],
+        int32=["response_count"],
+        float32=["satisfaction_score"],
+        hash_keys=["department"]
+    ),
+    "sales/customer_data.csv": DatasetSchema(
+        categories=["industry"],
+        int32=["revenue", "performance"]
+    ),
+    "sales/deals_data.csv": DatasetSchema(
+        categories=["status"],
+        packed=["customer_id", "customer_name"],
+        int32=["amount"],
+        dates=["close_date"],
+        hash_keys=["customer_id", "status"],
+        sorted_keys=["amount"]
+    ),
+    "sales/pipeline_data.csv": DatasetSchema(
+        categories=["stage", "status"],
+        packed=["customer_name"],
+        int32=["value", "probability"],
+        dates=["close_date"],
+        hash_keys=["status"],
+        sorted_keys=["value"]
+    ),
+    "service/escalations.csv": DatasetSchema(
+        categories=["type", "category", "status"],
+        packed=["ticket_id"],
+        int32=["financial_impact", "cost"],
+        hash_keys=["ticket_id"]
+    ),
+    "service/response_times.csv": DatasetSchema(
+        categories=["month"],
+        int32=["tickets_processed"],
+        float32=["avg_response_time_hours"]
+    ),
+    "service/tickets_data.csv": DatasetSchema(
+        categories=["priority", "status"],
+        packed=["customer_id", "customer_name"],
+        int32=["age_days"],
+        dates=["created_date"],
+        hash_keys=["ticket_id", "customer_id", "status"],
+        sorted_keys=["age_days"]
+    ),
+    "finance/budget_data.csv": DatasetSchema(
+        categories=["department", "quarter"],
+        int32=["allocated", "spent"],
+        float32=["utilization"],
+        hash_keys=["department"]
+    ),
+    "finance/cashflow_data.csv": DatasetSchema(
+        categories=["month"],
+        int32=["cash_flow", "revenue", "expenses", "amount"]
+    ),
+    "finance/invoices_data.csv": DatasetSchema(
+        categories=["status", "category"],
+        packed=["vendor"],
+        int32=["amount"],
+        dates=["due_date"],
+        hash_keys=["status"],
+        sorted_keys=["amount"]
+    ),
+}
+
 if not HAS_PANDAS:
     logger.info("⚠️ pandas not available, using built-in csv module")
 
 
+class SkillsSettings(BaseSettings):
+    """Digital skills data storage configuration"""
+    # "memory": datasets cached per worker; "sqlite": imported into SQLite tables
+    storage_engine: Literal["memory", "sqlite"] = "memory"
+    # SQLite database file (default: skills.db in the data directory)
+    sqlite_path: Optional[Path] = None
+    
+    class Config:
+        env_prefix = "SKILLS_"
+        env_file = ".env"
+        case_sensitive = False
+        extra = "ignore"
+
+
 class DigitalSkillsManager:
     """
     Manages digital skills (mocked enterprise integrations)
     Simulates Workday, Salesforce, ServiceNow, and SAP APIs
     """
     
-    def __init__(self):
+    def __init__(self, settings: Optional[SkillsSettings] = None):
         """Initialize digital skills manager"""
         self.skills = {}
-        self.data_path = Path(__file__).parent.parent.parent / "data"
-        logger.info("🔧 DigitalSkillsManager created")
+        self.settings = settings or SkillsSettings()
+        # Loaded datasets stay cached and follow file appends/rewrites via the watcher
+        self.watcher = get_data_watcher()
+        self.data_path = self.watcher.data_path
+        self._datasets: Dict[str, Dataset] = {}
+        self.store: Optional[SqliteDatasetStore] = None
+        if self.settings.storage_engine == "sqlite":
+            self.store = SqliteDatasetStore(
+                self.settings.sqlite_path or self.data_path / "skills.db",
+                schemas=DATASET_SCHEMAS,
+                watcher=self.watcher
+            )
+        logger.info(f"🔧 DigitalSkillsManager created ({self.settings.storage_engine} storage)")
     
     async def initialize(self):
         """Initialize all digital skills"""
@@ -60,13 +174,15 @@ class DigitalSkillsManager:
         Args:
             skill_name: Name of the skill (workday_hr, salesforce, etc.)
             operation: Operation to perform
-            parameters: Operation parameters
+            parameters: Operation parameters; data operations accept a
+                pushed-down query (columns, where, range, group_by,
+                aggregates, order_by, limit - see DatasetQuery)
         
         Returns:
             Result data from the skill
         """
         logger.info(f"🔧 Executing skill: {skill_name}.{operation}")
-        logger.debug(f"Parameters: {parameters}")
+        logger.debug("Parameters: %s", parameters)
         
         # Check if we should use mock data or real execution
         import os
@@ -99,11 +215,11 @@ class DigitalSkillsManager:
         logger.debug(f"Workday HR skill: {operation}")
         
         if operation == "get_attrition_data":
-            return await self._load_csv_data("hr", "attrition_data.csv")
+            return await self._load_csv_data("hr", "attrition_data.csv", parameters)
         elif operation == "get_satisfaction_data":
-            return await self._load_csv_data("hr", "satisfaction_scores.csv")
+            return await self._load_csv_data("hr", "satisfaction_scores.csv", parameters)
         elif operation == "get_hiring_plan_data":
-            return await self._load_csv_data("hr", "employee_data.csv")
+            return await self._load_csv_data("hr", "employee_data.csv", parameters)
         else:
             logger.warning(f"Unknown Workday operation: {operation}")
             return {}
@@ -114,11 +230,11 @@ class DigitalSkillsManager:
         logger.debug(f"Salesforce skill: {operation}")
         
         if operation == "get_pipeline_data":
-            return await self._load_csv_data("sales", "pipeline_data.csv")
+            return await self._load_csv_data("sales", "pipeline_data.csv", parameters)
         elif operation == "get_deals_data":
-            return await self._load_csv_data("sales", "deals_data.csv")
+            return await self._load_csv_data("sales", "deals_data.csv", parameters)
         elif operation == "get_performance_data":
-            return await self._load_csv_data("sales", "customer_data.csv")
+            return await self._load_csv_data("sales", "customer_data.csv", parameters)
         else:
             logger.warning(f"Unknown Salesforce operation: {operation}")
             return {}
@@ -129,11 +245,11 @@ class DigitalSkillsManager:
         logger.debug(f"ServiceNow skill: {operation}")
         
         if operation == "get_tickets_data":
-            return await self._load_csv_data("service", "tickets_data.csv")
+            return await self._load_csv_data("service", "tickets_data.csv", parameters)
         elif operation == "get_complaints_data":
-            return await self._load_csv_data("service", "escalations.csv")
+            return await self._load_csv_data("service", "escalations.csv", parameters)
         elif operation == "get_response_times":
-            return await self._load_csv_data("service", "response_times.csv")
+            return await self._load_csv_data("service", "response_times.csv", parameters)
         else:
             logger.warning(f"Unknown ServiceNow operation: {operation}")
             return {}
@@ -144,59 +260,118 @@ class DigitalSkillsManager:
         logger.debug(f"SAP skill: {operation}")
         
         if operation == "get_invoices_data":
-            return await self._load_csv_data("finance", "invoices_data.csv")
+            return await self._load_csv_data("finance", "invoices_data.csv", parameters)
         elif operation == "get_financial_data":
-            return await self._load_csv_data("finance", "cashflow_data.csv")
+            return await self._load_csv_data("finance", "cashflow_data.csv", parameters)
         elif operation == "get_cashflow_data":
-            return await self._load_csv_data("finance", "cashflow_data.csv")
+            return await self._load_csv_data("finance", "cashflow_data.csv", parameters)
         elif operation == "get_budget_data":
-            return await self._load_csv_data("finance", "budget_data.csv")
+            return await self._load_csv_data("finance", "budget_data.csv", parameters)
         else:
             logger.warning(f"Unknown SAP operation: {operation}")
             return {}
     
-    async def _load_csv_data(self, sector: str, filename: str) -> Dict[str, Any]:
+    async def _load_csv_data(
+        self,
+        sector: str,
+        filename: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Load CSV data file
         
+        With the memory engine the file is parsed once and cached; with the
+        SQLite engine it is imported once and the query runs as SQL, so only
+        the selected rows are loaded.
+        
         Args:
             sector: Sector name (hr, sales, service, finance)
             filename: CSV filename
+            parameters: Skill parameters, possibly holding a pushed-down query
         
         Returns:
-            Dictionary with data
+            Dictionary with data (a columnar Dataset), row count and columns
         """
         file_path = self.data_path / sector / filename
+        name = f"{sector}/{filename}"
         
         if not file_path.exists():
             logger.warning(f"⚠️ Data file not found: {file_path}")
             return {"error": "Data file not found", "file": str(file_path)}
         
         try:
-            if HAS_PANDAS:
-                # Use pandas if available (faster)
-                df = pd.read_csv(file_path)
-                logger.debug(f"✅ Loaded {len(df)} rows from {filename} (using pandas)")
-                return {
-                    "data": df.to_dict(orient="records"),
-                    "count": len(df),
-                    "columns": df.columns.tolist()
-                }
+            query = DatasetQuery.from_parameters(parameters)
+            if self.store is not None:
+                dataset = await asyncio.to_thread(self.store.select, name, query)
             else:
-                # Fallback to built-in csv module
-                records = []
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    records = list(reader)
-                
-                columns = list(reader.fieldnames) if records else []
-                logger.debug(f"✅ Loaded {len(records)} rows from {filename} (using csv module)")
-                return {
-                    "data": records,
-                    "count": len(records),
-                    "columns": columns
-                }
+                dataset = await self._cached_dataset(name)
+                if query is not None:
+                    dataset = query.apply(dataset)
+            return {
+                "data": dataset,
+                "count": len(dataset),
+                "columns": dataset.column_names
+            }
         except Exception as e:
             logger.error(f"❌ Failed to load CSV: {str(e)}", exc_info=True)
             return {"error": str(e), "file": str(file_path)}
+    
+    async def _cached_dataset(self, name: str) -> Dataset:
+        """The whole dataset from the cache, loading it on first use"""
+        dataset = self._datasets.get(name)
+        if dataset is not None:
+            # Appended rows are folded in (or a rewritten file dropped) by _on_change
+            await self.watcher.refresh([name])
+            dataset = self._datasets.get(name)
+        if dataset is None:
+            dataset = await asyncio.to_thread(self.watcher.load, name, lambda content: self._cache(name, content))
+        return dataset
+    
+    def _parse(self, name: str, content: bytes, indexed: bool = True) -> Dataset:
+        """
+        Parse CSV bytes (header included) into a Dataset using the file's schema
 
+        indexed=False skips the key indexes (appended chunks are folded into
+        the cached dataset's indexes by Dataset.concat).
+        """
+        schema = DATASET_SCHEMAS.get(name)
+        if HAS_PANDAS:
+            # Use pandas if available (faster)
+            df = pd.read_csv(io.BytesIO(content))
+            if schema is not None:
+                df = schema.apply(df)
+            dataset = Dataset.from_frame(df, name=name, packed=schema.packed if schema is not None else ())
+        else:
+            # Fallback to built-in csv module
+            reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
+            records = list(reader)
+            if schema is not None:
+                schema.intern(records)
+            dataset = Dataset.from_records(records, columns=list(reader.fieldnames or []), name=name)
+        if schema is not None and indexed:
+            schema.index(dataset)
+        return dataset
+    
+    def _cache(self, name: str, content: bytes) -> Dataset:
+        """Load a dataset into the cache (called by the watcher, aligned with later changes)"""
+        dataset = self._parse(name, content)
+        self._datasets[name] = dataset
+        self.watcher.subscribe(self._on_change)
+        logger.debug(
+            "✅ Loaded %d rows from %s (%s KiB)",
+            len(dataset), name, lazy(lambda: round(dataset.nbytes / 1024, 1))
+        )
+        return dataset
+    
+    def _on_change(self, change: FileChange):
+        """Watcher listener: append new rows to a cached dataset, drop it on rewrite"""
+        dataset = self._datasets.get(change.dataset)
+        if dataset is None:
+            return
+        if change.rewritten:
+            del self._datasets[change.dataset]
+            logger.info(f"🔄 {change.dataset} was rewritten, reloading on next use")
+            return
+        appended = self._parse(change.dataset, change.chunk, indexed=False)
+        self._datasets[change.dataset] = dataset.concat(appended)
+        logger.debug("Appended %d rows to cached %s", len(appended), change.dataset)
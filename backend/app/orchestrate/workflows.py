@@ -4,12 +4,15 @@ Defines and executes workflows for different intents and sectors
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime
 
 from app.models.schemas import Sector, Insight, Action
 from app.orchestrate.skills import DigitalSkillsManager
 from app.data import get_data_handler
+from app.data.finance_data import DEFAULT_APPROVAL_THRESHOLD, PENDING_INVOICE_STATUSES
+from app.data.sales_data import CLOSED_DEAL_STATUSES, RESOLVED_TICKET_STATUSES
+from app.data.service_data import ESCALATION_RISK_THRESHOLD, ESCALATION_TOP_K
 
 logger = logging.getLogger(__name__)
 
@@ -208,7 +211,7 @@ class WorkflowOrchestrator:
             Dictionary with insights, actions, and data
         """
         logger.info(f"🔄 Executing workflow for intent: {intent}")
-        logger.debug(f"Workflow parameters: sectors={sectors}, context={context}")
+        logger.debug("Workflow parameters: sectors=%s, context=%s", sectors, context)
         
         # Get workflow configuration
         workflow_config = self.intent_mappings.get(intent, self.intent_mappings["general_query"])
@@ -245,6 +248,45 @@ class WorkflowOrchestrator:
         else:
             return await self._execute_general_workflow(query, sectors, context)
     
+    async def _matching_values(
+        self,
+        skill: str,
+        operation: str,
+        column: str,
+        keep: Callable[[Any], bool]
+    ) -> Optional[List[Any]]:
+        """
+        Distinct values of a column that pass keep, for a pushed-down where filter
+        
+        Status columns are matched case-insensitively by the handlers, so the
+        distinct values are fetched first (one GROUP BY on an indexed column)
+        and the matching ones are passed on as exact values.
+        
+        Returns:
+            The values, or None when the column cannot be filtered exactly
+            (it is missing, or holds empty values a where filter cannot match)
+        """
+        result = await self.skills_manager.execute_skill(skill, operation, {"group_by": [column]})
+        if "data" not in result:
+            return None
+        values = result["data"].tolist(column)
+        if any(value is None or value != value for value in values):
+            return None
+        return [value for value in values if keep(value)]
+    
+    async def _status_query(
+        self,
+        skill: str,
+        operation: str,
+        statuses: tuple,
+        exclude: bool = False
+    ) -> Dict[str, Any]:
+        """Skill parameters selecting the rows whose status is (exclude: is not) one of statuses"""
+        values = await self._matching_values(
+            skill, operation, "status", lambda value: (str(value).strip().lower() in statuses) != exclude
+        )
+        return {"where": {"status": values}} if values is not None else {}
+    
     # Workflow execution methods
     async def _execute_hr_attrition_workflow(
         self,
@@ -255,8 +297,11 @@ class WorkflowOrchestrator:
         """Execute HR attrition analysis workflow"""
         logger.info("🔄 Executing HR attrition analysis workflow")
         
-        # Get data using digital skills
-        hr_data = await self.skills_manager.execute_skill("workday_hr", "get_attrition_data", {})
+        # Get data using digital skills; only the latest quarter is analyzed
+        quarters = await self._matching_values("workday_hr", "get_attrition_data", "quarter", lambda value: True)
+        hr_data = await self.skills_manager.execute_skill(
+            "workday_hr", "get_attrition_data", {"where": {"quarter": [max(quarters)]}} if quarters else {}
+        )
         
         # Process data
         data_handler = get_data_handler(Sector.HR)
@@ -272,7 +317,7 @@ class WorkflowOrchestrator:
                 description = ai_insight
 
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Attrition Trend Analysis",
                 description=description,
                 sector=Sector.HR,
@@ -286,7 +331,7 @@ class WorkflowOrchestrator:
         actions = []
         if high_risk_depts:
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="generate_retention_plan",
                     target=f"departments: {', '.join(high_risk_depts)}",
                     parameters={"departments": high_risk_depts},
@@ -310,8 +355,13 @@ class WorkflowOrchestrator:
         logger.info("🔄 Executing cross-sector correlation workflow")
         
         # Get data from multiple sectors
-        hr_data = await self.skills_manager.execute_skill("workday_hr", "get_satisfaction_data", {})
-        sales_data = await self.skills_manager.execute_skill("salesforce", "get_performance_data", {})
+        # Only the averaged columns are needed; the storage engine projects them
+        hr_data = await self.skills_manager.execute_skill(
+            "workday_hr", "get_satisfaction_data", {"columns": ["satisfaction_score"]}
+        )
+        sales_data = await self.skills_manager.execute_skill(
+            "salesforce", "get_performance_data", {"columns": ["performance"]}
+        )
         
         # Cross-sector analysis
         hr_handler = get_data_handler(Sector.HR)
@@ -320,7 +370,7 @@ class WorkflowOrchestrator:
         correlation = await hr_handler.correlate_with_sales(hr_data, sales_data)
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Satisfaction-Sales Correlation",
                 description=correlation.get("description", "Correlation analysis completed"),
                 sector=Sector.CROSS_SECTOR,
@@ -349,7 +399,7 @@ class WorkflowOrchestrator:
         analysis = await data_handler.analyze_pipeline(sales_data)
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Pipeline Analysis",
                 description=f"Pipeline health: {analysis.get('health_score', 0):.1f}/100",
                 sector=Sector.SALES,
@@ -363,7 +413,7 @@ class WorkflowOrchestrator:
         actions = []
         for deal in urgent_deals[:3]:  # Limit to 3
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="assign_task",
                     target=f"deal: {deal.get('id', 'unknown')}",
                     parameters={"deal_id": deal.get("id"), "priority": "high"},
@@ -386,16 +436,26 @@ class WorkflowOrchestrator:
         """Execute blocking ticket analysis workflow"""
         logger.info("🔄 Executing blocking ticket analysis workflow")
         
-        sales_data = await self.skills_manager.execute_skill("salesforce", "get_deals_data", {})
-        service_data = await self.skills_manager.execute_skill("servicenow", "get_tickets_data", {})
+        # Only open deals and unresolved tickets are joined; the storage engine filters them
+        sales_data = await self.skills_manager.execute_skill(
+            "salesforce", "get_deals_data",
+            await self._status_query("salesforce", "get_deals_data", CLOSED_DEAL_STATUSES, exclude=True)
+        )
+        service_data = await self.skills_manager.execute_skill(
+            "servicenow", "get_tickets_data",
+            await self._status_query("servicenow", "get_tickets_data", RESOLVED_TICKET_STATUSES, exclude=True)
+        )
         
         sales_handler = get_data_handler(Sector.SALES)
         blocking_analysis = await sales_handler.identify_blocking_tickets(sales_data, service_data)
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Blocking Tickets Analysis",
-                description=f"Found {len(blocking_analysis.get('blocking_tickets', []))} tickets blocking deals",
+                description=(
+                    f"Found {blocking_analysis.get('total_blocking', 0)} tickets blocking "
+                    f"{blocking_analysis.get('deals_affected', 0)} open deals"
+                ),
                 sector=Sector.CROSS_SECTOR,
                 confidence=0.88,
                 data=blocking_analysis
@@ -405,11 +465,12 @@ class WorkflowOrchestrator:
         # Escalate blocking tickets
         actions = []
         for ticket in blocking_analysis.get("blocking_tickets", [])[:3]:
+            ticket_id = ticket.get("ticket_id") or ticket.get("id")
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="escalate_ticket",
-                    target=f"ticket: {ticket.get('id', 'unknown')}",
-                    parameters={"ticket_id": ticket.get("id"), "priority": "critical"},
+                    target=f"ticket: {ticket_id or 'unknown'}",
+                    parameters={"ticket_id": ticket_id, "deal_id": ticket.get("deal_id"), "priority": "critical"},
                     status="completed"
                 )
             )
@@ -429,14 +490,21 @@ class WorkflowOrchestrator:
         """Execute escalation prediction workflow"""
         logger.info("🔄 Executing escalation prediction workflow")
         
-        service_data = await self.skills_manager.execute_skill("servicenow", "get_tickets_data", {})
+        # Every ticket is scored, but only from these columns
+        service_data = await self.skills_manager.execute_skill(
+            "servicenow", "get_tickets_data", {"columns": ["ticket_id", "id", "age_days", "priority", "status"]}
+        )
         data_handler = get_data_handler(Sector.SERVICE)
-        prediction = await data_handler.predict_escalations(service_data)
+        prediction = await data_handler.predict_escalations(
+            service_data,
+            k=context.get("top_k", ESCALATION_TOP_K),
+            threshold=context.get("risk_threshold", float(ESCALATION_RISK_THRESHOLD))
+        )
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Escalation Prediction",
-                description=f"Predicted {len(prediction.get('high_risk_tickets', []))} tickets likely to escalate",
+                description=f"Predicted {prediction.get('total_high_risk', 0)} tickets likely to escalate",
                 sector=Sector.SERVICE,
                 confidence=0.87,
                 data=prediction
@@ -447,7 +515,7 @@ class WorkflowOrchestrator:
         actions = []
         for ticket in prediction.get("high_risk_tickets", [])[:3]:
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="assign_senior_agent",
                     target=f"ticket: {ticket.get('id', 'unknown')}",
                     parameters={"ticket_id": ticket.get("id"), "agent_level": "senior"},
@@ -470,14 +538,16 @@ class WorkflowOrchestrator:
         """Execute complaint impact analysis workflow"""
         logger.info("🔄 Executing complaint impact analysis workflow")
         
-        service_data = await self.skills_manager.execute_skill("servicenow", "get_complaints_data", {})
+        service_data = await self.skills_manager.execute_skill(
+            "servicenow", "get_complaints_data", {"columns": ["type", "category", "financial_impact", "cost"]}
+        )
         finance_data = await self.skills_manager.execute_skill("sap", "get_financial_data", {})
         
         service_handler = get_data_handler(Sector.SERVICE)
         impact_analysis = await service_handler.analyze_financial_impact(service_data, finance_data)
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Financial Impact Analysis",
                 description=f"Top 5 complaints have ${impact_analysis.get('total_impact', 0):,.0f} financial impact",
                 sector=Sector.CROSS_SECTOR,
@@ -501,12 +571,19 @@ class WorkflowOrchestrator:
         """Execute auto-approval workflow"""
         logger.info("🔄 Executing auto-approval workflow")
         
-        finance_data = await self.skills_manager.execute_skill("sap", "get_invoices_data", {})
+        # Only pending invoices are considered; the storage engine filters them
+        finance_data = await self.skills_manager.execute_skill(
+            "sap", "get_invoices_data", await self._status_query("sap", "get_invoices_data", PENDING_INVOICE_STATUSES)
+        )
         data_handler = get_data_handler(Sector.FINANCE)
-        approval_result = await data_handler.auto_approve_invoices(finance_data, threshold=5000)
+        approval_result = await data_handler.auto_approve_invoices(
+            finance_data,
+            threshold=context.get("approval_threshold", float(DEFAULT_APPROVAL_THRESHOLD)),
+            thresholds=context.get("approval_thresholds") or None
+        )
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Auto-Approval Summary",
                 description=f"Approved {approval_result.get('approved_count', 0)} invoices automatically",
                 sector=Sector.FINANCE,
@@ -519,10 +596,10 @@ class WorkflowOrchestrator:
         actions = []
         for invoice in approval_result.get("approved_invoices", []):
             actions.append(
-                Action(
+                Action.trusted(
                     action_type="approve_invoice",
-                    target=f"invoice: {invoice.get('id', 'unknown')}",
-                    parameters={"invoice_id": invoice.get("id"), "amount": invoice.get("amount")},
+                    target=f"invoice: {invoice.get('invoice_id') or invoice.get('id', 'unknown')}",
+                    parameters={"invoice_id": invoice.get("invoice_id") or invoice.get("id"), "amount": invoice.get("amount")},
                     status="completed"
                 )
             )
@@ -542,14 +619,16 @@ class WorkflowOrchestrator:
         """Execute budget-hiring analysis workflow"""
         logger.info("🔄 Executing budget-hiring analysis workflow")
         
-        finance_data = await self.skills_manager.execute_skill("sap", "get_cashflow_data", {})
-        hr_data = await self.skills_manager.execute_skill("workday_hr", "get_hiring_plan_data", {})
+        finance_data = await self.skills_manager.execute_skill(
+            "sap", "get_cashflow_data", {"columns": ["cash_flow", "amount"]}
+        )
+        hr_data = await self.skills_manager.execute_skill("workday_hr", "get_hiring_plan_data", {"columns": ["status"]})
         
         finance_handler = get_data_handler(Sector.FINANCE)
         analysis = await finance_handler.analyze_hiring_budget(finance_data, hr_data)
         
         insights = [
-            Insight(
+            Insight.trusted(
                 title="Budget-Hiring Analysis",
                 description=analysis.get("recommendation", "Budget analysis completed"),
                 sector=Sector.CROSS_SECTOR,
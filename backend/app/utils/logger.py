@@ -1,23 +1,157 @@
 """
 Logging configuration and utilities
 Provides comprehensive debug logging at every stage
+
+Records are handed to a background writer thread through a queue so request
+handlers never block on disk I/O. The JSON rendering is done once per record
+and shared by every file sink.
 """
 
+import atexit
+import copy
+import itertools
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pythonjsonlogger import jsonlogger
 import os
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+# Hot-path loggers whose DEBUG records are sampled (keep 1 in N)
+DEFAULT_DEBUG_SAMPLING: Dict[str, int] = {
+    "app.data": 10,
+    "app.orchestrate.skills": 10,
+}
+
+_listener: Optional[QueueListener] = None
+
+
+class LazyPayload:
+    """
+    Defers building a log payload until the record is actually formatted
+
+    Use as a logging argument: logger.debug("Response: %s", lazy(response.dict))
+    The callable only runs when the record passes level and sampling checks.
+    """
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    __repr__ = __str__
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> LazyPayload:
+    """Wrap a payload builder so it is only evaluated when the record is emitted"""
+    return LazyPayload(func, *args)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps 1 in N DEBUG records for selected loggers
+
+    Rates are keyed by logger name and apply to child loggers as well;
+    the most specific configured name wins. Records above DEBUG always pass.
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self.rates = {name: max(1, int(rate)) for name, rate in rates.items()}
+        self._counters: Dict[str, itertools.count] = {}
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def _resolve(self, name: str) -> Optional[str]:
+        if name not in self._resolved:
+            match = None
+            for prefix in self.rates:
+                if name == prefix or name.startswith(prefix + "."):
+                    if match is None or len(prefix) > len(match):
+                        match = prefix
+            self._resolved[name] = match
+            self._counters.setdefault(match, itertools.count())
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        prefix = self._resolve(record.name)
+        if prefix is None:
+            return True
+        return next(self._counters[prefix]) % self.rates[prefix] == 0
 
 
-def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
+class SharedFormatter(logging.Formatter):
+    """
+    Formats a record once and reuses the rendered text for every sink
+
+    Handlers sharing one instance of this formatter only pay for a single
+    formatting pass per record.
+    """
+
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self._formatter = formatter
+        self._cache_attr = f"_rendered_{id(self)}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        rendered = record.__dict__.get(self._cache_attr)
+        if rendered is None:
+            rendered = self._formatter.format(record)
+            record.__dict__[self._cache_attr] = rendered
+        return rendered
+
+
+class _ResolvingQueueHandler(QueueHandler):
+    """
+    Queue handler that resolves the message in the calling thread
+
+    Unlike the stdlib default it keeps the record's structured fields intact
+    (no pre-rendering) so the writer thread can format it once per formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _stop_listener():
+    """Flush queued records and stop the background writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_dir: str = "logs",
+    debug_sampling: Optional[Dict[str, int]] = None
+):
     """
     Setup comprehensive logging configuration
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory to store log files
+        debug_sampling: Logger name -> N, keep 1 in N DEBUG records
+            (defaults to DEFAULT_DEBUG_SAMPLING, pass {} to disable)
     """
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
@@ -27,7 +161,8 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers (and drain a previous writer thread)
+    _stop_listener()
     root_logger.handlers = []
     
     # Console handler with colored output
@@ -49,10 +184,10 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     )
     file_handler.setLevel(logging.DEBUG)
     
-    # JSON formatter for file logs
-    json_formatter = jsonlogger.JsonFormatter(
+    # JSON formatter for file logs, rendered once and shared by both files
+    json_formatter = SharedFormatter(jsonlogger.JsonFormatter(
         '%(asctime)s %(levelname)s %(name)s %(message)s'
-    )
+    ))
     file_handler.setFormatter(json_formatter)
     
     # Debug file handler (separate file for debug logs)
@@ -64,10 +199,25 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     debug_handler.setLevel(logging.DEBUG)
     debug_handler.setFormatter(json_formatter)
     
+    # Sinks are written by a background thread fed through a queue
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        debug_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    
+    queue_handler = _ResolvingQueueHandler(log_queue)
+    sampling = DEFAULT_DEBUG_SAMPLING if debug_sampling is None else debug_sampling
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    
     # Add handlers
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(debug_handler)
+    root_logger.addHandler(queue_handler)
     
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -76,6 +226,8 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     logging.info("✅ Logging system initialized")
     logging.info(f"📝 Log level: {log_level}")
     logging.info(f"📁 Log directory: {log_path.absolute()}")
+    if sampling:
+        logging.info(f"🎯 DEBUG sampling: {sampling}")
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -89,4 +241,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
-
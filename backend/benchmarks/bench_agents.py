@@ -0,0 +1,96 @@
+"""
+Benchmark: agent query throughput with per-call connections vs the pool
+
+Builds a seeded orchestrate.db in a temporary directory and runs the agent
+query mix (employee lookup, sales by region, ticket stats, department
+expenses) from several threads with (a) a fresh sqlite3 connection per query,
+as the agents used to, (b) the shared WAL connection pool and (c) the pool
+over an in-memory replica. Reports queries per second; results are checked
+to match.
+
+Usage (from backend/):
+    python -m benchmarks.bench_agents --queries 2000 --threads 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import agents
+import setup_database
+
+
+def _query_mix():
+    return [
+        (agents.HRAgent, "get_employee_details", ("Alice",)),
+        (agents.SalesAgent, "get_sales_by_region", ()),
+        (agents.CustomerServiceAgent, "get_ticket_stats", ()),
+        (agents.FinanceAgent, "get_department_expenses", ()),
+    ]
+
+
+class PerCallAgent(agents.BaseAgent):
+    """The original execute_query: open, query and close a connection per call"""
+
+    def execute_query(self, query, params=()):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(query, params).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+
+def _agent(base, mode, db_path):
+    attributes = {"db_path": db_path, "memory_replica": mode == "replica"}
+    bases = (PerCallAgent, base) if mode == "per-call" else (base,)
+    return type(f"{mode}-{base.__name__}", bases, attributes)()
+
+
+def _run(mode, db_path, queries, threads):
+    mix = [getattr(_agent(base, mode, db_path), name) for base, name, _ in _query_mix()]
+    arguments = [args for _, _, args in _query_mix()]
+    # Open the pool (and copy the replica) before timing
+    results = [query(*args) for query, args in zip(mix, arguments)]
+
+    def worker(count):
+        for i in range(count):
+            mix[i % len(mix)](*arguments[i % len(mix)])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(worker, [queries // threads] * threads))
+    return queries / (time.perf_counter() - start), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--queries", type=int, default=2000, help="Agent queries per mode")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent callers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "orchestrate.db")
+        with contextlib.closing(sqlite3.connect(db_path)) as conn, contextlib.redirect_stdout(io.StringIO()):
+            setup_database.create_tables(conn)
+            setup_database.seed_data(conn)
+
+        runs = {mode: _run(mode, db_path, args.queries, args.threads) for mode in ("per-call", "pool", "replica")}
+        for pool in agents._pools.values():
+            pool.close()
+
+    assert runs["per-call"][1] == runs["pool"][1] == runs["replica"][1], "modes returned different rows"
+
+    baseline = runs["per-call"][0]
+    print(f"{args.queries:,} agent queries on {args.threads} threads\n")
+    print(f"{'mode':<10} {'queries/s':>10} {'speedup':>8}")
+    for mode, (throughput, _) in runs.items():
+        print(f"{mode:<10} {throughput:>10,.0f} {throughput / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark FinanceDataHandler.auto_approve_invoices threshold exploration
+
+Compares re-scanning every invoice per threshold (the previous
+implementation) with one sorted amount index answering a threshold sweep.
+
+Usage (from backend/):
+    python -m benchmarks.bench_approval --invoices 500000 --thresholds 200
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import numpy as np
+
+from app.data.finance_data import FinanceDataHandler
+
+STATUSES = np.array(["pending", "approved", "paid", "overdue"])
+
+
+def _invoice_records(rows: int, seed: int = 42):
+    """Synthetic invoice records (amounts as strings, as read from CSV)"""
+    rng = np.random.default_rng(seed)
+    return [
+        {"invoice_id": f"INV-{i}", "amount": amount, "status": status}
+        for i, (amount, status) in enumerate(zip(
+            rng.integers(100, 50_000, rows).astype(str).tolist(),
+            STATUSES[rng.integers(0, 4, rows)].tolist(),
+        ))
+    ]
+
+
+def _legacy_approve(records, threshold):
+    """The previous implementation (parse and filter every invoice)"""
+    approved = []
+    for invoice in records:
+        amount = invoice.get("amount", 0)
+        if isinstance(amount, str):
+            try:
+                amount = float(amount)
+            except (ValueError, TypeError):
+                amount = 0
+        if amount <= threshold and str(invoice.get("status", "")).lower() == "pending":
+            approved.append(invoice)
+    return len(approved), sum(float(i.get("amount", 0)) for i in approved)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--invoices", type=int, default=500_000, help="Invoice records")
+    parser.add_argument("--thresholds", type=int, default=200, help="Thresholds in the sweep")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    print(f"Generating {args.invoices:,} invoices...")
+    data = {"data": _invoice_records(args.invoices)}
+    thresholds = np.linspace(500, 50_000, args.thresholds).tolist()
+    handler = FinanceDataHandler()
+
+    legacy_s, legacy = _timed(lambda: [_legacy_approve(data["data"], t) for t in thresholds])
+    sweep_s, result = _timed(lambda: asyncio.run(
+        handler.auto_approve_invoices(data, threshold=5000, thresholds=thresholds)
+    ))
+    index, _, _ = asyncio.run(handler._pending_invoice_index(data))
+    _, sweep = _timed(lambda: index.sweep(thresholds))
+    query_s, _ = _timed(lambda: index.sweep(thresholds))
+
+    matches = all(
+        count == row["approved_count"] and abs(total - row["total_amount"]) < 1e-6
+        for (count, total), row in zip(legacy, result["sweep"])
+    )
+    print(f"{'implementation':<34} {'seconds':>8}")
+    print(f"{'legacy rescan per threshold':<34} {legacy_s:>8.3f}")
+    print(f"{'index build + sweep':<34} {sweep_s:>8.3f}")
+    print(f"{'sweep on a built index':<34} {query_s:>8.5f}")
+    print(f"{args.thresholds} thresholds over {result['pending_count']:,} pending invoices; results match: {matches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark SalesDataHandler.identify_blocking_tickets on large deal/ticket sets
+
+Compares the previous nested-scan implementation (which only looked at the
+first 10 deals) with the hash join over every open deal.
+
+Usage (from backend/):
+    python -m benchmarks.bench_blocking --deals 100000 --tickets 1000000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.data.dataset import Dataset
+from app.data.sales_data import SalesDataHandler
+
+PRIORITIES = np.array(["Low", "Medium", "High", "Critical"])
+TICKET_STATUSES = np.array(["Open", "In Progress", "Pending", "Resolved"])
+DEAL_STATUSES = np.array(["pending", "won", "lost"])
+
+
+def _records(deals: int, tickets: int, seed: int = 42):
+    """Synthetic deals and tickets sharing a customer id space"""
+    rng = np.random.default_rng(seed)
+    customers = max(deals // 2, 1)
+    deal_customers = rng.integers(0, customers, deals)
+    deal_records = [
+        {
+            "deal_id": f"DEAL-{i}",
+            "customer_id": f"CUST{c}",
+            "customer_name": f"Customer {c}",
+            "amount": float(amount),
+            "status": str(status),
+        }
+        for i, (c, amount, status) in enumerate(zip(
+            deal_customers.tolist(),
+            rng.uniform(1_000, 500_000, deals).round(2).tolist(),
+            DEAL_STATUSES[rng.integers(0, 3, deals)].tolist(),
+        ))
+    ]
+    ticket_customers = rng.integers(0, customers * 4, tickets)
+    ticket_records = [
+        {
+            "ticket_id": f"TICKET-{i}",
+            "customer_id": f"CUST{c}",
+            "customer_name": f"Customer {c:02d}",
+            "priority": priority,
+            "status": status,
+            "age_days": age,
+        }
+        for i, (c, priority, status, age) in enumerate(zip(
+            ticket_customers.tolist(),
+            PRIORITIES[rng.integers(0, 4, tickets)].tolist(),
+            TICKET_STATUSES[rng.integers(0, 4, tickets)].tolist(),
+            rng.integers(0, 60, tickets).tolist(),
+        ))
+    ]
+    return deal_records, ticket_records
+
+
+def _legacy_blocking(sales_records, service_records):
+    """The previous implementation (linear ticket scan for the first 10 deals)"""
+    blocking_tickets = []
+    for deal in sales_records[:10]:
+        customer_id = deal.get("customer_id") or deal.get("customer_name", "")
+        matching_tickets = [
+            t for t in service_records
+            if (t.get("customer_id") == customer_id or
+                t.get("customer_name", "").lower() == str(customer_id).lower())
+            and t.get("status") != "resolved"
+        ]
+        if matching_tickets:
+            blocking_tickets.extend(matching_tickets[:2])
+    return blocking_tickets
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--deals", type=int, default=100_000, help="Deal records")
+    parser.add_argument("--tickets", type=int, default=1_000_000, help="Ticket records")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    print(f"Generating {args.deals:,} deals and {args.tickets:,} tickets...")
+    deals, tickets = _records(args.deals, args.tickets)
+    deal_set = Dataset.from_frame(pd.DataFrame(deals))
+    ticket_set = Dataset.from_frame(pd.DataFrame(tickets))
+    handler = SalesDataHandler()
+
+    legacy_s, legacy = _timed(lambda: _legacy_blocking(deals, tickets))
+    join_s, result = _timed(lambda: asyncio.run(
+        handler.identify_blocking_tickets({"data": deal_set}, {"data": ticket_set})
+    ))
+
+    print(f"{'implementation':<30} {'seconds':>8} {'deals checked':>14} {'blockers':>10}")
+    print(f"{'legacy scan (first 10 deals)':<30} {legacy_s:>8.3f} {min(10, len(deals)):>14,} {len(legacy):>10,}")
+    print(f"{'hash join (all open deals)':<30} {join_s:>8.3f} {len(deals):>14,} {result['total_blocking']:>10,}")
+    print(f"{result['deals_affected']:,} open deals blocked; top blocker "
+          f"{result['blocking_tickets'][0]['ticket_id'] if result['blocking_tickets'] else '-'}")
+
+
+if __name__ == "__main__":
+    main()
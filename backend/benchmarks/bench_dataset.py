@@ -0,0 +1,88 @@
+"""
+Benchmark the columnar Dataset against list-of-dicts records
+
+Loads a synthetic tickets CSV both ways and compares the memory held by
+each representation, plus the cost of handing it to pandas-based analysis
+(DataFrame -> dicts -> DataFrame before, Dataset.to_frame now).
+
+Usage (from backend/):
+    python -m benchmarks.bench_dataset --rows 500000
+"""
+
+import argparse
+import gc
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from app.data.dataset import Dataset
+
+PRIORITIES = np.array(["Low", "Medium", "High", "Critical"])
+STATUSES = np.array(["Open", "In Progress", "Pending", "Resolved"])
+
+
+def _write_tickets_csv(path: str, rows: int, seed: int = 42):
+    """Synthetic tickets_data.csv with the same columns as the mock data"""
+    rng = np.random.default_rng(seed)
+    customers = rng.integers(1, 500, rows)
+    pd.DataFrame({
+        "ticket_id": np.char.add("TICKET-", np.arange(rows).astype(str)),
+        "customer_id": np.char.add("CUST", customers.astype(str)),
+        "customer_name": np.char.add("Customer ", customers.astype(str)),
+        "subject": np.char.add("Issue ", np.arange(rows).astype(str)),
+        "priority": PRIORITIES[rng.integers(0, 4, rows)],
+        "status": STATUSES[rng.integers(0, 4, rows)],
+        "age_days": rng.integers(0, 30, rows),
+        "created_date": "2025-11-01",
+    }).to_csv(path, index=False)
+
+
+def _held_bytes(build):
+    """Bytes still allocated by the object build() returns (source frame freed)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, result
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=500_000, help="Ticket records")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tickets_data.csv")
+        print(f"Writing {args.rows:,} tickets to a temporary CSV...")
+        _write_tickets_csv(path, args.rows)
+
+        records_bytes, records = _held_bytes(lambda: pd.read_csv(path).to_dict(orient="records"))
+        dataset_bytes, dataset = _held_bytes(lambda: Dataset.from_frame(pd.read_csv(path)))
+
+    roundtrip_s, _ = _timed(lambda: pd.DataFrame(records))
+    to_frame_s, _ = _timed(dataset.to_frame)
+    rows_s, _ = _timed(lambda: dataset.rows(range(50)))
+
+    print(f"{'representation':<22} {'MiB held':>10} {'to DataFrame (s)':>17}")
+    print(f"{'list of dicts':<22} {records_bytes / 2**20:>10.1f} {roundtrip_s:>17.3f}")
+    print(f"{'Dataset':<22} {dataset_bytes / 2**20:>10.1f} {to_frame_s:>17.3f}")
+    print(f"memory ratio {records_bytes / dataset_bytes:.1f}x; materializing a 50-row page: {rows_s * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: employee name search via the trigram index vs LIKE scans
+
+Builds a temporary orchestrate.db with a large synthetic employee table and
+sales history, runs setup_database.create_indexes, and times the HR employee
+lookup and the sales-by-employee join with the agents' indexed name filter
+against the original `name LIKE '%...%'` scans. Results are checked to match.
+
+Usage (from backend/):
+    python -m benchmarks.bench_employee_search --employees 200000 --sales 2000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import time
+
+import numpy as np
+
+import agents
+import setup_database
+
+FIRST = ["Alice", "Bob", "Charlie", "Diana", "Evan", "Fatima", "Gustavo", "Hiroshi", "Ingrid", "Jamal"]
+LAST = ["Johnson", "Smith", "Brown", "Prince", "Wright", "Okafor", "Silva", "Tanaka", "Larsen", "Haddad"]
+SEARCHES = ["Tanaka 1234", "Ingrid Larsen 77", "Okafor 4242"]
+
+
+def _build(db_path, employees, sales, seed=42):
+    rng = np.random.default_rng(seed)
+    ids = [f"EMP{i:07d}" for i in range(employees)]
+    first, last = rng.integers(0, len(FIRST), employees), rng.integers(0, len(LAST), employees)
+    names = [f"{FIRST[f]} {LAST[l]} {i}" for i, (f, l) in enumerate(zip(first, last))]
+    sellers = rng.integers(0, employees, sales)
+    with contextlib.closing(sqlite3.connect(db_path)) as conn, contextlib.redirect_stdout(io.StringIO()):
+        setup_database.create_tables(conn)
+        conn.executemany(
+            "INSERT INTO employees VALUES (?, ?, 'Sales Executive', 'Sales', 'Good', 90, 8)", zip(ids, names)
+        )
+        conn.executemany(
+            "INSERT INTO sales VALUES (?, ?, 'North', ?, ?, '2025-01-01')",
+            zip((f"SALE{i:08d}" for i in range(sales)), (ids[i] for i in sellers),
+                rng.uniform(5000, 50000, sales).tolist(), rng.integers(1, 6, sales).tolist()),
+        )
+        conn.commit()
+        setup_database.create_indexes(conn)
+
+
+class ScanAgent(agents.HRAgent, agents.SalesAgent):
+    """The original name filter: LIKE '%...%' over employees"""
+
+    def name_filter(self, alias="employees"):
+        return f"{alias}.name LIKE ?"
+
+
+def _timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--employees", type=int, default=200_000, help="Rows in employees")
+    parser.add_argument("--sales", type=int, default=2_000_000, help="Rows in sales")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per search")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "orchestrate.db")
+        _build(db_path, args.employees, args.sales)
+
+        indexed = type("IndexedAgent", (agents.HRAgent, agents.SalesAgent), {"db_path": db_path})()
+        scan = type("ScanAgent", (ScanAgent,), {"db_path": db_path})()
+
+        print(f"{args.employees:,} employees, {args.sales:,} sales\n")
+        print(f"{'search':<38} {'rows':>5} {'index ms':>9} {'scan ms':>9} {'speedup':>8}")
+        for term in SEARCHES:
+            for method in ("get_employee_details", "get_sales_by_employee"):
+                index_seconds, found = _timed(lambda: getattr(indexed, method)(term), args.repeat)
+                scan_seconds, expected = _timed(lambda: getattr(scan, method)(term), max(1, args.repeat // 10))
+                assert found == expected, (method, term)
+                label = f"{method.split('_', 1)[1]} '{term}'"
+                print(f"{label:<38} {len(found):>5} {index_seconds * 1000:>9.2f} {scan_seconds * 1000:>9.2f} "
+                      f"{scan_seconds / index_seconds:>7.0f}x")
+
+        for pool in agents._pools.values():
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: key index lookups vs full column scans on the tickets dataset
+
+Builds a synthetic tickets table with the service/tickets_data.csv schema
+(hash indexes on ticket_id, customer_id and status, a sorted index on
+age_days) and times point, group and range queries through the indexes
+against the equivalent boolean-mask scans. Results are checked to match.
+
+Usage (from backend/):
+    python -m benchmarks.bench_indexes --rows 1000000 --queries 1000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.data.dataset import Dataset
+from app.orchestrate.skills import DATASET_SCHEMAS
+
+PRIORITIES = np.array(["Low", "Medium", "High", "Critical"])
+STATUSES = np.array(["Open", "In Progress", "Pending", "Resolved"])
+
+
+def _tickets(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    customers = rng.integers(1, 50_000, rows)
+    return pd.DataFrame({
+        "ticket_id": np.char.add("TICKET-", np.arange(rows).astype(str)),
+        "customer_id": np.char.add("CUST", customers.astype(str)),
+        "customer_name": np.char.add("Customer ", customers.astype(str)),
+        "priority": PRIORITIES[rng.integers(0, 4, rows)],
+        "status": STATUSES[rng.integers(0, 4, rows)],
+        "age_days": rng.integers(0, 60, rows),
+    })
+
+
+def _timed(func, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Tickets in the table")
+    parser.add_argument("--queries", type=int, default=1000, help="Indexed lookups timed per query type")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    schema = DATASET_SCHEMAS["service/tickets_data.csv"]
+    frame = schema.apply(_tickets(args.rows))
+    dataset = Dataset.from_frame(frame)
+
+    start = time.perf_counter()
+    schema.index(dataset)
+    # pandas builds a key hash table on the first probe; count it as build time
+    for column in schema.hash_keys:
+        dataset.lookup(column, None)
+    build = time.perf_counter() - start
+    print(f"Indexes on {', '.join(dataset.indexes)} built for {args.rows:,} rows in {build * 1000:.0f} ms\n")
+
+    ticket_ids = frame["ticket_id"].to_numpy()
+    customer_ids = frame["customer_id"].to_numpy(dtype=object)
+    statuses = frame["status"].to_numpy(dtype=object)
+    ages = frame["age_days"].to_numpy()
+    ticket, customer = ticket_ids[args.rows // 2], customer_ids[args.rows // 3]
+
+    queries = [
+        ("ticket_id = point", lambda: dataset.lookup("ticket_id", ticket),
+         lambda: np.flatnonzero(ticket_ids == ticket)),
+        ("customer_id = group", lambda: dataset.lookup("customer_id", customer),
+         lambda: np.flatnonzero(customer_ids == customer)),
+        ("status in (2 values)", lambda: dataset.lookup("status", "Open", "Pending"),
+         lambda: np.flatnonzero((statuses == "Open") | (statuses == "Pending"))),
+        ("age_days > 55 range", lambda: np.sort(dataset.range("age_days", 55, include_low=False)),
+         lambda: np.flatnonzero(ages > 55)),
+    ]
+
+    print(f"{'query':<22} {'rows':>9} {'index ms':>10} {'scan ms':>10} {'speedup':>8}")
+    for label, indexed, scan in queries:
+        index_seconds, found = _timed(indexed, args.queries)
+        scan_seconds, expected = _timed(scan, max(1, args.queries // 100))
+        assert np.array_equal(found, expected), label
+        print(f"{label:<22} {len(found):>9,} {index_seconds * 1000:>10.3f} {scan_seconds * 1000:>10.2f} "
+              f"{scan_seconds / index_seconds:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Memory report for the sector datasets under their load schemas
+
+For every data file with a schema, compares the bytes held as list-of-dicts
+records, as an untyped Dataset and as a Dataset with the schema applied
+(categorical codes, int32/float32, parsed dates). Rows are replicated
+--scale times so the numbers reflect production-sized tables.
+
+Usage (from backend/):
+    python -m benchmarks.bench_memory --scale 10000
+"""
+
+import argparse
+import logging
+import sys
+
+import pandas as pd
+
+from app.data.dataset import Dataset
+from app.orchestrate.skills import DATASET_SCHEMAS, DigitalSkillsManager
+
+
+def _records_nbytes(records):
+    """Dicts plus the distinct value objects they point to"""
+    distinct = {id(value): value for record in records for value in record.values()}
+    return sum(map(sys.getsizeof, records)) + sum(map(sys.getsizeof, distinct.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", type=int, default=10_000, help="Copies of each file's rows")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    data_path = DigitalSkillsManager().data_path
+
+    print(f"{'dataset':<28} {'rows':>9} {'records MiB':>12} {'untyped MiB':>12} {'schema MiB':>11} {'saving':>7}")
+    totals = [0, 0, 0]
+    for name, schema in DATASET_SCHEMAS.items():
+        raw = pd.read_csv(data_path / name)
+        # Id, name and free-text columns keep growing with a real table
+        growing = [
+            column for column in raw.columns
+            if raw[column].dtype.kind not in "iufb" and column not in schema.categories + schema.dates
+        ]
+        raw = pd.concat([raw] * args.scale, ignore_index=True)
+        # Give them distinct values per copy
+        copy_number = (raw.index // (len(raw) // args.scale)).astype(str)
+        for column in growing:
+            raw[column] = raw[column] + "-" + copy_number
+
+        records = _records_nbytes(raw.to_dict(orient="records"))
+        untyped = Dataset.from_frame(raw.copy()).nbytes
+        typed = Dataset.from_frame(schema.apply(raw.copy()), packed=schema.packed).nbytes
+        for i, value in enumerate((records, untyped, typed)):
+            totals[i] += value
+        print(f"{name:<28} {len(raw):>9,} {records / 2**20:>12.1f} {untyped / 2**20:>12.1f} "
+              f"{typed / 2**20:>11.1f} {records / typed:>6.1f}x")
+
+    print(f"{'total':<28} {'':>9} {totals[0] / 2**20:>12.1f} {totals[1] / 2**20:>12.1f} "
+          f"{totals[2] / 2**20:>11.1f} {totals[0] / totals[2]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
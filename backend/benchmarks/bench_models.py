@@ -0,0 +1,118 @@
+"""
+Benchmark validated vs trusted construction of the API schema models
+
+Each model is built from a representative payload with the validating
+constructor and with `trusted()` (no validation), then encoded to JSON via
+model_dump() and via the shallow trusted_dump() path used by the API.
+
+Usage (from backend/):
+    python -m benchmarks.bench_models --iterations 2000 --records 200
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.api.responses import dumps
+from app.models.schemas import (
+    Action,
+    DashboardBatch,
+    DashboardData,
+    DashboardSlice,
+    Insight,
+    QueryResponse,
+    Sector,
+    get_type_adapter,
+)
+
+
+def _time_per_call(func, iterations: int) -> float:
+    """Average wall time of func() in microseconds"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def _payloads(records: int) -> Dict[str, Dict[str, Any]]:
+    """Representative keyword arguments per model (already typed, as built internally)"""
+    rows = [
+        {"invoice_id": f"INV-{i:05d}", "vendor": f"Vendor {i % 20}", "amount": 500 + i, "status": "pending"}
+        for i in range(records)
+    ]
+    analysis = {"approved_count": records, "approved_invoices": rows, "threshold": 5000, "total_amount": 1.0}
+    insight = dict(
+        title="Auto-Approval Summary", description="Approved invoices", sector=Sector.FINANCE,
+        confidence=1.0, data=analysis
+    )
+    action = dict(
+        action_type="approve_invoice", target="invoice: INV-00001",
+        parameters={"invoice_id": "INV-00001", "amount": 500}, status="completed"
+    )
+    dashboard = dict(
+        sector=Sector.SALES,
+        metrics={"total_pipeline_value": 2324636.0, "deals_closed": 7},
+        trends=[{"period": f"2025-Q{q}", "revenue": 1000.0 * q, "deals": q} for q in range(1, 5)],
+        alerts=[{"type": "stale_deal", "severity": "high"}],
+        last_updated=datetime.now()
+    )
+    return {
+        "Insight": insight,
+        "Action": action,
+        "QueryResponse": dict(
+            query="Approve pending invoices", intent="auto_approve_invoices", sectors=[Sector.FINANCE],
+            insights=[Insight.trusted(**insight)], actions=[Action.trusted(**action)] * 20,
+            data=analysis, response_text="Approved", execution_time=0.01
+        ),
+        "DashboardData": dashboard,
+        "DashboardSlice": dict(dashboard),
+        "DashboardBatch": dict(dashboards=[DashboardSlice.trusted(**dashboard)] * 4),
+    }
+
+
+MODELS = {
+    "Insight": Insight,
+    "Action": Action,
+    "QueryResponse": QueryResponse,
+    "DashboardData": DashboardData,
+    "DashboardSlice": DashboardSlice,
+    "DashboardBatch": DashboardBatch,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=2000, help="Constructions per model")
+    parser.add_argument("--records", type=int, default=200, help="Rows in the nested data payloads")
+    args = parser.parse_args()
+
+    payloads = _payloads(args.records)
+    header = (
+        f"{'model':<16} {'validated us':>13} {'trusted us':>11} "
+        f"{'model_dump+json us':>19} {'trusted json us':>16}"
+    )
+    print(f"iterations={args.iterations} records={args.records}")
+    print(header)
+    print("-" * len(header))
+
+    for name, model in MODELS.items():
+        kwargs = payloads[name]
+        validated_us = _time_per_call(lambda: model(**kwargs), args.iterations)
+        trusted_us = _time_per_call(lambda: model.trusted(**kwargs), args.iterations)
+        instance = model.trusted(**kwargs)
+        model_dump_us = _time_per_call(lambda: dumps(instance.model_dump()), args.iterations)
+        trusted_json_us = _time_per_call(lambda: dumps(instance), args.iterations)
+        print(
+            f"{name:<16} {validated_us:>13.1f} {trusted_us:>11.1f} "
+            f"{model_dump_us:>19.1f} {trusted_json_us:>16.1f}"
+        )
+
+    # Adapter construction is the expensive part; the cache makes it a lookup
+    uncached_us = _time_per_call(lambda: get_type_adapter.__wrapped__(List[Insight]), 50)
+    cached_us = _time_per_call(lambda: get_type_adapter(List[Insight]), args.iterations)
+    print(f"\nTypeAdapter(List[Insight]): uncached {uncached_us:.1f} us, cached {cached_us:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Benchmark: async pooled Orchestrator vs the original sync orchestrator
+
+Starts a local stand-in for the IAM and Granite text-generation endpoints
+(fixed latency per generation, keyword routing) and a seeded orchestrate.db
+in a temporary directory, then processes the same user queries with
+(a) the original flow: one blocking HTTP request per call with no session
+reuse, queries strictly one after another, and (b) orchestrator.Orchestrator
+with its pooled async client, concurrent queries and parallel multi-agent
+fan-out. Reports queries per second; every query must end in a summary.
+
+Usage (from backend/):
+    python -m benchmarks.bench_orchestrator --queries 200 --latency 0.05 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+import agents
+import orchestrator
+import setup_database
+
+QUERIES = [
+    "How are our sales doing by region?",
+    "Show me the employee performance ratings.",
+    "What are the current ticket resolution times?",
+    "Are support costs in line with ticket volumes?",
+    "Compare sales revenue with department costs.",
+]
+
+KEYWORDS = {"sales": "SALES", "employee": "HR", "ticket": "SERVICE", "cost": "FINANCE"}
+
+
+def _granite_app(latency):
+    """IAM token and text generation endpoints answering after `latency` seconds."""
+    app = FastAPI()
+
+    @app.post("/identity/token")
+    async def token():
+        return {"access_token": "bench-token"}
+
+    @app.post("/ml/v1/text/generation")
+    async def generate(request: Request):
+        prompt = (await request.json())["input"]
+        await asyncio.sleep(latency)
+        if "Agents:" in prompt:
+            query = re.search(r'User Query: "(.*)"', prompt).group(1).lower()
+            text = ", ".join(route for word, route in KEYWORDS.items() if word in query) or "UNKNOWN"
+        else:
+            text = f"Summary of {prompt.count('Data from')} data source(s)."
+        return {"results": [{"generated_text": text}]}
+
+    return app
+
+
+@contextlib.contextmanager
+def _serve(app):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error", access_log=False))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+class SyncOrchestrator:
+    """
+    The original orchestrator.Orchestrator flow: token fetched up front, a new
+    connection per request (requests.post without a session, no timeout) and
+    one agent per query, processed serially
+    """
+
+    # verify=False: like requests, skip loading the CA bundle for the plain-HTTP
+    # stand-in, so the baseline pays for connections rather than TLS setup
+    def __init__(self, url, agent_registry):
+        self.url = url
+        self.agents = agent_registry
+        self.access_token = httpx.post(f"{url}/identity/token", timeout=None, verify=False).json().get("access_token")
+
+    def _call_granite(self, prompt, max_tokens=200):
+        response = httpx.post(f"{self.url}/ml/v1/text/generation?version=2023-05-29", json={
+            "input": prompt, "parameters": {"max_new_tokens": max_tokens},
+        }, headers={"Authorization": f"Bearer {self.access_token}"}, timeout=None, verify=False)
+        return response.json()["results"][0]["generated_text"].strip()
+
+    def process_query(self, user_query):
+        intent = self._call_granite(f'User Query: "{user_query}"\nAgents:', max_tokens=10).upper()
+        for route, (key, agent_name, method) in orchestrator.AGENT_ROUTES.items():
+            if route in intent:
+                data = getattr(self.agents[key], method)()
+                return self._call_granite(f"Data from {agent_name}: {json.dumps(data)}", max_tokens=300)
+        return "I'm not sure which agent to ask."
+
+
+def _agent_registry(db_path):
+    classes = {"hr": agents.HRAgent, "sales": agents.SalesAgent,
+               "service": agents.CustomerServiceAgent, "finance": agents.FinanceAgent}
+    return {key: type(cls.__name__, (cls,), {"db_path": db_path})() for key, cls in classes.items()}
+
+
+async def _run_async(url, registry, queries, concurrency):
+    async_agents = {key: agents.AsyncAgent(agent) for key, agent in registry.items()}
+    async with orchestrator.Orchestrator(url=url, iam_url=f"{url}/identity/token", agents=async_agents) as orch:
+        start = time.perf_counter()
+        answers = await orch.process_queries(queries, concurrency=concurrency)
+        return time.perf_counter() - start, answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--queries", type=int, default=200, help="User queries processed per implementation")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per Granite generation")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent queries for the async orchestrator")
+    args = parser.parse_args()
+
+    queries = [QUERIES[i % len(QUERIES)] for i in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp, _serve(_granite_app(args.latency)) as url:
+        db_path = os.path.join(tmp, "orchestrate.db")
+        with contextlib.closing(sqlite3.connect(db_path)) as conn, contextlib.redirect_stdout(io.StringIO()):
+            setup_database.create_tables(conn)
+            setup_database.seed_data(conn)
+            setup_database.create_indexes(conn)
+            setup_database.create_summaries(conn)
+        registry = _agent_registry(db_path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync = SyncOrchestrator(url, registry)
+            start = time.perf_counter()
+            sync_answers = [sync.process_query(query) for query in queries]
+            sync_seconds = time.perf_counter() - start
+
+            async_seconds, async_answers = asyncio.run(_run_async(url, registry, queries, args.concurrency))
+
+        for pool in agents._pools.values():
+            pool.close()
+        agents.shutdown_executor()
+
+    assert all(answer.startswith("Summary of") for answer in sync_answers + async_answers), "a query failed"
+    fan_out = sum(answer != "Summary of 1 data source(s)." for answer in async_answers)
+
+    print(f"{args.queries} queries, {args.latency * 1000:.0f} ms per Granite call, "
+          f"{fan_out} routed to several agents\n")
+    print(f"{'orchestrator':<26} {'seconds':>8} {'queries/s':>10}")
+    print(f"{'sync (original)':<26} {sync_seconds:>8.2f} {args.queries / sync_seconds:>10.1f}")
+    print(f"{f'async x{args.concurrency}':<26} {async_seconds:>8.2f} {args.queries / async_seconds:>10.1f}")
+    print(f"\nspeedup {sync_seconds / async_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark QueryResponse serialization and compression per intent
+
+Compares the default FastAPI path (jsonable_encoder + json.dumps) with the
+fast encoder used by the API, and reports payload sizes raw/gzip/brotli.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization --iterations 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import HAS_BROTLI, HAS_ORJSON, compress, dumps
+from app.orchestrate.agent import OrchestrateAgent
+
+# One query per keyword-routed intent
+INTENT_QUERIES = {
+    "analyze_attrition": "Show me attrition trends this quarter",
+    "correlate_satisfaction_sales": "How does employee satisfaction affect sales performance?",
+    "analyze_pipeline": "Analyze the sales pipeline",
+    "identify_blocking_tickets": "Which tickets are blocking deals?",
+    "predict_escalations": "Predict which tickets will escalate",
+    "analyze_complaint_impact": "What is the impact of complaints?",
+    "auto_approve_invoices": "Approve pending invoices under $5000",
+    "analyze_budget_hiring": "Does our budget support hiring plans?",
+    "general_query": "Hello",
+}
+
+
+def _time_per_call(func, iterations: int) -> float:
+    """Average wall time of func() in microseconds"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def _build_responses():
+    agent = OrchestrateAgent()
+    await agent.initialize()
+    responses = {}
+    for intent, query in INTENT_QUERIES.items():
+        responses[intent] = await agent.process_query(query)
+    await agent.shutdown()
+    return responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=500, help="Serializations per intent")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    responses = asyncio.run(_build_responses())
+
+    print(f"orjson={'yes' if HAS_ORJSON else 'no'}  brotli={'yes' if HAS_BROTLI else 'no'}  iterations={args.iterations}")
+    header = f"{'intent':<30} {'default us':>11} {'fast us':>9} {'speedup':>8} {'raw B':>8} {'gzip B':>8} {'br B':>8}"
+    print(header)
+    print("-" * len(header))
+    # "nan" in the default column means the stdlib path cannot encode the payload
+
+    for intent, response in responses.items():
+        try:
+            default_us = _time_per_call(
+                lambda: json.dumps(jsonable_encoder(response)).encode("utf-8"), args.iterations
+            )
+        except ValueError:
+            # e.g. numpy scalars from pandas-backed analyses
+            default_us = float("nan")
+        fast_us = _time_per_call(lambda: dumps(response), args.iterations)
+
+        body = dumps(response)
+        gzip_size = len(compress(body, "gzip"))
+        br_size = len(compress(body, "br")) if HAS_BROTLI else 0
+
+        print(
+            f"{intent + ('' if response.intent == intent else ' (!)'):<30} "
+            f"{default_us:>11.1f} {fast_us:>9.1f} {default_us / fast_us:>7.1f}x "
+            f"{len(body):>8} {gzip_size:>8} {br_size or '-':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: memory vs SQLite storage engine for pushed-down skill queries
+
+Writes a large synthetic tickets file into a temporary data directory and
+runs the same skill queries through DigitalSkillsManager with each storage
+engine: a filtered projection with a limit, a range filter and a grouped
+aggregate. Reports the one-off load/import time, the per-query time and
+the bytes each engine keeps in process memory. Results are checked to match.
+
+Usage (from backend/):
+    python -m benchmarks.bench_storage --rows 1000000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import app.data.watcher as watcher_module
+from app.orchestrate.skills import DigitalSkillsManager, SkillsSettings
+
+PRIORITIES = np.array(["Low", "Medium", "High", "Critical"])
+STATUSES = np.array(["Open", "In Progress", "Pending", "Resolved"])
+
+QUERIES = {
+    "open, limit 100": {"where": {"status": "Open"}, "columns": ["ticket_id", "priority", "age_days"], "limit": 100},
+    "age 55..59": {"range": {"age_days": [55, 59]}, "columns": ["ticket_id", "age_days"]},
+    "count by status": {"group_by": ["status"], "aggregates": {"tickets": ["count", "*"], "avg_age": ["avg", "age_days"]}},
+}
+
+
+def _write_tickets(path: Path, rows: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    customers = rng.integers(1, 50_000, rows)
+    path.parent.mkdir(parents=True)
+    pd.DataFrame({
+        "ticket_id": np.char.add("TICKET-", np.arange(rows).astype(str)),
+        "customer_id": np.char.add("CUST", customers.astype(str)),
+        "customer_name": np.char.add("Customer ", customers.astype(str)),
+        "subject": np.char.add("Issue ", np.arange(rows).astype(str)),
+        "priority": PRIORITIES[rng.integers(0, 4, rows)],
+        "status": STATUSES[rng.integers(0, 4, rows)],
+        "age_days": rng.integers(0, 60, rows),
+        "created_date": "2025-11-01",
+    }).to_csv(path, index=False)
+
+
+async def _run(manager: DigitalSkillsManager, repeat: int):
+    start = time.perf_counter()
+    await manager._load_csv_data("service", "tickets_data.csv", {"limit": 1})
+    load = time.perf_counter() - start
+
+    timings, results = {}, {}
+    for label, query in QUERIES.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = await manager._load_csv_data("service", "tickets_data.csv", query)
+        timings[label] = (time.perf_counter() - start) / repeat
+        results[label] = json.dumps(result["data"].rows(), default=str)
+    held = sum(dataset.nbytes for dataset in manager._datasets.values())
+    return load, timings, results, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Tickets in the data file")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp)
+        _write_tickets(data_path / "service" / "tickets_data.csv", args.rows)
+        watcher_module._watcher = watcher_module.DataWatcher(data_path)
+
+        runs = {}
+        for engine in ("memory", "sqlite"):
+            manager = DigitalSkillsManager(SkillsSettings(storage_engine=engine, sqlite_path=data_path / "skills.db"))
+            runs[engine] = asyncio.run(_run(manager, args.repeat))
+            if manager.store is not None:
+                manager.store.close()
+
+    memory, sqlite = runs["memory"], runs["sqlite"]
+    assert memory[2] == sqlite[2], "engines returned different rows"
+
+    print(f"{args.rows:,} tickets\n")
+    print(f"{'':<20} {'memory':>12} {'sqlite':>12}")
+    print(f"{'load / import s':<20} {memory[0]:>12.2f} {sqlite[0]:>12.2f}")
+    for label in QUERIES:
+        print(f"{label + ' ms':<20} {memory[1][label] * 1000:>12.2f} {sqlite[1][label] * 1000:>12.2f}")
+    print(f"{'held in memory MiB':<20} {memory[3] / 2**20:>12.1f} {sqlite[3] / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: trigger-maintained summary tables vs GROUP BY scans
+
+Builds a temporary orchestrate.db with large sales, tickets and finance
+tables, runs setup_database.create_indexes and create_summaries, and times
+the sales/ticket/finance summary agent queries reading the summary tables
+against the original GROUP BY scans (results are checked to match). Also
+reports the insert cost the triggers add.
+
+Usage (from backend/):
+    python -m benchmarks.bench_summaries --rows 1000000 --repeat 20
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import sqlite3
+import tempfile
+import time
+
+import numpy as np
+
+import agents
+import setup_database
+
+METHODS = ["get_sales_by_region", "get_ticket_stats", "get_department_expenses"]
+
+
+def _rows(rows, offset, seed):
+    rng = np.random.default_rng(seed)
+    ids = range(offset, offset + rows)
+    sales = zip((f"SALE{i:08d}" for i in ids), (f"EMP{i:03d}" for i in rng.integers(0, 500, rows)),
+                np.array(["North", "South", "East", "West"])[rng.integers(0, 4, rows)].tolist(),
+                rng.uniform(5000, 50000, rows).tolist(), rng.integers(1, 6, rows).tolist())
+    tickets = zip((f"TKT{i:08d}" for i in ids), np.array(["Open", "Resolved", "Closed"])[rng.integers(0, 3, rows)].tolist(),
+                  rng.uniform(0.5, 48.0, rows).tolist())
+    finance = zip((f"FIN{i:08d}" for i in ids), np.array(["Sales", "Finance", "HR", "Support"])[rng.integers(0, 4, rows)].tolist(),
+                  rng.uniform(100, 10000, rows).tolist(), rng.uniform(100, 12000, rows).tolist())
+    return sales, tickets, finance
+
+
+def _insert(conn, rows, offset, seed):
+    sales, tickets, finance = _rows(rows, offset, seed)
+    conn.executemany("INSERT INTO sales VALUES (?, ?, ?, ?, ?, '2025-01-01')", sales)
+    conn.executemany("INSERT INTO tickets VALUES (?, 'CUST1', 'EMP003', 'Bug Report', ?, ?, '2025-01-01')", tickets)
+    conn.executemany("INSERT INTO finance VALUES (?, ?, 'Software', ?, ?, '2025-01-01')", finance)
+    conn.commit()
+
+
+class SummaryAgent(agents.SalesAgent, agents.CustomerServiceAgent, agents.FinanceAgent):
+    pass
+
+
+class ScanAgent(SummaryAgent):
+    """Ignores the summary tables: the original GROUP BY queries"""
+
+    def has_table(self, name):
+        return not name.endswith("_summary") and super().has_table(name)
+
+
+def _same(found, expected):
+    return len(found) == len(expected) and all(
+        row.keys() == other.keys()
+        and all(math.isclose(row[k], other[k]) if isinstance(row[k], float) else row[k] == other[k] for k in row)
+        for row, other in zip(found, expected)
+    )
+
+
+def _timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in each of sales, tickets and finance")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per summary query")
+    parser.add_argument("--inserts", type=int, default=50_000, help="Rows per table inserted to time trigger cost")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "orchestrate.db")
+        with contextlib.closing(sqlite3.connect(db_path)) as conn, contextlib.redirect_stdout(io.StringIO()):
+            setup_database.create_tables(conn)
+            _insert(conn, args.rows, 0, 42)
+            setup_database.create_indexes(conn)
+
+            start = time.perf_counter()
+            _insert(conn, args.inserts, args.rows, 7)
+            plain = time.perf_counter() - start
+
+            setup_database.create_summaries(conn)
+            start = time.perf_counter()
+            _insert(conn, args.inserts, args.rows + args.inserts, 8)
+            triggered = time.perf_counter() - start
+
+        summary = type("Summary", (SummaryAgent,), {"db_path": db_path})()
+        scan = type("Scan", (ScanAgent,), {"db_path": db_path})()
+        for method in METHODS:  # open the pool and load the schema before timing
+            getattr(summary, method)()
+
+        print(f"{args.rows + 2 * args.inserts:,} rows per table\n")
+        print(f"{'query':<26} {'summary ms':>11} {'scan ms':>9} {'speedup':>8}")
+        for method in METHODS:
+            summary_seconds, found = _timed(getattr(summary, method), args.repeat)
+            scan_seconds, expected = _timed(getattr(scan, method), max(1, args.repeat // 10))
+            assert _same(found, expected), method
+            print(f"{method:<26} {summary_seconds * 1000:>11.3f} {scan_seconds * 1000:>9.1f} "
+                  f"{scan_seconds / summary_seconds:>7.0f}x")
+        print(f"\ninsert {args.inserts:,} rows x 3 tables: {plain * 1000:.0f} ms plain, "
+              f"{triggered * 1000:.0f} ms with summary triggers")
+
+        for pool in agents._pools.values():
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
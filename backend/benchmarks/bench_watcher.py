@@ -0,0 +1,96 @@
+"""
+Benchmark: incremental refresh of an appended data file vs a full reload
+
+Writes a large tickets CSV into a temporary data directory, loads it through
+the data watcher into a cached Dataset, then appends a nightly batch and
+times (a) the watcher picking up only the appended tail and concatenating
+it onto the cached Dataset and (b) re-reading the whole file.
+
+Usage (from backend/):
+    python -m benchmarks.bench_watcher --rows 1000000 --append 10000
+"""
+
+import argparse
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.data.dataset import Dataset
+from app.data.watcher import DataWatcher
+from app.orchestrate.skills import DATASET_SCHEMAS
+
+DATASET = "service/tickets_data.csv"
+
+
+def _tickets(rows: int, start: int, rng: np.random.Generator) -> pd.DataFrame:
+    created = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D")
+    customers = rng.integers(0, 50_000, rows)
+    return pd.DataFrame({
+        "ticket_id": [f"TICKET-{i:08d}" for i in range(start, start + rows)],
+        "customer_id": [f"CUST{i:06d}" for i in customers],
+        "customer_name": [f"Customer {i}" for i in customers],
+        "subject": [f"Issue {i}" for i in range(start, start + rows)],
+        "priority": rng.choice(["Low", "Medium", "High", "Critical"], rows),
+        "status": rng.choice(["Open", "In Progress", "Resolved", "Closed"], rows),
+        "age_days": rng.integers(0, 60, rows),
+        "created_date": created.strftime("%Y-%m-%d"),
+    })
+
+
+def _parse(content: bytes) -> Dataset:
+    df = pd.read_csv(io.BytesIO(content))
+    return Dataset.from_frame(DATASET_SCHEMAS[DATASET].apply(df), name=DATASET)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the initial file")
+    parser.add_argument("--append", type=int, default=10_000, help="Rows appended afterwards")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp)
+        path = data_path / DATASET
+        path.parent.mkdir(parents=True)
+        _tickets(args.rows, 0, rng).to_csv(path, index=False)
+
+        watcher = DataWatcher(data_path)
+        cache = {}
+
+        def on_change(change):
+            cache[DATASET] = cache[DATASET].concat(_parse(change.chunk))
+
+        start = time.perf_counter()
+        cache[DATASET] = watcher.load(DATASET, _parse)
+        initial = time.perf_counter() - start
+        watcher.subscribe(on_change)
+
+        _tickets(args.append, args.rows, rng).to_csv(path, mode="a", header=False, index=False)
+
+        start = time.perf_counter()
+        watcher.poll([DATASET])
+        incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded = _parse(path.read_bytes())
+        full = time.perf_counter() - start
+
+        assert len(cache[DATASET]) == len(reloaded) == args.rows + args.append
+        assert cache[DATASET].row(len(reloaded) - 1) == reloaded.row(len(reloaded) - 1)
+
+    print(f"initial load      {args.rows:>10,} rows  {initial * 1000:>9.1f} ms")
+    print(f"watcher append    {args.append:>10,} rows  {incremental * 1000:>9.1f} ms")
+    print(f"full reload       {args.rows + args.append:>10,} rows  {full * 1000:>9.1f} ms")
+    print(f"speedup           {full / incremental:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,194 +1,357 @@
 """
 Script to generate mock CSV data for all sectors
+
+Columns are generated with NumPy, one chunk of rows at a time, so the same
+script produces the small demo files (scale 1) and benchmark datasets of
+millions of rows. A given --seed, --scale, --chunk-rows and --as-of always
+produce the same files. Keys stay consistent across sectors: every
+customer_id/customer_name in deals, pipeline and tickets refers to a row of
+sales/customer_data.csv, and every escalation refers to an existing ticket.
+
+Usage:
+    python create_mock_data.py                              # demo data
+    python create_mock_data.py --scale 100000 --output /tmp/data --columnar npz
 """
 
-import pandas as pd
-import os
+import argparse
+import time
+from datetime import date, timedelta
 from pathlib import Path
-from datetime import datetime, timedelta
-import random
-
-# Create data directories
-data_dir = Path("data")
-for sector in ["hr", "sales", "service", "finance"]:
-    (data_dir / sector).mkdir(parents=True, exist_ok=True)
-
-print("📁 Creating mock data files...")
-
-# HR Data
-print("👥 Creating HR data...")
-
-# Employee data
-employees = []
-departments = ["Sales", "Engineering", "Support", "Marketing", "Finance", "HR"]
-for i in range(100):
-    employees.append({
-        "employee_id": f"EMP{i+1:04d}",
-        "name": f"Employee {i+1}",
-        "department": random.choice(departments),
-        "position": f"Position {i % 5 + 1}",
-        "hire_date": (datetime.now() - timedelta(days=random.randint(30, 1000))).strftime("%Y-%m-%d"),
-        "status": random.choice(["Active", "Active", "Active", "Left"]),
-        "salary": random.randint(50000, 150000)
-    })
-pd.DataFrame(employees).to_csv(data_dir / "hr" / "employee_data.csv", index=False)
-
-# Attrition data
-attrition = []
-for dept in departments:
-    for month in range(1, 4):  # Q1-Q3
-        attrition.append({
-            "department": dept,
-            "quarter": f"Q{month}",
-            "employees_left": random.randint(2, 8),
-            "total_employees": random.randint(80, 120),
-            "attrition_rate": round(random.uniform(5.0, 12.0), 1)
-        })
-pd.DataFrame(attrition).to_csv(data_dir / "hr" / "attrition_data.csv", index=False)
-
-# Satisfaction scores
-satisfaction = []
-for dept in departments:
-    for month in range(1, 4):
-        satisfaction.append({
-            "department": dept,
-            "quarter": f"Q{month}",
-            "satisfaction_score": round(random.uniform(6.5, 9.0), 1),
-            "response_count": random.randint(20, 50)
-        })
-pd.DataFrame(satisfaction).to_csv(data_dir / "hr" / "satisfaction_scores.csv", index=False)
-
-# Sales Data
-print("💰 Creating Sales data...")
-
-# Pipeline data
-pipeline = []
-stages = ["Prospecting", "Qualification", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
-for i in range(50):
-    pipeline.append({
-        "deal_id": f"DEAL-{i+1:04d}",
-        "customer_name": f"Customer {i+1}",
-        "value": random.randint(10000, 200000),
-        "stage": random.choice(stages),
-        "probability": random.randint(10, 90),
-        "close_date": (datetime.now() + timedelta(days=random.randint(-30, 90))).strftime("%Y-%m-%d"),
-        "status": random.choice(["active", "stale", "won", "lost"])
-    })
-pd.DataFrame(pipeline).to_csv(data_dir / "sales" / "pipeline_data.csv", index=False)
-
-# Deals data
-deals = []
-for i in range(30):
-    deals.append({
-        "deal_id": f"DEAL-{i+1:04d}",
-        "customer_id": f"CUST{i+1:04d}",
-        "customer_name": f"Customer {i+1}",
-        "amount": random.randint(20000, 150000),
-        "status": random.choice(["won", "lost", "pending"]),
-        "close_date": (datetime.now() - timedelta(days=random.randint(1, 180))).strftime("%Y-%m-%d")
-    })
-pd.DataFrame(deals).to_csv(data_dir / "sales" / "deals_data.csv", index=False)
-
-# Customer data
-customers = []
-for i in range(40):
-    customers.append({
-        "customer_id": f"CUST{i+1:04d}",
-        "customer_name": f"Customer {i+1}",
-        "industry": random.choice(["Tech", "Finance", "Retail", "Healthcare", "Manufacturing"]),
-        "revenue": random.randint(1000000, 10000000),
-        "performance": random.randint(70, 95)
-    })
-pd.DataFrame(customers).to_csv(data_dir / "sales" / "customer_data.csv", index=False)
-
-# Customer Service Data
-print("🎧 Creating Customer Service data...")
-
-# Tickets data
-tickets = []
-priorities = ["Low", "Medium", "High", "Critical"]
-statuses = ["Open", "In Progress", "Resolved", "Pending"]
-for i in range(80):
-    customer_id = f"CUST{random.randint(1, 40):04d}"
-    tickets.append({
-        "ticket_id": f"TICKET-{i+1:04d}",
-        "customer_id": customer_id,
-        "customer_name": f"Customer {customer_id[-2:]}",
-        "subject": f"Issue {i+1}",
-        "priority": random.choice(priorities),
-        "status": random.choice(statuses),
-        "age_days": random.randint(1, 15),
-        "created_date": (datetime.now() - timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
-    })
-pd.DataFrame(tickets).to_csv(data_dir / "service" / "tickets_data.csv", index=False)
-
-# Response times
-response_times = []
-for month in range(1, 4):
-    response_times.append({
-        "month": f"Month {month}",
-        "avg_response_time_hours": round(random.uniform(1.5, 4.0), 1),
-        "tickets_processed": random.randint(200, 300)
-    })
-pd.DataFrame(response_times).to_csv(data_dir / "service" / "response_times.csv", index=False)
-
-# Escalations
-escalations = []
-complaint_types = ["Billing", "Technical", "Product", "Support", "Account"]
-for i in range(25):
-    escalations.append({
-        "escalation_id": f"ESC-{i+1:04d}",
-        "ticket_id": f"TICKET-{random.randint(1, 80):04d}",
-        "type": random.choice(complaint_types),
-        "category": random.choice(["urgent", "high", "medium"]),
-        "financial_impact": random.randint(500, 5000),
-        "cost": random.randint(500, 5000),
-        "status": random.choice(["resolved", "pending", "investigating"])
-    })
-pd.DataFrame(escalations).to_csv(data_dir / "service" / "escalations.csv", index=False)
-
-# Finance Data
-print("💵 Creating Finance data...")
-
-# Invoices data
-invoices = []
-for i in range(60):
-    invoices.append({
-        "invoice_id": f"INV-{i+1:04d}",
-        "vendor": f"Vendor {random.randint(1, 20)}",
-        "amount": random.randint(500, 15000),
-        "status": random.choice(["pending", "approved", "paid", "rejected"]),
-        "due_date": (datetime.now() + timedelta(days=random.randint(-10, 30))).strftime("%Y-%m-%d"),
-        "category": random.choice(["Services", "Equipment", "Software", "Consulting"])
-    })
-pd.DataFrame(invoices).to_csv(data_dir / "finance" / "invoices_data.csv", index=False)
-
-# Budget data
-budget = []
-departments = ["Sales", "Engineering", "Support", "Marketing", "Finance", "HR"]
-for dept in departments:
-    for quarter in ["Q1", "Q2", "Q3"]:
-        budget.append({
-            "department": dept,
-            "quarter": quarter,
-            "allocated": random.randint(200000, 500000),
-            "spent": random.randint(150000, 450000),
-            "utilization": round(random.uniform(70, 95), 1)
-        })
-pd.DataFrame(budget).to_csv(data_dir / "finance" / "budget_data.csv", index=False)
-
-# Cashflow data
-cashflow = []
-for month in range(1, 10):  # 9 months
-    cashflow.append({
-        "month": f"Month {month}",
-        "cash_flow": random.randint(800000, 1500000),
-        "revenue": random.randint(1200000, 2000000),
-        "expenses": random.randint(800000, 1200000),
-        "amount": random.randint(800000, 1500000)
-    })
-pd.DataFrame(cashflow).to_csv(data_dir / "finance" / "cashflow_data.csv", index=False)
-
-print("✅ All mock data files created successfully!")
-print(f"📁 Data directory: {data_dir.absolute()}")
 
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEPARTMENTS = ["Sales", "Engineering", "Support", "Marketing", "Finance", "HR"]
+QUARTERS = ["Q1", "Q2", "Q3"]
+STAGES = ["Prospecting", "Qualification", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
+INDUSTRIES = ["Tech", "Finance", "Retail", "Healthcare", "Manufacturing"]
+PRIORITIES = ["Low", "Medium", "High", "Critical"]
+TICKET_STATUSES = ["Open", "In Progress", "Resolved", "Pending"]
+COMPLAINT_TYPES = ["Billing", "Technical", "Product", "Support", "Account"]
+INVOICE_CATEGORIES = ["Services", "Equipment", "Software", "Consulting"]
+
+# Rows per entity file at scale 1; --scale multiplies these. The department,
+# quarter and month summaries (attrition, budgets, ...) keep their size.
+BASE_ROWS = {
+    "employees": 100,
+    "customers": 40,
+    "pipeline": 50,
+    "deals": 30,
+    "tickets": 80,
+    "escalations": 25,
+    "invoices": 60,
+}
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+class Generator:
+    """Vectorized column helpers over a seeded NumPy generator."""
+
+    def __init__(self, rng: np.random.Generator, as_of: date):
+        self.rng = rng
+        self.as_of = as_of
+
+    def choice(self, values, n, p=None):
+        return np.asarray(values)[self.rng.choice(len(values), n, p=p)]
+
+    def integers(self, low, high, n):
+        """Uniform integers in [low, high] (inclusive, like random.randint)."""
+        return self.rng.integers(low, high + 1, n)
+
+    def uniform(self, low, high, n, decimals=1):
+        return np.round(self.rng.uniform(low, high, n), decimals)
+
+    def dates(self, low, high, n):
+        """as_of + [low, high] days as YYYY-MM-DD, formatted once per distinct day."""
+        days = [(self.as_of + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(low, high + 1)]
+        return np.asarray(days)[self.rng.integers(0, len(days), n)]
+
+
+def _ids(prefix: str, numbers: np.ndarray, total: int) -> np.ndarray:
+    """Zero-padded ids (EMP0001, ...); padding widens with the table size."""
+    width = max(4, len(str(total)))
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+def _names(prefix: str, numbers: np.ndarray) -> np.ndarray:
+    return np.char.add(prefix, numbers.astype(str))
+
+
+def _customers_of_deals(deal_numbers: np.ndarray, customers: int) -> np.ndarray:
+    """Deal i belongs to the same customer in pipeline and deals data."""
+    return (deal_numbers - 1) % customers + 1
+
+
+# --- Entity tables: build(gen, numbers, counts) -> columns for one chunk ---
+
+def employees(gen, numbers, counts):
+    n = len(numbers)
+    return {
+        "employee_id": _ids("EMP", numbers, counts["employees"]),
+        "name": _names("Employee ", numbers),
+        "department": gen.choice(DEPARTMENTS, n),
+        "position": _names("Position ", (numbers - 1) % 5 + 1),
+        "hire_date": gen.dates(-1000, -30, n),
+        "status": gen.choice(["Active", "Left"], n, p=[0.75, 0.25]),
+        "salary": gen.integers(50000, 150000, n),
+    }
+
+
+def customers(gen, numbers, counts):
+    n = len(numbers)
+    return {
+        "customer_id": _ids("CUST", numbers, counts["customers"]),
+        "customer_name": _names("Customer ", numbers),
+        "industry": gen.choice(INDUSTRIES, n),
+        "revenue": gen.integers(1000000, 10000000, n),
+        "performance": gen.integers(70, 95, n),
+    }
+
+
+def pipeline(gen, numbers, counts):
+    n = len(numbers)
+    return {
+        "deal_id": _ids("DEAL-", numbers, counts["pipeline"]),
+        "customer_name": _names("Customer ", _customers_of_deals(numbers, counts["customers"])),
+        "value": gen.integers(10000, 200000, n),
+        "stage": gen.choice(STAGES, n),
+        "probability": gen.integers(10, 90, n),
+        "close_date": gen.dates(-30, 90, n),
+        "status": gen.choice(["active", "stale", "won", "lost"], n),
+    }
+
+
+def deals(gen, numbers, counts):
+    n = len(numbers)
+    customer = _customers_of_deals(numbers, counts["customers"])
+    return {
+        "deal_id": _ids("DEAL-", numbers, counts["pipeline"]),
+        "customer_id": _ids("CUST", customer, counts["customers"]),
+        "customer_name": _names("Customer ", customer),
+        "amount": gen.integers(20000, 150000, n),
+        "status": gen.choice(["won", "lost", "pending"], n),
+        "close_date": gen.dates(-180, -1, n),
+    }
+
+
+def tickets(gen, numbers, counts):
+    n = len(numbers)
+    customer = gen.integers(1, counts["customers"], n)
+    return {
+        "ticket_id": _ids("TICKET-", numbers, counts["tickets"]),
+        "customer_id": _ids("CUST", customer, counts["customers"]),
+        "customer_name": _names("Customer ", customer),
+        "subject": _names("Issue ", numbers),
+        "priority": gen.choice(PRIORITIES, n),
+        "status": gen.choice(TICKET_STATUSES, n),
+        "age_days": gen.integers(1, 15, n),
+        "created_date": gen.dates(-30, -1, n),
+    }
+
+
+def escalations(gen, numbers, counts):
+    n = len(numbers)
+    return {
+        "escalation_id": _ids("ESC-", numbers, counts["escalations"]),
+        "ticket_id": _ids("TICKET-", gen.integers(1, counts["tickets"], n), counts["tickets"]),
+        "type": gen.choice(COMPLAINT_TYPES, n),
+        "category": gen.choice(["urgent", "high", "medium"], n),
+        "financial_impact": gen.integers(500, 5000, n),
+        "cost": gen.integers(500, 5000, n),
+        "status": gen.choice(["resolved", "pending", "investigating"], n),
+    }
+
+
+def invoices(gen, numbers, counts):
+    n = len(numbers)
+    return {
+        "invoice_id": _ids("INV-", numbers, counts["invoices"]),
+        "vendor": _names("Vendor ", gen.integers(1, 20, n)),
+        "amount": gen.integers(500, 15000, n),
+        "status": gen.choice(["pending", "approved", "paid", "rejected"], n),
+        "due_date": gen.dates(-10, 30, n),
+        "category": gen.choice(INVOICE_CATEGORIES, n),
+    }
+
+
+# --- Fixed-size summaries (per department/quarter/month) ---
+
+def attrition(gen):
+    n = len(DEPARTMENTS) * len(QUARTERS)
+    return {
+        "department": np.repeat(DEPARTMENTS, len(QUARTERS)),
+        "quarter": np.tile(QUARTERS, len(DEPARTMENTS)),
+        "employees_left": gen.integers(2, 8, n),
+        "total_employees": gen.integers(80, 120, n),
+        "attrition_rate": gen.uniform(5.0, 12.0, n),
+    }
+
+
+def satisfaction(gen):
+    n = len(DEPARTMENTS) * len(QUARTERS)
+    return {
+        "department": np.repeat(DEPARTMENTS, len(QUARTERS)),
+        "quarter": np.tile(QUARTERS, len(DEPARTMENTS)),
+        "satisfaction_score": gen.uniform(6.5, 9.0, n),
+        "response_count": gen.integers(20, 50, n),
+    }
+
+
+def response_times(gen):
+    return {
+        "month": _names("Month ", np.arange(1, 4)),
+        "avg_response_time_hours": gen.uniform(1.5, 4.0, 3),
+        "tickets_processed": gen.integers(200, 300, 3),
+    }
+
+
+def budget(gen):
+    n = len(DEPARTMENTS) * len(QUARTERS)
+    return {
+        "department": np.repeat(DEPARTMENTS, len(QUARTERS)),
+        "quarter": np.tile(QUARTERS, len(DEPARTMENTS)),
+        "allocated": gen.integers(200000, 500000, n),
+        "spent": gen.integers(150000, 450000, n),
+        "utilization": gen.uniform(70, 95, n),
+    }
+
+
+def cashflow(gen):
+    return {
+        "month": _names("Month ", np.arange(1, 10)),
+        "cash_flow": gen.integers(800000, 1500000, 9),
+        "revenue": gen.integers(1200000, 2000000, 9),
+        "expenses": gen.integers(800000, 1200000, 9),
+        "amount": gen.integers(800000, 1500000, 9),
+    }
+
+
+# (file, entity or None, builder); entity rows scale, the rest are fixed
+FILES = [
+    ("hr/employee_data.csv", "employees", employees),
+    ("hr/attrition_data.csv", None, attrition),
+    ("hr/satisfaction_scores.csv", None, satisfaction),
+    ("sales/pipeline_data.csv", "pipeline", pipeline),
+    ("sales/deals_data.csv", "deals", deals),
+    ("sales/customer_data.csv", "customers", customers),
+    ("service/tickets_data.csv", "tickets", tickets),
+    ("service/response_times.csv", None, response_times),
+    ("service/escalations.csv", "escalations", escalations),
+    ("finance/invoices_data.csv", "invoices", invoices),
+    ("finance/budget_data.csv", None, budget),
+    ("finance/cashflow_data.csv", None, cashflow),
+]
+
+
+def _chunks(build, entity, counts, seed, file_index, as_of, chunk_rows):
+    """Column chunks of one file; every chunk has its own seeded generator."""
+    if entity is None:
+        yield build(Generator(np.random.default_rng([seed, file_index]), as_of))
+        return
+    total = counts[entity]
+    for chunk, start in enumerate(range(0, total, chunk_rows)):
+        gen = Generator(np.random.default_rng([seed, file_index, chunk]), as_of)
+        yield build(gen, np.arange(start + 1, min(start + chunk_rows, total) + 1), counts)
+
+
+class ColumnarWriter:
+    """Writes chunks next to the CSV as Parquet row groups or one .npz per chunk."""
+
+    def __init__(self, csv_path: Path, kind: str):
+        self.kind = kind
+        self.chunk = 0
+        self.parquet = None
+        if kind == "parquet":
+            self.path = csv_path.with_suffix(".parquet")
+        else:
+            self.path = csv_path.with_suffix(".npz.d")
+            self.path.mkdir(exist_ok=True)
+            for old in self.path.glob("part-*.npz"):
+                old.unlink()
+
+    def write(self, columns):
+        if self.kind == "parquet":
+            table = pa.table(columns)
+            if self.parquet is None:
+                self.parquet = pq.ParquetWriter(self.path, table.schema)
+            self.parquet.write_table(table)
+        else:
+            np.savez(self.path / f"part-{self.chunk:05d}.npz", **columns)
+        self.chunk += 1
+
+    def close(self):
+        if self.parquet is not None:
+            self.parquet.close()
+
+
+def _csv_rows(columns) -> str:
+    """
+    CSV text for one chunk. Generated values never contain commas, quotes or
+    newlines, so rows are joined directly (about 3x faster than to_csv).
+    """
+    values = [column.astype(str).tolist() for column in columns.values()]
+    return "\n".join(map(",".join, zip(*values))) + "\n"
+
+
+def write_file(path: Path, chunks, columnar=None):
+    """Stream column chunks to CSV (and a columnar copy); returns rows written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = ColumnarWriter(path, columnar) if columnar else None
+    rows = 0
+    try:
+        with open(path, "w", newline="") as f:
+            for chunk, columns in enumerate(chunks):
+                if chunk == 0:
+                    f.write(",".join(columns) + "\n")
+                f.write(_csv_rows(columns))
+                if writer is not None:
+                    writer.write(columns)
+                rows += len(next(iter(columns.values())))
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate mock CSV data for all sectors.")
+    parser.add_argument("--output", type=Path, default=Path("data"), help="Data directory to write")
+    parser.add_argument("--scale", type=int, default=1, help="Multiply the entity row counts (employees, tickets, ...)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(),
+                        help="Date the generated dates are relative to (YYYY-MM-DD, default today)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows generated and written per chunk")
+    parser.add_argument("--columnar", choices=["parquet", "npz"],
+                        help="Also write each file in a binary columnar format (parquet needs pyarrow)")
+    args = parser.parse_args()
+
+    if args.columnar == "parquet" and not HAS_PYARROW:
+        parser.error("--columnar parquet requires pyarrow (pip install pyarrow), or use --columnar npz")
+
+    counts = {entity: rows * args.scale for entity, rows in BASE_ROWS.items()}
+    print(f"📁 Creating mock data files (scale {args.scale:,}, seed {args.seed})...")
+
+    total_rows, total_seconds = 0, 0.0
+    for file_index, (name, entity, build) in enumerate(FILES):
+        start = time.perf_counter()
+        chunks = _chunks(build, entity, counts, args.seed, file_index, args.as_of, args.chunk_rows)
+        rows = write_file(args.output / name, chunks, args.columnar)
+        seconds = time.perf_counter() - start
+        total_rows += rows
+        total_seconds += seconds
+        print(f"   {name:<30} {rows:>12,} rows {seconds:>8.2f}s")
+
+    print(f"✅ All mock data files created successfully! {total_rows:,} rows in {total_seconds:.2f}s "
+          f"({total_rows / max(total_seconds, 1e-9):,.0f} rows/s)")
+    print(f"📁 Data directory: {args.output.absolute()}")
+
+
+if __name__ == "__main__":
+    main()
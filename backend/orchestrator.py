@@ -1,8 +1,10 @@
 import os
+import re
 import json
-import requests
+import asyncio
+import httpx
 from dotenv import load_dotenv
-from agents import AGENTS
+from agents import ASYNC_AGENTS
 
 # Load environment variables
 load_dotenv()
@@ -11,35 +13,81 @@ API_KEY = os.getenv("WATSONX_AI_API_KEY")
 PROJECT_ID = os.getenv("WATSONX_AI_PROJECT_ID")
 MODEL_ID = os.getenv("WATSONX_AI_MODEL_ID", "ibm/granite-3-8b-instruct")
 URL = os.getenv("WATSONX_AI_URL")
+IAM_URL = "https://iam.cloud.ibm.com/identity/token"
+
+# Seconds allowed per Granite/IAM request, and pooled connections to keep open
+REQUEST_TIMEOUT = float(os.getenv("ORCHESTRATOR_TIMEOUT", "30"))
+MAX_CONNECTIONS = int(os.getenv("ORCHESTRATOR_MAX_CONNECTIONS", "20"))
+
+# User queries processed at once by process_queries()
+MAX_CONCURRENT_QUERIES = int(os.getenv("ORCHESTRATOR_CONCURRENCY", "10"))
+
+# Routing keyword -> (agent key, agent name, data method)
+AGENT_ROUTES = {
+    "HR": ("hr", "HR Agent", "get_employee_details"), # Simplified for demo
+    "SALES": ("sales", "Sales Agent", "get_sales_by_region"),
+    "SERVICE": ("service", "Customer Service Agent", "get_ticket_stats"),
+    "FINANCE": ("finance", "Finance Agent", "get_department_expenses"),
+}
 
 class Orchestrator:
-    def __init__(self):
-        self.access_token = self._get_access_token()
+    """
+    Async orchestrator: Query -> Intent -> Agent(s) -> Data -> Summary
+
+    All Granite and IAM calls share one pooled httpx.AsyncClient (keep-alive
+    connections, per-request timeout), so many user queries can be processed
+    concurrently. A query that spans sectors is routed to several agents,
+    which are queried in parallel.
+
+        async with Orchestrator() as orchestrator:
+            answers = await orchestrator.process_queries(queries)
+    """
+
+    def __init__(self, url=URL, iam_url=IAM_URL, agents=None, timeout=REQUEST_TIMEOUT,
+                 max_connections=MAX_CONNECTIONS, client=None):
+        self.url = url
+        self.iam_url = iam_url
+        self.agents = agents or ASYNC_AGENTS
+        self.client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self.access_token = None
+        self._token_lock = asyncio.Lock()
         print(f"🤖 Orchestrator initialized with model: {MODEL_ID}")
 
-    def _get_access_token(self):
-        """Authenticate with IBM Cloud"""
-        url = "https://iam.cloud.ibm.com/identity/token"
-        try:
-            response = requests.post(url, data={
-                "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
-                "apikey": API_KEY
-            })
-            return response.json().get("access_token")
-        except Exception as e:
-            print(f"Auth Error: {e}")
-            return None
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
-    def _call_granite(self, prompt, max_tokens=200):
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _get_access_token(self, refresh=False):
+        """Authenticate with IBM Cloud (once; concurrent callers share the request)"""
+        async with self._token_lock:
+            if self.access_token and not refresh:
+                return self.access_token
+            try:
+                response = await self.client.post(self.iam_url, data={
+                    "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
+                    "apikey": API_KEY
+                })
+                self.access_token = response.json().get("access_token")
+            except Exception as e:
+                print(f"Auth Error: {e}")
+                self.access_token = None
+            return self.access_token
+
+    async def _call_granite(self, prompt, max_tokens=200):
         """Send prompt to Granite model"""
-        if not self.access_token:
+        token = await self._get_access_token()
+        if not token:
             return "Error: No access token"
 
-        url = f"{URL}/ml/v1/text/generation?version=2023-05-29"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        url = f"{self.url}/ml/v1/text/generation"
         payload = {
             "input": prompt,
             "parameters": {
@@ -50,105 +98,141 @@ class Orchestrator:
             "model_id": MODEL_ID,
             "project_id": PROJECT_ID
         }
-        
+
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            for attempt in range(2):
+                response = await self.client.post(url, params={"version": "2023-05-29"}, json=payload, headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json"
+                })
+                if response.status_code == 401 and attempt == 0:
+                    # Token expired: fetch a new one and retry once
+                    token = await self._get_access_token(refresh=True)
+                    if not token:
+                        return "Error: No access token"
+                    continue
+                break
             if response.status_code == 200:
                 return response.json()["results"][0]["generated_text"].strip()
             else:
                 print(f"Granite Error: {response.text}")
                 return None
+        except httpx.TimeoutException:
+            print(f"Request Error: Granite did not answer within {self.client.timeout.read}s")
+            return None
         except Exception as e:
             print(f"Request Error: {e}")
             return None
 
-    def route_request(self, user_query):
+    async def route_request(self, user_query):
         """
         Step 1: Intent Recognition
-        Ask Granite which agent handles this query.
+        Ask Granite which agent(s) handle this query.
         """
         prompt = f"""
-        You are an intelligent orchestrator. Your job is to route user queries to the correct agent.
-        
+        You are an intelligent orchestrator. Your job is to route user queries to the correct agents.
+
         Available Agents:
         1. HR Agent: Employee data, performance, satisfaction.
         2. Sales Agent: Revenue, deals, regional sales.
         3. Customer Service Agent: Tickets, support issues, resolution times.
         4. Finance Agent: Expenses, budgets, department costs.
-        
+
         User Query: "{user_query}"
-        
-        Which agent should handle this? Reply ONLY with one of these words: HR, SALES, SERVICE, FINANCE.
+
+        Which agents should handle this? Reply ONLY with one or more of these words, comma separated:
+        HR, SALES, SERVICE, FINANCE. Name several only if the query spans those areas.
         If unsure, reply UNKNOWN.
-        
-        Agent:
+
+        Agents:
         """
-        
-        intent = self._call_granite(prompt, max_tokens=10)
+
+        intent = await self._call_granite(prompt, max_tokens=10)
         print(f"🧠 Intent Detected: {intent}")
         return intent
 
-    def process_query(self, user_query):
+    async def _query_agent(self, route):
+        """Data from one agent, or an error entry if it failed (the other agents still answer)"""
+        key, agent_name, method = AGENT_ROUTES[route]
+        try:
+            return agent_name, await getattr(self.agents[key], method)()
+        except asyncio.TimeoutError:
+            error = "timed out"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        print(f"Agent Error in {agent_name}: {error}")
+        return agent_name, {"error": error}
+
+    async def process_query(self, user_query):
         """
-        Main flow: Query -> Intent -> Agent -> Data -> Summary
+        Main flow: Query -> Intent -> Agent(s) -> Data -> Summary
         """
         # 1. Identify Intent
-        intent = self.route_request(user_query)
-        
+        intent = await self.route_request(user_query)
+
         if not intent:
             return "Sorry, I couldn't understand that request."
-            
-        intent = intent.upper()
-        data = None
-        agent_name = ""
-
-        # 2. Route to Agent & Get Data
-        if "HR" in intent:
-            agent_name = "HR Agent"
-            data = AGENTS["hr"].get_employee_details() # Simplified for demo
-        elif "SALES" in intent:
-            agent_name = "Sales Agent"
-            data = AGENTS["sales"].get_sales_by_region()
-        elif "SERVICE" in intent:
-            agent_name = "Customer Service Agent"
-            data = AGENTS["service"].get_ticket_stats()
-        elif "FINANCE" in intent:
-            agent_name = "Finance Agent"
-            data = AGENTS["finance"].get_department_expenses()
-        else:
+
+        # 2. Route to Agent(s) & Get Data (in parallel when the query spans sectors)
+        routes = list(dict.fromkeys(re.findall(r"\b(HR|SALES|SERVICE|FINANCE)\b", intent.upper())))
+        if not routes:
             return "I'm not sure which agent to ask. Please try asking about HR, Sales, Service, or Finance."
 
-        print(f"📊 Data Retrieved from {agent_name}: {json.dumps(data)[:100]}...")
+        results = await asyncio.gather(*(self._query_agent(route) for route in routes))
+        data = {agent_name: rows for agent_name, rows in results}
+
+        print(f"📊 Data Retrieved from {', '.join(data)}: {json.dumps(data)[:100]}...")
 
         # 3. Generate Natural Language Response
+        sources = "\n".join(f"Data from {agent_name}: {json.dumps(rows)}" for agent_name, rows in data.items())
         summary_prompt = f"""
         You are a helpful assistant. Analyze the following data and answer the user's question.
-        
+
         User Question: "{user_query}"
-        Data from {agent_name}: {json.dumps(data)}
-        
-        Provide a clear, professional summary of the answer.
+        {sources}
+
+        Provide a clear, professional summary of the answer. If a source only has
+        an "error", say that its data is currently unavailable.
         """
-        
-        final_answer = self._call_granite(summary_prompt, max_tokens=300)
+
+        final_answer = await self._call_granite(summary_prompt, max_tokens=300)
         return final_answer
 
+    async def process_queries(self, user_queries, concurrency=MAX_CONCURRENT_QUERIES):
+        """Process many user queries concurrently (at most `concurrency` at once), answers in order (an "Error: ..." string for a failed query)"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(user_query):
+            async with semaphore:
+                try:
+                    return await self.process_query(user_query)
+                except Exception as e:
+                    # One failed query must not discard the other answers
+                    print(f"Query Error: {e}")
+                    return f"Error: {e}"
+
+        return await asyncio.gather(*(process(user_query) for user_query in user_queries))
+
 # --- Test the Orchestrator ---
-if __name__ == "__main__":
-    orchestrator = Orchestrator()
-    
+async def main():
     test_queries = [
         "How are our sales doing by region?",
         "Show me the employee performance ratings.",
-        "What are the current ticket resolution times?"
+        "What are the current ticket resolution times?",
+        "Are support costs in line with ticket volumes?"
     ]
-    
+
     print("\n" + "="*50)
     print("🚀 STARTING ORCHESTRATOR TEST")
     print("="*50)
-    
-    for query in test_queries:
+
+    async with Orchestrator() as orchestrator:
+        responses = await orchestrator.process_queries(test_queries)
+
+    for query, response in zip(test_queries, responses):
         print(f"\n👤 User: {query}")
-        response = orchestrator.process_query(query)
         print(f"🤖 Orchestrator: {response}")
         print("-" * 50)
+
+if __name__ == "__main__":
+    asyncio.run(main())
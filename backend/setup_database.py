@@ -1,17 +1,21 @@
 import sqlite3
+import argparse
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from itertools import islice
 import random
 
 # Database file path
 DB_NAME = "orchestrate.db"
 
-def create_connection():
+def create_connection(db_name=DB_NAME):
     """Create a database connection to the SQLite database."""
     conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        print(f"✅ Connected to SQLite database: {DB_NAME}")
+        conn = sqlite3.connect(db_name)
+        print(f"✅ Connected to SQLite database: {db_name}")
     except sqlite3.Error as e:
         print(f"❌ Error connecting to database: {e}")
     return conn
@@ -75,81 +79,297 @@ def create_tables(conn):
     conn.commit()
     print("✅ Tables created successfully.")
 
-def seed_data(conn):
-    """Insert sample data into the tables."""
-    cursor = conn.cursor()
-    
+# Rows per table at scale 1 (the hand-written sample); --scale multiplies these
+BASE_ROWS = {"employees": 5, "sales": 20, "tickets": 30, "finance": 5}
+
+# Rows inserted per transaction while seeding
+SEED_BATCH_SIZE = 250_000
+
+# Generated dates count back from this day so seeded data is reproducible
+SEED_DATE = datetime(2025, 12, 1)
+
+SAMPLE_EMPLOYEES = [
+    ("EMP001", "Alice Johnson", "Sales Manager", "Sales", "Excellent", 98, 9),
+    ("EMP002", "Bob Smith", "Sales Executive", "Sales", "Average", 92, 7),
+    ("EMP003", "Charlie Brown", "Support Agent", "Customer Service", "Good", 95, 8),
+    ("EMP004", "Diana Prince", "Support Lead", "Customer Service", "Excellent", 99, 10),
+    ("EMP005", "Evan Wright", "Financial Analyst", "Finance", "Good", 96, 8),
+]
+
+SAMPLE_FINANCE = [
+    ("FIN001", "Sales", "Travel", 12000.50, 15000.00, "2023-10-01"),
+    ("FIN002", "Sales", "Software", 5000.00, 5000.00, "2023-10-05"),
+    ("FIN003", "Customer Service", "Salaries", 45000.00, 45000.00, "2023-10-01"),
+    ("FIN004", "Finance", "Audit Tools", 8000.00, 10000.00, "2023-10-10"),
+    ("FIN005", "HR", "Recruitment", 3500.00, 5000.00, "2023-10-15"),
+]
+
+# Generated employees: department and role by employee number (see _department)
+DEPARTMENT_ROLES = [
+    ("Sales", ["Sales Executive", "Account Manager", "Sales Manager"]),
+    ("Customer Service", ["Support Agent", "Support Lead"]),
+    ("Finance", ["Financial Analyst", "Accountant"]),
+    ("HR", ["HR Generalist", "Recruiter"]),
+]
+FIRST_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Evan", "Fatima", "Gustavo", "Hiroshi", "Ingrid", "Jamal",
+               "Keiko", "Liam", "Maria", "Noah", "Olga", "Priya", "Quentin", "Rosa", "Samir", "Tara"]
+LAST_NAMES = ["Johnson", "Smith", "Brown", "Prince", "Wright", "Okafor", "Silva", "Tanaka", "Larsen", "Haddad",
+              "Kowalski", "Nguyen", "Garcia", "Müller", "Rossi", "Patel", "Dubois", "Cohen", "Ivanova", "Kim"]
+RATINGS = ["Excellent", "Good", "Average", "Poor"]
+REGIONS = ["North", "South", "East", "West"]
+ISSUES = ["Login Issue", "Billing Error", "Feature Request", "Bug Report"]
+TICKET_STATUSES = ["Open", "Resolved", "Closed"]
+EXPENSE_CATEGORIES = ["Salaries", "Software", "Travel", "Marketing"]
+
+def _department(number):
+    """Department index of employee EMP<number> (the sample employees are fixed)."""
+    if number <= len(SAMPLE_EMPLOYEES):
+        return [d for d, _ in DEPARTMENT_ROLES].index(SAMPLE_EMPLOYEES[number - 1][3])
+    return number % len(DEPARTMENT_ROLES)
+
+def _staff(employees, department):
+    """Employee ids in a department, for assigning sales reps and ticket agents."""
+    width = _id_width(employees)
+    return [f"EMP{n:0{width}d}" if n > len(SAMPLE_EMPLOYEES) else SAMPLE_EMPLOYEES[n - 1][0]
+            for n in range(1, employees + 1) if _department(n) == department]
+
+def _dates(days, fmt="%Y-%m-%d"):
+    """The last `days` + 1 days up to SEED_DATE, formatted once."""
+    return [(SEED_DATE - timedelta(days=d)).strftime(fmt) for d in range(days + 1)]
+
+# The generators below draw with rng.random() and precomputed choices; they
+# stream millions of rows, so per-row randint()/strftime() calls add up.
+
+def _id_width(count):
+    """Zero-pad generated ids so they sort, and fill the primary key index, in insert order."""
+    return max(3, len(str(count)))
+
+def _employees(rng, count):
+    yield from SAMPLE_EMPLOYEES[:count]
+    random_, width = rng.random, _id_width(count)
+    for n in range(len(SAMPLE_EMPLOYEES) + 1, count + 1):
+        department, roles = DEPARTMENT_ROLES[_department(n)]
+        yield (
+            f"EMP{n:0{width}d}",
+            f"{FIRST_NAMES[int(random_() * len(FIRST_NAMES))]} {LAST_NAMES[int(random_() * len(LAST_NAMES))]}",
+            roles[int(random_() * len(roles))],
+            department,
+            RATINGS[int(random_() * len(RATINGS))],
+            70 + int(random_() * 31), # Attendance score 70-100
+            1 + int(random_() * 10), # Satisfaction score 1-10
+        )
+
+def _sales(rng, count, reps):
+    random_, dates, width = rng.random, _dates(30), _id_width(count)
+    for i in range(1, count + 1):
+        yield (
+            f"SALE{i:0{width}d}",
+            reps[int(random_() * len(reps))], # Only sales employees
+            REGIONS[int(random_() * len(REGIONS))],
+            5000 + random_() * 45000, # Revenue
+            1 + int(random_() * 5), # Deals closed
+            dates[int(random_() * len(dates))]
+        )
+
+def _tickets(rng, count, agents, customers):
+    random_, days, width = rng.random, _dates(10), _id_width(count)
+    for i in range(1, count + 1):
+        second = int(random_() * 86400)
+        yield (
+            f"TKT{i:0{width}d}",
+            f"CUST{100 + int(random_() * customers)}",
+            agents[int(random_() * len(agents))], # Support agents
+            ISSUES[int(random_() * len(ISSUES))],
+            TICKET_STATUSES[int(random_() * len(TICKET_STATUSES))],
+            0.5 + random_() * 47.5, # Resolution time hours
+            f"{days[int(random_() * len(days))]} {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+        )
+
+def _finance(rng, count):
+    yield from SAMPLE_FINANCE[:count]
+    random_, dates, width = rng.random, _dates(365), _id_width(count)
+    for i in range(len(SAMPLE_FINANCE) + 1, count + 1):
+        budget = round(1000 + random_() * 49000, 2)
+        yield (
+            f"FIN{i:0{width}d}",
+            DEPARTMENT_ROLES[int(random_() * len(DEPARTMENT_ROLES))][0],
+            EXPENSE_CATEGORIES[int(random_() * len(EXPENSE_CATEGORIES))],
+            round(budget * (0.5 + random_() * 0.6), 2), # Expense amount
+            budget,
+            dates[int(random_() * len(dates))]
+        )
+
+@contextmanager
+def bulk_load(conn):
+    """Bulk-insert pragmas for seeding; restores WAL and normal syncing after."""
+    conn.commit()
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA cache_size=-262144") # 256 MiB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+def _insert_rows(conn, table, rows, batch_size=SEED_BATCH_SIZE):
+    """Stream rows into a table in large transactions; returns (rows, seconds)."""
+    start = time.perf_counter()
+    total = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        placeholders = ", ".join("?" * len(batch[0]))
+        conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", batch)
+        conn.commit()
+        total += len(batch)
+    return total, time.perf_counter() - start
+
+def seed_data(conn, scale=1, seed=42):
+    """
+    Insert seeded sample data into the tables.
+
+    scale multiplies BASE_ROWS (scale 1 is the small hand-written sample);
+    the same scale and seed always produce the same rows. Create indexes and
+    summaries after seeding so they are built once over the loaded data.
+    """
+    counts = {table: rows * scale for table, rows in BASE_ROWS.items()}
+    sales_department = [d for d, _ in DEPARTMENT_ROLES].index("Sales")
+    service_department = [d for d, _ in DEPARTMENT_ROLES].index("Customer Service")
+
     # Clear existing data to avoid duplicates on re-run
-    cursor.execute("DELETE FROM employees")
-    cursor.execute("DELETE FROM sales")
-    cursor.execute("DELETE FROM tickets")
-    cursor.execute("DELETE FROM finance")
-    
+    for table in counts:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+
     print("🧹 Cleared existing data.")
 
-    # --- 1. Seed Employees (HR) ---
-    employees = [
-        ("EMP001", "Alice Johnson", "Sales Manager", "Sales", "Excellent", 98, 9),
-        ("EMP002", "Bob Smith", "Sales Executive", "Sales", "Average", 92, 7),
-        ("EMP003", "Charlie Brown", "Support Agent", "Customer Service", "Good", 95, 8),
-        ("EMP004", "Diana Prince", "Support Lead", "Customer Service", "Excellent", 99, 10),
-        ("EMP005", "Evan Wright", "Financial Analyst", "Finance", "Good", 96, 8),
-    ]
-    cursor.executemany("INSERT INTO employees VALUES (?, ?, ?, ?, ?, ?, ?)", employees)
-    
-    # --- 2. Seed Sales (Sales) ---
-    sales_data = []
-    regions = ["North", "South", "East", "West"]
-    for i in range(1, 21):
-        sales_data.append((
-            f"SALE{i:03d}",
-            random.choice(["EMP001", "EMP002"]), # Only sales employees
-            random.choice(regions),
-            random.uniform(5000, 50000), # Revenue
-            random.randint(1, 5), # Deals closed
-            (datetime.now() - timedelta(days=random.randint(0, 30))).strftime("%Y-%m-%d")
-        ))
-    cursor.executemany("INSERT INTO sales VALUES (?, ?, ?, ?, ?, ?)", sales_data)
-
-    # --- 3. Seed Tickets (Customer Service) ---
-    tickets_data = []
-    issues = ["Login Issue", "Billing Error", "Feature Request", "Bug Report"]
-    statuses = ["Open", "Resolved", "Closed"]
-    for i in range(1, 31):
-        tickets_data.append((
-            f"TKT{i:03d}",
-            f"CUST{random.randint(100, 999)}",
-            random.choice(["EMP003", "EMP004"]), # Support agents
-            random.choice(issues),
-            random.choice(statuses),
-            random.uniform(0.5, 48.0), # Resolution time hours
-            (datetime.now() - timedelta(days=random.randint(0, 10))).strftime("%Y-%m-%d %H:%M:%S")
-        ))
-    cursor.executemany("INSERT INTO tickets VALUES (?, ?, ?, ?, ?, ?, ?)", tickets_data)
-
-    # --- 4. Seed Finance (Finance) ---
-    finance_data = [
-        ("FIN001", "Sales", "Travel", 12000.50, 15000.00, "2023-10-01"),
-        ("FIN002", "Sales", "Software", 5000.00, 5000.00, "2023-10-05"),
-        ("FIN003", "Customer Service", "Salaries", 45000.00, 45000.00, "2023-10-01"),
-        ("FIN004", "Finance", "Audit Tools", 8000.00, 10000.00, "2023-10-10"),
-        ("FIN005", "HR", "Recruitment", 3500.00, 5000.00, "2023-10-15"),
-    ]
-    cursor.executemany("INSERT INTO finance VALUES (?, ?, ?, ?, ?, ?)", finance_data)
+    tables = {
+        "employees": _employees(random.Random(f"{seed}-employees"), counts["employees"]),
+        "sales": _sales(random.Random(f"{seed}-sales"), counts["sales"], _staff(counts["employees"], sales_department)),
+        "tickets": _tickets(random.Random(f"{seed}-tickets"), counts["tickets"],
+                            _staff(counts["employees"], service_department), 900 * scale),
+        "finance": _finance(random.Random(f"{seed}-finance"), counts["finance"]),
+    }
+
+    total_rows, total_seconds = 0, 0.0
+    with bulk_load(conn):
+        for table, rows in tables.items():
+            inserted, seconds = _insert_rows(conn, table, rows)
+            total_rows += inserted
+            total_seconds += seconds
+            print(f"   {table:<10} {inserted:>12,} rows {seconds:>8.2f}s {inserted / max(seconds, 1e-9):>12,.0f} rows/s")
+
+    print(f"✅ Seeded {total_rows:,} rows in {total_seconds:.2f}s ({total_rows / max(total_seconds, 1e-9):,.0f} rows/s).")
+
+def create_indexes(conn):
+    """Create the lookup indexes and the employee name search index."""
+    cursor = conn.cursor()
+
+    # Covering indexes: the agents' joins/filters/group-bys read only the index
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sales_employee_id ON sales (employee_id, revenue, deals_closed)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets (status, resolution_time_hours)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_finance_department ON finance (department, expense_amount, budget_limit)")
+
+    # Trigram full-text index over employee names: serves name LIKE '%...%'
+    # substring searches without scanning employees (needs SQLite 3.34+)
+    try:
+        cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts
+        USING fts5(name, content='employees', content_rowid='rowid', tokenize='trigram');
+        """)
+    except sqlite3.Error as e:
+        print(f"⚠️ Name search index unavailable ({e}); agents will scan employees.")
+    else:
+        # Keep the search index in step with the employees table
+        cursor.executescript("""
+        CREATE TRIGGER IF NOT EXISTS employees_fts_insert AFTER INSERT ON employees BEGIN
+            INSERT INTO employees_fts (rowid, name) VALUES (new.rowid, new.name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS employees_fts_delete AFTER DELETE ON employees BEGIN
+            INSERT INTO employees_fts (employees_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS employees_fts_update AFTER UPDATE OF name ON employees BEGIN
+            INSERT INTO employees_fts (employees_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+            INSERT INTO employees_fts (rowid, name) VALUES (new.rowid, new.name);
+        END;
+        """)
+        cursor.execute("INSERT INTO employees_fts (employees_fts) VALUES ('rebuild')")
 
+    cursor.execute("ANALYZE")
     conn.commit()
-    print("✅ Sample data seeded successfully.")
+    print("✅ Indexes created successfully.")
+
+# Trigger-maintained summary tables: name -> (source table, group key, measures)
+SUMMARIES = {
+    "sales_region_summary": ("sales", "region", ["revenue", "deals_closed"]),
+    "ticket_status_summary": ("tickets", "status", ["resolution_time_hours"]),
+    "finance_department_summary": ("finance", "department", ["expense_amount", "budget_limit"]),
+}
+
+def _summary_sql(summary, source, key, measures):
+    """DDL for one summary table and the triggers that keep it current."""
+    columns = ", ".join(f"{m}_sum REAL NOT NULL DEFAULT 0, {m}_count INTEGER NOT NULL DEFAULT 0" for m in measures)
+
+    def add(row):
+        sets = ", ".join(f"{m}_sum = {m}_sum + ifnull({row}.{m}, 0), {m}_count = {m}_count + ({row}.{m} IS NOT NULL)" for m in measures)
+        return f"""
+            INSERT INTO {summary} ({key}) SELECT {row}.{key}
+            WHERE NOT EXISTS (SELECT 1 FROM {summary} WHERE {key} IS {row}.{key});
+            UPDATE {summary} SET row_count = row_count + 1, {sets} WHERE {key} IS {row}.{key};"""
+
+    def remove(row):
+        sets = ", ".join(f"{m}_sum = {m}_sum - ifnull({row}.{m}, 0), {m}_count = {m}_count - ({row}.{m} IS NOT NULL)" for m in measures)
+        return f"""
+            UPDATE {summary} SET row_count = row_count - 1, {sets} WHERE {key} IS {row}.{key};
+            DELETE FROM {summary} WHERE {key} IS {row}.{key} AND row_count = 0;"""
+
+    return f"""
+    CREATE TABLE IF NOT EXISTS {summary} ({key} TEXT PRIMARY KEY, row_count INTEGER NOT NULL DEFAULT 0, {columns});
+    CREATE TRIGGER IF NOT EXISTS {summary}_insert AFTER INSERT ON {source} BEGIN {add("new")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS {summary}_delete AFTER DELETE ON {source} BEGIN {remove("old")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS {summary}_update AFTER UPDATE OF {key}, {", ".join(measures)} ON {source} BEGIN {remove("old")} {add("new")}
+    END;
+    """
+
+def create_summaries(conn):
+    """Create the agents' summary tables, backfill them and keep them current with triggers."""
+    cursor = conn.cursor()
+    for summary, (source, key, measures) in SUMMARIES.items():
+        cursor.executescript(_summary_sql(summary, source, key, measures))
+        aggregates = ", ".join(f"ifnull(SUM({m}), 0), COUNT({m})" for m in measures)
+        cursor.execute(f"DELETE FROM {summary}")
+        cursor.execute(f"INSERT INTO {summary} SELECT {key}, COUNT(*), {aggregates} FROM {source} GROUP BY {key}")
+    conn.commit()
+    print("✅ Summary tables created successfully.")
 
 def main():
-    if os.path.exists(DB_NAME):
-        os.remove(DB_NAME) # Reset DB for clean state
-        
-    conn = create_connection()
+    parser = argparse.ArgumentParser(description="Create and seed the agents' SQLite database.")
+    parser.add_argument("--db", default=DB_NAME, help="Database file (replaced if it exists)")
+    parser.add_argument("--scale", type=int, default=1, help="Multiply the sample row counts, e.g. 100000 for ~6M rows")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for generated rows")
+    args = parser.parse_args()
+
+    for path in (args.db, f"{args.db}-wal", f"{args.db}-shm"):
+        if os.path.exists(path):
+            os.remove(path) # Reset DB for clean state
+
+    conn = create_connection(args.db)
     if conn:
         create_tables(conn)
-        seed_data(conn)
+        seed_data(conn, scale=args.scale, seed=args.seed)
+        # Built after the load so each index is created once, in bulk
+        start = time.perf_counter()
+        create_indexes(conn)
+        create_summaries(conn)
+        print(f"   indexes and summaries built in {time.perf_counter() - start:.2f}s")
         conn.close()
-        print("\n🚀 Database setup complete! 'orchestrate.db' is ready.")
+        print(f"\n🚀 Database setup complete! '{args.db}' is ready.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,37 @@
+"""
+Tests for the HR data handler
+"""
+
+import asyncio
+
+import app.data.hr_data as hr_data
+from app.data.aggregates import AggregationEngine
+from app.data.watcher import DataWatcher
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_metrics_use_latest_quarter_when_rows_are_out_of_order(tmp_path, monkeypatch):
+    _write(tmp_path / hr_data.EMPLOYEES, "employee_id,status\nE1,Active\nE2,Active\nE3,Left\n")
+    _write(
+        tmp_path / hr_data.ATTRITION,
+        "department,quarter,employees_left,total_employees\n"
+        "Sales,Q3,5,100\nSales,Q1,20,100\nSales,Q2,10,100\n"
+    )
+    _write(
+        tmp_path / hr_data.SATISFACTION,
+        "department,quarter,satisfaction_score,response_count\n"
+        "Sales,Q3,8.0,10\nSales,Q1,5.0,10\nSales,Q2,6.0,10\n"
+    )
+    engine = AggregationEngine(DataWatcher(tmp_path))
+    monkeypatch.setattr(hr_data, "get_aggregation_engine", lambda: engine)
+
+    metrics = asyncio.run(hr_data.HRDataHandler().get_metrics())
+
+    assert metrics["attrition_period"] == "Q3"
+    assert metrics["attrition_rate"] == 5.0
+    assert metrics["satisfaction_score"] == 8.0
+    assert metrics["total_employees"] == 2
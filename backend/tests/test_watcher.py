@@ -0,0 +1,58 @@
+"""
+Tests for the data file watcher
+"""
+
+from app.data.watcher import DataWatcher, FileChange
+
+DATASET = "sales/deals_data.csv"
+
+
+def _write(path, text, mode="w"):
+    with open(path, mode, newline="") as f:
+        f.write(text)
+
+
+def _rows(watcher):
+    return watcher.load(DATASET, lambda content: FileChange(DATASET, True, content).records)
+
+
+def test_load_reads_last_row_without_trailing_newline(tmp_path):
+    path = tmp_path / DATASET
+    path.parent.mkdir()
+    _write(path, "deal_id,value\n" + "\n".join(f"D{i},{i}" for i in range(60)))
+
+    rows = _rows(DataWatcher(tmp_path))
+
+    assert len(rows) == 60
+    assert rows[-1] == {"deal_id": "D59", "value": "59"}
+
+
+def test_rewrite_reads_last_row_without_trailing_newline(tmp_path):
+    path = tmp_path / DATASET
+    path.parent.mkdir()
+    _write(path, "deal_id,value\nD0,0\nD1,1\n")
+    watcher = DataWatcher(tmp_path)
+    watcher.poll([DATASET])
+
+    _write(path, "deal_id,value\nD5,5")
+    [change] = watcher.poll([DATASET])
+
+    assert change.rewritten
+    assert change.records == [{"deal_id": "D5", "value": "5"}]
+
+
+def test_append_holds_back_partial_row(tmp_path):
+    path = tmp_path / DATASET
+    path.parent.mkdir()
+    _write(path, "deal_id,value\nD0,0\n")
+    watcher = DataWatcher(tmp_path)
+    watcher.poll([DATASET])
+
+    _write(path, "D1,1\nD2,", mode="a")
+    [change] = watcher.poll([DATASET])
+    assert not change.rewritten
+    assert change.records == [{"deal_id": "D1", "value": "1"}]
+
+    _write(path, "2\n", mode="a")
+    [change] = watcher.poll([DATASET])
+    assert change.records == [{"deal_id": "D2", "value": "2"}]
@@ -26,13 +26,19 @@ const Dashboard = () => {
       const sectorsList = ['hr', 'sales', 'service', 'finance'];
       const data = {};
 
+      try {
+        // One round trip for every sector card
+        const response = await apiService.getDashboardBatch(sectorsList);
+        for (const dashboard of response.data.dashboards || []) {
+          data[dashboard.sector] = dashboard;
+        }
+      } catch (error) {
+        console.error('Error loading dashboard batch:', error);
+      }
+
       for (const sector of sectorsList) {
-        try {
-          const response = await apiService.getDashboardData(sector);
-          data[sector] = response.data;
-        } catch (error) {
-          console.error(`Error loading ${sector} data:`, error);
-          // Set empty data or error state if API fails
+        if (!data[sector]) {
+          // Set error state for sectors missing from the batch
           data[sector] = { error: true, message: "Failed to load data" };
         }
       }
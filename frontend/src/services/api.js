@@ -48,6 +48,15 @@ export const apiService = {
     return Promise.resolve({ data: {} });
   },
 
+  // Get dashboard data for several sectors in one request
+  // fields: optional subset of ['metrics', 'trends', 'alerts']
+  getDashboardBatch: async (sectors = [], fields = []) => {
+    const params = {};
+    if (sectors.length) params.sectors = sectors.join(',');
+    if (fields.length) params.fields = fields.join(',');
+    return api.get('/dashboard', { params });
+  },
+
   // Get list of sectors
   getSectors: async () => {
     return Promise.resolve({ data: ["HR", "Sales", "Customer Service", "Finance"] });